@@ -4,20 +4,33 @@ These functions are used across all lectures for comparison and testing.
 """
 
 import random as rd
+import time
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from statistics import NormalDist
+from typing import Callable, Iterable
 
+import numpy as np
 
-def sample_game(number_of_players: int, available_numbers: int, number_instances: int) -> list[list[int]]:
+# Number of games generated per batch by the sample_distribution* estimators
+DEFAULT_BATCH_SIZE = 10_000
+
+
+def sample_game(number_of_players: int, available_numbers: int, number_instances: int,
+                rng: rd.Random | None = None) -> list[list[int]]:
     """
     Simulate one game of bombbusters.
     
     Returns a list of players. Each player has a sorted list of numbers representing their cables.
+    Pass rng (a random.Random) to deal reproducibly without touching the global random state.
     """
+    rng = rd if rng is None else rng
     # Generate cables
     cables: list[int] = []
     for n in range(available_numbers):
         for _ in range(number_instances):
             cables.append(n+1)
-    rd.shuffle(cables)
+    rng.shuffle(cables)
 
     # Distribute cables to players
     players: list[list[int]] = [[] for _ in range(number_of_players)]
@@ -27,7 +40,7 @@ def sample_game(number_of_players: int, available_numbers: int, number_instances
         count = min_cables_per_player + 1 if p < extra_cables else min_cables_per_player
         for _ in range(count):
             players[p].append(cables.pop())
-    rd.shuffle(players)
+    rng.shuffle(players)
 
     # Sort cables
     for p in range(number_of_players):
@@ -40,33 +53,39 @@ def sample_game(number_of_players: int, available_numbers: int, number_instances
     return players
 
 
-def sample_distribution(number_of_players: int, available_numbers: int, number_instances: int, num_samples: int = 100) -> list[list[float]]:
+def sample_distribution(number_of_players: int, available_numbers: int, number_instances: int,
+                        num_samples: int = 100, seed: int | None = None,
+                        workers: int = 1, games: Iterable[np.ndarray] | None = None) -> list[list[float]]:
     """
     Estimate probability distribution using Monte Carlo sampling.
     
     Returns the distribution of numbers after averaging over num_samples games.
     The distribution is a list of numbers, while each number is a list of probabilities at which position it is.
+    Player 0's hands are drawn in batches as count histograms (sample_hand_histograms) and
+    streamed into a DistributionAccumulator,
+    so memory does not grow with num_samples; pass seed to make the estimate reproducible.
+    With workers > 1 the batches are spread over a process pool; the result for a given seed
+    does not depend on the number of workers.
+    Pass games, chunks of whole-game histograms (K, P, N) such as GameCorpus.chunks(), to
+    estimate from player 0 of those games instead of sampling (num_samples, seed and workers
+    are then ignored).
     """
-    samples: list[list[list[int]]] = []
-    for _ in range(num_samples):
-        samples.append(sample_game(number_of_players, available_numbers, number_instances))
     min_cables_per_player: int = int((available_numbers * number_instances) / number_of_players)
-    numbers: list[list[float]] = []
-    for number in range(available_numbers):
-        probs: list[float] = []
-        for position in range(min_cables_per_player):
-            count = 0
-            for sample in samples:
-                if sample[0][position] == number + 1:
-                    count += 1
-            probs.append(count / num_samples)
-        numbers.append(probs)
-    return numbers
+    if games is not None:
+        accumulator = _count_games(games, available_numbers, min_cables_per_player, lambda chunk: chunk[:, 0])
+        return accumulator.distribution()
+    # Hands are exchangeable: player 0's hand is a random hand of a random seat's size
+    draw = partial(sample_hand_histograms, [number_instances] * available_numbers,
+                   _seat_sizes(available_numbers * number_instances, number_of_players))
+    accumulator = _estimate(draw, available_numbers, min_cables_per_player, num_samples, seed, workers)
+    return accumulator.distribution()
 
 
 def sample_distribution_given_cables(number_of_players: int, available_numbers: int, 
                                      number_instances: int, cables: int, 
-                                     num_samples: int = 1000) -> list[list[float]]:
+                                     num_samples: int = 1000, seed: int | None = None,
+                                     workers: int = 1,
+                                     games: Iterable[np.ndarray] | None = None) -> list[list[float]]:
     """
     Estimate probability distribution using Monte Carlo sampling, conditioned on player 0 having exactly 'cables' cables.
     
@@ -78,42 +97,134 @@ def sample_distribution_given_cables(number_of_players: int, available_numbers:
         available_numbers: Number of different numbers
         number_instances: Number of instances of each number
         cables: Exact number of cables player 0 must have
-        num_samples: Target number of valid samples (may need more games to get this many valid samples)
+        num_samples: Number of games to sample (every game satisfies the condition)
+        seed: Optional seed for reproducible estimates
+        workers: Number of worker processes sharing the batches
+        games: Optional chunks of whole-game histograms (K, P, N) to estimate from instead of
+               sampling; only the games where player 0 holds 'cables' cables are counted
     
     Returns:
         Distribution matrix: result[i][j] = P(number i+1 at position j | player 0 has exactly 'cables' cables)
     """
-    samples: list[list[list[int]]] = []
-    attempts = 0
-    max_attempts = num_samples * 10  # Prevent infinite loops
+    if not _is_seat_size(available_numbers * number_instances, number_of_players, cables):
+        # No player can hold this many cables, return zeros
+        return [[0.0] * cables for _ in range(available_numbers)]
+    if games is not None:
+        def select(chunk):
+            hands = chunk[:, 0]
+            return hands[hands.sum(axis=1, dtype=np.int64) == cables]
+        return _count_games(games, available_numbers, cables, select).distribution()
     
-    # Collect samples where player 0 has exactly 'cables' cables
-    while len(samples) < num_samples and attempts < max_attempts:
-        attempts += 1
-        game = sample_game(number_of_players, available_numbers, number_instances)
-        if len(game[0]) == cables:
-            samples.append(game)
+    draw = partial(sample_hand_histograms, [number_instances] * available_numbers, [cables])
+    accumulator = _estimate(draw, available_numbers, cables, num_samples, seed, workers)
+    return accumulator.distribution()
+
+
+def sample_game_histograms(number_of_players: int, available_numbers: int, number_instances: int,
+                           num_games: int, rng: np.random.Generator | None = None) -> np.ndarray:
+    """
+    Simulate num_games games as count histograms.
     
-    if len(samples) == 0:
-        # No valid samples found, return zeros
-        return [[0.0] * cables for _ in range(available_numbers)]
+    A sorted hand is fully determined by how many cables of each number it holds, so a game is a
+    (number_of_players, available_numbers) count matrix. Returns a uint8 array of shape
+    (num_games, number_of_players, available_numbers) with games[g][p][n] = cables of number n+1
+    held by player p in game g; histograms_to_hands converts them back to sorted hands.
+    
+    Every game shuffles one deck and counts each seat's cables with a single bincount, so no
+    hand is ever sorted. As in sample_game, the extra cables of an uneven split land on random seats.
+    """
+    rng = np.random.default_rng() if rng is None else rng
+    total_cables = available_numbers * number_instances
+    num_cells = num_games * number_of_players * available_numbers
+    deck = np.repeat(np.arange(available_numbers, dtype=np.int64), number_instances)
+    cells = rng.permuted(np.broadcast_to(deck, (num_games, total_cables)), axis=1)
     
-    numbers: list[list[float]] = []
-    for number in range(available_numbers):
-        probs: list[float] = []
-        for position in range(cables):
-            count = 0
-            for sample in samples:
-                if position < len(sample[0]) and sample[0][position] == number + 1:
-                    count += 1
-            probs.append(count / len(samples))
-        numbers.append(probs)
-    return numbers
+    # Turn every dealt number into its (game, seat, number) cell and count all cells at once
+    seats = np.repeat(np.arange(number_of_players), _seat_sizes(total_cables, number_of_players))
+    cells += (np.arange(num_games)[:, None] * number_of_players + seats) * available_numbers
+    games = np.bincount(cells.ravel(), minlength=num_cells)
+    games = games.astype(_histogram_dtype(number_instances)).reshape(num_games, number_of_players, available_numbers)
+    
+    # Shuffle seats so the extra cables land on random players
+    if total_cables % number_of_players > 0:
+        order = rng.permuted(np.broadcast_to(np.arange(number_of_players), (num_games, number_of_players)), axis=1)
+        games = games[np.arange(num_games)[:, None], order]
+    return games
+
+
+def sample_hand_histograms(pool, hand_sizes: list[int], num_hands: int,
+                           rng: np.random.Generator | None = None) -> np.ndarray:
+    """
+    Draw num_hands random hands from pool as count histograms.
+    
+    pool[n] is the number of cables of number n+1 to draw from. Every hand takes the size of a
+    uniformly random entry of hand_sizes: pass the cable counts of all seats to get the hand of a
+    random seat. Returns a uint8 array of shape (num_hands, len(pool)). A single hand is
+    exchangeable with every other seat's, so the estimators only draw the hand they count
+    instead of dealing whole games.
+    """
+    rng = np.random.default_rng() if rng is None else rng
+    pool = np.asarray(pool, dtype=np.int64)
+    hands = np.zeros((num_hands, len(pool)), dtype=_histogram_dtype(int(pool.max(initial=0))))
+    sizes = np.asarray(hand_sizes)
+    if len(set(hand_sizes)) > 1:
+        sizes = rng.choice(sizes, num_hands)
+    else:
+        sizes = np.full(num_hands, hand_sizes[0])
+    for size in np.unique(sizes):
+        rows = sizes == size
+        hands[rows] = rng.multivariate_hypergeometric(pool, int(size), size=int(rows.sum()), method="count")
+    return hands
+
+
+def histograms_to_hands(histograms: np.ndarray) -> np.ndarray:
+    """
+    Convert count histograms (..., available_numbers) to sorted, 0-padded hands (..., c).
+    
+    c is the largest hand size, so histograms of whole games give the hands of sample_game.
+    """
+    sizes = histograms.sum(axis=-1, dtype=np.int64)
+    max_cables = int(sizes.max(initial=0))
+    # Number n+1 fills positions ends[n-1] .. ends[n]-1, so the number at position j
+    # is 1 + (how many numbers end at or before j)
+    ends = np.cumsum(histograms, axis=-1, dtype=np.int64)
+    positions = np.arange(max_cables)
+    hands = 1 + (ends[..., None, :] <= positions[:, None]).sum(axis=-1)
+    hands[positions >= sizes[..., None]] = 0
+    return hands.astype(np.int16)
+
+
+def _seat_sizes(total_cables: int, number_of_players: int) -> list[int]:
+    """Cable count of every seat when total_cables are split as evenly as possible"""
+    min_cables_per_player = total_cables // number_of_players
+    extra_cables = total_cables % number_of_players
+    return [min_cables_per_player + (1 if p < extra_cables else 0) for p in range(number_of_players)]
+
+
+def _is_seat_size(total_cables: int, number_of_players: int, cables: int) -> bool:
+    """Whether some seat holds exactly 'cables' cables when total_cables are split between the players"""
+    return cables in _seat_sizes(total_cables, number_of_players)
+
+
+def _remaining_pool(available_numbers: int, number_instances: int, player_cables: list[int]) -> np.ndarray:
+    """Cables of each number left once player 0 holds player_cables"""
+    counts = np.bincount(np.asarray(player_cables, dtype=np.int64), minlength=available_numbers + 1)
+    if len(counts) > available_numbers + 1 or counts[0] > 0:
+        raise ValueError("Player cables must be numbers between 1 and available_numbers!")
+    if counts.max(initial=0) > number_instances:
+        raise ValueError("Player cables use a number more often than it exists!")
+    return number_instances - counts[1:]
+
+
+def _histogram_dtype(number_instances: int):
+    return np.uint8 if number_instances <= np.iinfo(np.uint8).max else np.uint16
 
 
 def sample_distribution_given_player_cables(number_of_players: int, available_numbers: int,
                                            number_instances: int, player_cables: list[int],
-                                           num_samples: int = 1000) -> list[list[float]]:
+                                           num_samples: int = 1000, seed: int | None = None,
+                                           workers: int = 1,
+                                           games: Iterable[np.ndarray] | None = None) -> list[list[float]]:
     """
     Estimate probability distribution using Monte Carlo sampling, conditioned on player 0 having specific cables.
     
@@ -127,35 +238,16 @@ def sample_distribution_given_player_cables(number_of_players: int, available_nu
         available_numbers: Number of different numbers
         number_instances: Number of instances of each number
         player_cables: Sorted list of numbers representing player 0's cables
-        num_samples: Target number of valid samples (may need more games to get this many valid samples)
+        num_samples: Number of games to sample (every game satisfies the condition)
+        seed: Optional seed for reproducible estimates
+        workers: Number of worker processes sharing the batches
+        games: Optional chunks of whole-game histograms (K, P, N) to estimate from instead of
+               sampling; only the games where player 0 holds exactly player_cables are counted,
+               which is a small fraction of them
     
     Returns:
         Distribution matrix: result[i][j] = P(number i+1 at position j for player 1 | player 0 has player_cables)
     """
-    # Sort player_cables to ensure consistent comparison
-    expected_cables = sorted(player_cables)
-    
-    samples: list[list[list[int]]] = []
-    attempts = 0
-    max_attempts = num_samples * 20  # Prevent infinite loops, may need more attempts for specific cables
-    
-    # Collect samples where player 0 has exactly the specified cables
-    while len(samples) < num_samples and attempts < max_attempts:
-        attempts += 1
-        game = sample_game(number_of_players, available_numbers, number_instances)
-        if game[0] == expected_cables:
-            samples.append(game)
-    
-    if len(samples) == 0:
-        # No valid samples found, calculate max positions from remaining cables
-        T_remaining = (available_numbers * number_instances) - len(player_cables)
-        P_remaining = number_of_players - 1
-        if P_remaining > 0:
-            max_positions = T_remaining // P_remaining + (1 if T_remaining % P_remaining > 0 else 0)
-        else:
-            max_positions = 0
-        return [[0.0] * max_positions for _ in range(available_numbers)]
-    
     # Calculate max positions from remaining cables
     T_remaining = (available_numbers * number_instances) - len(player_cables)
     P_remaining = number_of_players - 1
@@ -166,15 +258,204 @@ def sample_distribution_given_player_cables(number_of_players: int, available_nu
     else:
         max_positions = 0
     
-    numbers: list[list[float]] = []
-    for number in range(available_numbers):
-        probs: list[float] = []
-        for position in range(max_positions):
-            count = 0
-            for sample in samples:
-                # Check player 1 (index 1) since we're conditioning on player 0
-                if len(sample) > 1 and position < len(sample[1]) and sample[1][position] == number + 1:
-                    count += 1
-            probs.append(count / len(samples))
-        numbers.append(probs)
-    return numbers
+    if P_remaining <= 0:
+        return [[0.0] * max_positions for _ in range(available_numbers)]
+    
+    pool = _remaining_pool(available_numbers, number_instances, player_cables)
+    if games is not None:
+        hand = number_instances - pool
+        return _count_games(games, available_numbers, max_positions,
+                            lambda chunk: chunk[(chunk[:, 0] == hand).all(axis=1), 1]).distribution()
+    
+    # Deal player 1 only from the cables player 0 doesn't hold, so no game is rejected
+    draw = partial(sample_hand_histograms, pool, _seat_sizes(T_remaining, P_remaining))
+    accumulator = _estimate(draw, available_numbers, max_positions, num_samples, seed, workers)
+    return accumulator.distribution()
+
+
+def sample_distribution_anytime(number_of_players: int, available_numbers: int, number_instances: int,
+                                tolerance: float = 0.01, time_budget: float | None = None,
+                                max_samples: int | None = None, cables: int | None = None,
+                                player_cables: list[int] | None = None, confidence: float = 0.95,
+                                seed: int | None = None, batch_size: int = DEFAULT_BATCH_SIZE,
+                                callback: Callable[[int, float], None] | None = None
+                                ) -> tuple[list[list[float]], list[list[float]], int]:
+    """
+    Estimate a distribution with Monte Carlo sampling until it is accurate enough.
+    
+    Games are drawn batch by batch. After every batch the Wilson score interval of each
+    (number, position) cell is computed, and sampling stops as soon as the largest half-width
+    is at most tolerance, time_budget seconds have passed, or max_samples games were drawn.
+    
+    Args:
+        number_of_players: Number of players
+        available_numbers: Number of different numbers
+        number_instances: Number of instances of each number
+        tolerance: Target half-width of the widest confidence interval
+        time_budget: Optional wall-clock limit in seconds
+        max_samples: Optional limit on the number of games
+        cables: If given, condition on player 0 having exactly this many cables (like sample_distribution_given_cables)
+        player_cables: If given, estimate player 1 given player 0's cables (like sample_distribution_given_player_cables)
+        confidence: Confidence level of the intervals
+        seed: Optional seed; batches use the same RNG streams as the other sample_distribution* estimators
+        batch_size: Number of games between two stopping checks
+        callback: Optional callback(num_samples, max_half_width) called after every batch
+    
+    Returns:
+        (distribution, half_widths, num_samples) where half_widths[i][j] is the interval half-width
+        of distribution[i][j]
+    """
+    if cables is not None and player_cables is not None:
+        raise ValueError("Condition on either cables or player_cables, not both!")
+    if tolerance <= 0 and time_budget is None and max_samples is None:
+        # A Wilson half-width never reaches 0
+        raise ValueError("A tolerance of 0 needs a time_budget or max_samples to stop!")
+    total_cables = available_numbers * number_instances
+    if player_cables is not None:
+        if number_of_players <= 1:
+            # There is no player 1 to estimate, as in sample_distribution_given_player_cables
+            return [[] for _ in range(available_numbers)], [[] for _ in range(available_numbers)], 0
+        remaining_cables = total_cables - len(player_cables)
+        draw = partial(sample_hand_histograms, _remaining_pool(available_numbers, number_instances, player_cables),
+                       _seat_sizes(remaining_cables, number_of_players - 1))
+        positions = -(-remaining_cables // (number_of_players - 1))
+    elif cables is not None:
+        if not _is_seat_size(total_cables, number_of_players, cables):
+            # No player can hold this many cables, nothing to sample
+            zeros = [[0.0] * cables for _ in range(available_numbers)]
+            return zeros, [row[:] for row in zeros], 0
+        draw = partial(sample_hand_histograms, [number_instances] * available_numbers, [cables])
+        positions = cables
+    else:
+        draw = partial(sample_hand_histograms, [number_instances] * available_numbers,
+                       _seat_sizes(total_cables, number_of_players))
+        positions = total_cables // number_of_players
+    
+    seeds = np.random.SeedSequence(seed)
+    accumulator = DistributionAccumulator(available_numbers, positions)
+    start = time.perf_counter()
+    while True:
+        num_games = batch_size if max_samples is None else min(batch_size, max_samples - accumulator.num_samples)
+        if num_games <= 0:
+            break
+        accumulator.merge(_count_batch(draw, available_numbers, positions, num_games, seeds.spawn(1)[0]))
+        
+        max_half_width = float(accumulator.half_widths(confidence).max(initial=0.0))
+        if callback is not None:
+            callback(accumulator.num_samples, max_half_width)
+        if max_half_width <= tolerance:
+            break
+        if time_budget is not None and time.perf_counter() - start >= time_budget:
+            break
+    
+    return accumulator.distribution(), accumulator.half_widths(confidence).tolist(), accumulator.num_samples
+
+
+class DistributionAccumulator:
+    """
+    Streaming (number, position) counts for one player's hands.
+    
+    Batches of hands, as sorted hands (add) or count histograms (add_histograms), are folded
+    into a fixed (available_numbers, positions) count matrix, so memory stays constant no
+    matter how many games are added.
+    """
+    
+    def __init__(self, available_numbers: int, positions: int):
+        self.available_numbers = available_numbers
+        self.positions = positions
+        # Row 0 collects the padding of short hands
+        self.counts = np.zeros((available_numbers + 1, positions), dtype=np.int64)
+        self.num_samples = 0
+        
+    def add(self, hands: np.ndarray):
+        """Add a batch of sorted, 0-padded hands of shape (K, c)"""
+        width = min(hands.shape[1], self.positions)
+        cells = hands[:, :width].astype(np.int64) * self.positions + np.arange(width)
+        self.counts += np.bincount(cells.ravel(), minlength=self.counts.size).reshape(self.counts.shape)
+        self.num_samples += hands.shape[0]
+        
+    def add_histograms(self, histograms: np.ndarray):
+        """
+        Add a batch of hands given as count histograms of shape (K, available_numbers).
+        
+        Number n+1 fills the positions from the cumulative count of the smaller numbers up to
+        its own cumulative count, so every hand adds +1 at the start and -1 at the end of one
+        interval per number in a difference array; a cumulative sum over positions turns that
+        into the same counts add() would collect, without building or sorting hands.
+        """
+        num_games = histograms.shape[0]
+        width = self.positions + 1
+        ends = np.minimum(np.cumsum(histograms, axis=1, dtype=np.int64), self.positions)
+        starts = np.concatenate([np.zeros((num_games, 1), dtype=np.int64), ends[:, :-1]], axis=1)
+        # Row 0 collects the padding of short hands, from the hand size to the last position
+        starts = np.concatenate([starts, ends[:, -1:]], axis=1)
+        ends = np.concatenate([ends, np.full((num_games, 1), self.positions)], axis=1)
+        rows = np.append(np.arange(1, self.available_numbers + 1), 0) * width
+        difference = (np.bincount((rows + starts).ravel(), minlength=self.counts.shape[0] * width)
+                       - np.bincount((rows + ends).ravel(), minlength=self.counts.shape[0] * width))
+        self.counts += np.cumsum(difference.reshape(-1, width), axis=1)[:, :self.positions]
+        self.num_samples += num_games
+        
+    def merge(self, other: "DistributionAccumulator"):
+        """Add the counts collected by another accumulator"""
+        self.counts += other.counts
+        self.num_samples += other.num_samples
+        
+    def distribution(self) -> list[list[float]]:
+        """Return result[i][j] = fraction of hands with number i+1 at position j"""
+        if self.num_samples == 0:
+            return [[0.0] * self.positions for _ in range(self.available_numbers)]
+        return (self.counts[1:] / self.num_samples).tolist()
+        
+    def half_widths(self, confidence: float = 0.95) -> np.ndarray:
+        """Return the Wilson score interval half-width of every (number, position) cell"""
+        if self.num_samples == 0:
+            return np.ones((self.available_numbers, self.positions))
+        z = NormalDist().inv_cdf(0.5 + confidence / 2)
+        n = self.num_samples
+        p = self.counts[1:] / n
+        return z / (1 + z * z / n) * np.sqrt(p * (1 - p) / n + z * z / (4 * n * n))
+
+
+def _estimate(draw: Callable[[int, np.random.Generator], np.ndarray],
+              available_numbers: int, positions: int, num_samples: int,
+              seed: int | None, workers: int = 1, batch_size: int = DEFAULT_BATCH_SIZE) -> DistributionAccumulator:
+    """
+    Stream num_samples hand histograms from draw(num_hands, rng) into an accumulator.
+    
+    The games are split into fixed batches and every batch gets its own RNG stream spawned from
+    SeedSequence(seed). Batches only depend on batch_size, so the same seed gives the same counts
+    whether they run in this process or on a pool of `workers` processes.
+    """
+    num_samples = max(num_samples, 0)
+    batches = [min(batch_size, num_samples - start) for start in range(0, num_samples, batch_size)]
+    seeds = np.random.SeedSequence(seed).spawn(len(batches))
+    count = partial(_count_batch, draw, available_numbers, positions)
+    
+    accumulator = DistributionAccumulator(available_numbers, positions)
+    if workers > 1 and len(batches) > 1:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            for partial_counts in pool.map(count, batches, seeds):
+                accumulator.merge(partial_counts)
+    else:
+        for num_games, batch_seed in zip(batches, seeds):
+            accumulator.merge(count(num_games, batch_seed))
+    return accumulator
+
+
+def _count_games(games: Iterable[np.ndarray], available_numbers: int, positions: int,
+                 select: Callable[[np.ndarray], np.ndarray]) -> DistributionAccumulator:
+    """Accumulate the hand histograms select(chunk) picks from every chunk of whole-game histograms"""
+    accumulator = DistributionAccumulator(available_numbers, positions)
+    for chunk in games:
+        accumulator.add_histograms(select(chunk))
+    return accumulator
+
+
+def _count_batch(draw: Callable[[int, np.random.Generator], np.ndarray],
+                 available_numbers: int, positions: int, num_games: int,
+                 seed: np.random.SeedSequence) -> DistributionAccumulator:
+    """Draw one batch of hand histograms with its own RNG stream and count them"""
+    accumulator = DistributionAccumulator(available_numbers, positions)
+    accumulator.add_histograms(draw(num_games, np.random.default_rng(seed)))
+    return accumulator
@@ -0,0 +1,104 @@
+"""
+Bounded LRU cache for exact distribution matrices.
+
+The exact distributions only depend on the game configuration, so repeated
+queries can be answered from memory (and, optionally, from a pickle file
+that survives between runs).
+
+The lecture solutions, the simulations and main.py all share the module-level
+distribution_cache, with keys built by distribution_key:
+
+    distribution_cache.get(distribution_key(exact_distribution, P, N, M),
+                           lambda: exact_distribution(P, N, M))
+"""
+
+import os
+import pickle
+from collections import OrderedDict
+from typing import Callable, Hashable
+
+from base import instrumentation
+
+
+class DistributionCache:
+    """LRU cache of distribution matrices with hit/miss counters"""
+
+    def __init__(self, maxsize: int = 256, path: str | None = None):
+        """
+        Args:
+            maxsize: Maximum number of distributions kept; the least recently used is evicted
+            path: Optional pickle file. Existing entries are loaded from it and every new
+                  entry is written back to it.
+        """
+        self.maxsize = maxsize
+        self.path = None
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[Hashable, list[list[float]]] = OrderedDict()
+        if path is not None:
+            self.load(path)
+
+    def load(self, path: str):
+        """Load the entries stored in path (if it exists) and write every new entry back to it"""
+        self.path = path
+        if os.path.exists(path):
+            with open(path, "rb") as f:
+                self._entries.update(pickle.load(f))
+            self._evict()
+
+    def get(self, key: Hashable, compute: Callable[[], list[list[float]]]) -> list[list[float]]:
+        """Return the distribution stored under key, calling compute() on a miss"""
+        distribution = self._entries.get(key)
+        if distribution is not None:
+            self.hits += 1
+            self._entries.move_to_end(key)
+        else:
+            self.misses += 1
+            distribution = [list(probs) for probs in compute()]
+            self._entries[key] = distribution
+            self._evict()
+            self.save()
+        # Hand out a copy so callers can't modify the cached matrix
+        return [list(probs) for probs in distribution]
+
+    def save(self):
+        """Write all entries to the cache file, if one is configured"""
+        if self.path is None:
+            return
+        tmp_path = self.path + ".tmp"
+        with open(tmp_path, "wb") as f:
+            pickle.dump(dict(self._entries), f)
+        os.replace(tmp_path, self.path)
+
+    def clear(self):
+        """Drop all entries and reset the counters"""
+        self._entries.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def stats(self) -> dict[str, int]:
+        """Return hit/miss counters and the current size"""
+        return {"hits": self.hits, "misses": self.misses,
+                "size": len(self._entries), "maxsize": self.maxsize}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _evict(self):
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+
+def distribution_key(compute: Callable, *args: Hashable) -> tuple:
+    """
+    Cache key of the distribution compute() returns for args.
+
+    The key starts with the module and name of compute, so e.g. an exercise and its solution
+    never share entries. args only need to hold what determines the result.
+    """
+    return (compute.__module__, compute.__qualname__, *args)
+
+
+# The one cache shared by everything that computes exact distributions
+distribution_cache = DistributionCache()
+instrumentation.register_cache("cache.distribution_cache", distribution_cache)
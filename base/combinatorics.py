@@ -0,0 +1,105 @@
+"""
+Shared combinatorics kernel used by the exact-distribution lectures.
+
+A kernel holds Pascal rows and log-factorials for one deck size T. Rows are
+stored as exact Python integers, so probabilities built from them are identical
+to the ones computed with lecture 1's binomial_coefficient. The rows cost
+O(T^2) big integers, so they are only built up to the largest n a binomial()
+call asked for; log-factorials grow on their own.
+"""
+
+import math
+from collections import OrderedDict
+
+import numpy as np
+
+from base import instrumentation
+
+# Number of deck sizes kept alive at the same time
+KERNEL_CACHE_SIZE = 8
+
+
+class CombinatoricsKernel:
+    """Binomial rows and log-factorials for decks of up to `size` cables."""
+
+    def __init__(self, size: int):
+        self.size = size
+        self._rows: list[list[int]] = [[1]]
+        self._log_factorials: list[float] = [0.0]
+        self._log_factorial_table: np.ndarray | None = None
+        # Log-factorials are cheap; Pascal rows are only built once binomial() needs them
+        self._grow_log_factorials(size)
+
+    def _grow_rows(self, n: int):
+        """Extend the Pascal rows so that every row up to n is available"""
+        for m in range(len(self._rows), n + 1):
+            previous = self._rows[m - 1]
+            row = [1] * (m + 1)
+            for k in range(1, m):
+                row[k] = previous[k - 1] + previous[k]
+            self._rows.append(row)
+        self.size = max(self.size, n)
+
+    def _grow_log_factorials(self, n: int):
+        """Extend the log-factorials so that every m <= n is available"""
+        if n < len(self._log_factorials):
+            return
+        for m in range(len(self._log_factorials), n + 1):
+            self._log_factorials.append(self._log_factorials[m - 1] + math.log(m))
+        self._log_factorial_table = None
+        self.size = max(self.size, n)
+
+    @instrumentation.instrument
+    def binomial(self, n: int, k: int) -> int:
+        """Return C(n, k)"""
+        if n < 0 or k < 0 or k > n:
+            return 0
+        if n >= len(self._rows):
+            self._grow_rows(n)
+        return self._rows[n][k]
+
+    def log_factorial(self, n: int) -> float:
+        """Return log(n!)"""
+        if n >= len(self._log_factorials):
+            self._grow_log_factorials(n)
+        return self._log_factorials[n]
+
+    def log_factorial_table(self, n: int = 0) -> np.ndarray:
+        """Return log(k!) for k = 0..max(size, n) as a NumPy array"""
+        self._grow_log_factorials(max(self.size, n))
+        if self._log_factorial_table is None:
+            self._log_factorial_table = np.array(self._log_factorials)
+        return self._log_factorial_table
+
+    @instrumentation.instrument
+    def hypergeometric(self, N: int, K: int, n: int, k: int) -> float:
+        """Return P(k successes in n draws from N items with K successes)"""
+        if k < 0 or k > n or k > K or (n - k) > (N - K):
+            return 0.0
+        denominator = self.binomial(N, n)
+        if denominator == 0:
+            return 0.0
+        return self.binomial(K, k) * self.binomial(N - K, n - k) / denominator
+
+
+_kernels: OrderedDict[int, CombinatoricsKernel] = OrderedDict()
+
+
+def get_kernel(T: int) -> CombinatoricsKernel:
+    """
+    Return the shared kernel for a deck of T cables.
+
+    Kernels are built once per deck size and kept in a small LRU cache, so the
+    least recently used deck size is dropped once KERNEL_CACHE_SIZE is exceeded.
+    """
+    kernel = _kernels.get(T)
+    if instrumentation.ENABLED:
+        instrumentation.record_cache("combinatorics.kernels", kernel is not None)
+    if kernel is not None:
+        _kernels.move_to_end(T)
+        return kernel
+    kernel = CombinatoricsKernel(max(T, 0))
+    _kernels[T] = kernel
+    if len(_kernels) > KERNEL_CACHE_SIZE:
+        _kernels.popitem(last=False)
+    return kernel
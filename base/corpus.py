@@ -0,0 +1,179 @@
+"""
+Bit-packed on-disk corpus of sampled games.
+
+A game is stored as the count histogram of every player's hand (see
+sample_game_histograms): a sorted hand is determined by how many cables of
+each number it holds. Each count takes bits = M.bit_length() bits, and the
+last player is left out because the others determine it (M minus their
+counts). A record is therefore (P - 1) * N * bits bits, rounded up to whole
+bytes, e.g. 14 bytes for the real 4x12x4 deck, so 100M games take 1.4 GB.
+
+File layout: a HEADER_SIZE byte header (magic, version, P, N, M, bits,
+seed, number of games), followed by fixed-width records. GameCorpus maps
+the records with np.memmap and unpacks them chunk by chunk. Nothing is
+parsed when a corpus is opened, and memory stays bounded by the chunk size.
+
+    write_corpus("games.corpus", 4, 12, 4, num_games=10_000_000, seed=0)
+    corpus = GameCorpus("games.corpus")
+    distribution = bb_base.sample_distribution(4, 12, 4, games=corpus.chunks())
+
+The sample_distribution* estimators of base.bombusters take the chunks as
+games, so a corpus gives the same estimates as freshly sampled games.
+"""
+
+import os
+import struct
+import sys
+from typing import Callable, Iterator
+
+import numpy as np
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from base.bombusters import sample_game_histograms
+
+MAGIC = b"BBCORPUS"
+VERSION = 1
+# magic, version, P, N, M, bits, seed (-1 if none), number of games
+HEADER_FORMAT = "<8sHHHHBxxxqQ"
+HEADER_SIZE = 64
+
+# Games sampled per RNG stream when writing, and games unpacked per chunk when reading
+WRITE_BATCH_SIZE = 100_000
+DEFAULT_CHUNK_SIZE = 100_000
+
+
+def write_corpus(path: str, number_of_players: int, available_numbers: int, number_instances: int,
+                 num_games: int, seed: int | None = None,
+                 callback: Callable[[int], None] | None = None) -> str:
+    """
+    Sample num_games games and write them to a corpus file.
+
+    Batches of WRITE_BATCH_SIZE games get their own RNG stream spawned from SeedSequence(seed),
+    so the same seed always writes the same corpus. callback(games_written) is called after
+    every batch.
+    """
+    if number_of_players < 2:
+        raise ValueError("A corpus needs at least two players!")
+    if seed is not None and seed < 0:
+        raise ValueError("The seed must be non-negative!")
+    if number_instances > np.iinfo(np.uint8).max:
+        raise ValueError("A corpus supports at most 255 instances per number!")
+    bits = number_instances.bit_length()
+    header = struct.pack(HEADER_FORMAT, MAGIC, VERSION, number_of_players, available_numbers,
+                         number_instances, bits, -1 if seed is None else seed, num_games)
+
+    batches = [min(WRITE_BATCH_SIZE, num_games - start) for start in range(0, num_games, WRITE_BATCH_SIZE)]
+    seeds = np.random.SeedSequence(seed).spawn(len(batches))
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(header.ljust(HEADER_SIZE, b"\0"))
+        written = 0
+        for batch, batch_seed in zip(batches, seeds):
+            games = sample_game_histograms(number_of_players, available_numbers, number_instances,
+                                           batch, np.random.default_rng(batch_seed))
+            f.write(pack_games(games, bits).tobytes())
+            written += batch
+            if callback is not None:
+                callback(written)
+    os.replace(tmp_path, path)
+    return path
+
+
+def pack_games(games: np.ndarray, bits: int) -> np.ndarray:
+    """Pack game histograms (K, P, N) into fixed-width records (K, record_size) of uint8"""
+    counts = np.ascontiguousarray(games[:, :-1], dtype=np.uint8).reshape(len(games), -1)
+    # Low `bits` bits of every count, least significant first
+    unpacked = np.unpackbits(counts[:, :, None], axis=2, bitorder="little")[:, :, :bits]
+    return np.packbits(unpacked.reshape(len(games), -1), axis=1, bitorder="little")
+
+
+def unpack_games(records: np.ndarray, number_of_players: int, available_numbers: int,
+                 number_instances: int, bits: int) -> np.ndarray:
+    """Unpack records (K, record_size) into game histograms (K, P, N) of uint8"""
+    num_games = len(records)
+    width = (number_of_players - 1) * available_numbers
+    unpacked = np.unpackbits(records, axis=1, count=width * bits, bitorder="little")
+    unpacked = unpacked.reshape(num_games, width, bits)
+    counts = np.zeros((num_games, width), dtype=np.uint8)
+    for bit in range(bits):
+        counts |= unpacked[:, :, bit] << bit
+    games = np.empty((num_games, number_of_players, available_numbers), dtype=np.uint8)
+    games[:, :-1] = counts.reshape(num_games, number_of_players - 1, available_numbers)
+    # The last player holds every cable the others don't
+    games[:, -1] = number_instances - games[:, :-1].sum(axis=1, dtype=np.int64)
+    return games
+
+
+class GameCorpus:
+    """Memory-mapped reader of a corpus written by write_corpus"""
+
+    def __init__(self, path: str):
+        self.path = path
+        with open(path, "rb") as f:
+            header = f.read(HEADER_SIZE)
+        if len(header) < HEADER_SIZE:
+            raise ValueError(f"{path} is not a game corpus!")
+        magic, version, P, N, M, bits, seed, num_games = struct.unpack_from(HEADER_FORMAT, header)
+        if magic != MAGIC:
+            raise ValueError(f"{path} is not a game corpus!")
+        if version != VERSION:
+            raise ValueError(f"Unsupported corpus version: {version}")
+        self.number_of_players = P
+        self.available_numbers = N
+        self.number_instances = M
+        self.bits = bits
+        self.seed = None if seed < 0 else seed
+        self.num_games = num_games
+        self.record_size = -(-(P - 1) * N * bits // 8)
+        if os.path.getsize(path) != HEADER_SIZE + num_games * self.record_size:
+            raise ValueError(f"{path} is truncated or corrupt!")
+        if num_games > 0:
+            self.records = np.memmap(path, dtype=np.uint8, mode="r", offset=HEADER_SIZE,
+                                     shape=(num_games, self.record_size))
+        else:
+            # np.memmap can't map an empty file region
+            self.records = np.zeros((0, self.record_size), dtype=np.uint8)
+
+    def __len__(self) -> int:
+        return self.num_games
+
+    def chunks(self, chunk_size: int = DEFAULT_CHUNK_SIZE, num_games: int | None = None) -> Iterator[np.ndarray]:
+        """Yield the first num_games games (default: all) as histograms (K, P, N), chunk by chunk"""
+        end = self.num_games if num_games is None else min(num_games, self.num_games)
+        for start in range(0, end, chunk_size):
+            yield unpack_games(np.asarray(self.records[start:min(start + chunk_size, end)]),
+                               self.number_of_players, self.available_numbers,
+                               self.number_instances, self.bits)
+
+
+def main():
+    """Write a corpus of the default configuration"""
+    import argparse
+    import time
+    from simulation_config import (
+        DEFAULT_NUMBER_OF_PLAYERS,
+        DEFAULT_AVAILABLE_NUMBERS,
+        DEFAULT_NUMBER_INSTANCES
+    )
+
+    parser = argparse.ArgumentParser(description="Write a bit-packed corpus of sampled games")
+    parser.add_argument("path", help="Corpus file")
+    parser.add_argument("games", type=int, help="Number of games")
+    parser.add_argument("--players", type=int, default=DEFAULT_NUMBER_OF_PLAYERS)
+    parser.add_argument("--numbers", type=int, default=DEFAULT_AVAILABLE_NUMBERS)
+    parser.add_argument("--instances", type=int, default=DEFAULT_NUMBER_INSTANCES)
+    parser.add_argument("--seed", type=int, default=None)
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    write_corpus(args.path, args.players, args.numbers, args.instances, args.games, args.seed,
+                 callback=lambda written: print(f"\r{written}/{args.games} games", end="", flush=True))
+    corpus = GameCorpus(args.path)
+    print(f"\nWrote {len(corpus)} games ({corpus.record_size} bytes each, "
+          f"{os.path.getsize(args.path) / 1e6:.1f} MB) in {time.perf_counter() - start:.1f}s")
+
+
+if __name__ == "__main__":
+    main()
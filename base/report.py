@@ -0,0 +1,130 @@
+"""
+Headless batch rendering of distribution reports.
+
+render_reports takes many (P, N, M, hand) jobs and writes one PNG/SVG report
+per job. It needs no display: figures are plain matplotlib Figure objects
+drawn by the Agg canvas, without pyplot. Jobs are spread over worker
+processes, and every worker builds its figure once and reuses it for every
+report it renders.
+
+The distributions come from the caller: compute(P, N, M, hand) returns the
+distribution and a subtitle for the report. batch_reports.py renders the
+lecture solutions this way.
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from typing import Callable
+
+import numpy as np
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+
+# Reports rendered per worker task
+CHUNK_SIZE = 16
+
+# The figure of this worker process, created on first use
+_figure = None
+
+
+def report_filename(number_of_players: int, available_numbers: int, number_instances: int,
+                    hand: list[int] | None, fmt: str = "png") -> str:
+    """Return the file name of the report of one job"""
+    hand_label = "unconditional" if hand is None else "hand_" + "-".join(str(cable) for cable in sorted(hand))
+    return f"report_P{number_of_players}_N{available_numbers}_M{number_instances}_{hand_label}.{fmt}"
+
+
+def render_reports(jobs: list[tuple], output_dir: str,
+                   compute: Callable[[int, int, int, list[int] | None], tuple[list[list[float]], str]],
+                   fmt: str = "png", workers: int | None = None) -> list[str]:
+    """
+    Render one report per job in parallel worker processes.
+
+    Args:
+        jobs: (P, N, M, hand) tuples; hand is player 0's cables, or None for the
+              unconditional distribution
+        output_dir: Directory the reports are written to (created if needed)
+        compute: compute(P, N, M, hand) returns (distribution, subtitle) of one job. It runs in
+                 the workers, so it must be a module-level function.
+        fmt: Image format, "png" or "svg"
+        workers: Number of worker processes (defaults to the number of CPUs)
+
+    Returns:
+        Paths of the written reports, in job order
+    """
+    if fmt not in ("png", "svg"):
+        raise ValueError(f"Unsupported report format: {fmt}")
+    os.makedirs(output_dir, exist_ok=True)
+    render = partial(_render_job, compute=compute, output_dir=output_dir, fmt=fmt)
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(render, jobs, chunksize=CHUNK_SIZE))
+
+
+def _render_job(job: tuple, compute: Callable, output_dir: str, fmt: str) -> str:
+    """Compute and draw one report (runs in a worker process)"""
+    number_of_players, available_numbers, number_instances, hand = job
+    distribution, subtitle = compute(number_of_players, available_numbers, number_instances, hand)
+
+    fig = _worker_figure()
+    title = f"P={number_of_players}, N={available_numbers}, M={number_instances} - {subtitle}"
+    draw_report(fig, distribution, title)
+    path = os.path.join(output_dir, report_filename(
+        number_of_players, available_numbers, number_instances, hand, fmt))
+    fig.savefig(path, format=fmt)
+    return path
+
+
+def _worker_figure() -> Figure:
+    """Return this process's report figure, creating it on first use"""
+    global _figure
+    if _figure is None:
+        _figure = Figure(figsize=(14, 8))
+        FigureCanvasAgg(_figure)
+        # Fixed layout, so redrawing never moves or shrinks the axes
+        _figure.add_axes([0.06, 0.55, 0.90, 0.36])   # Overview
+        _figure.add_axes([0.06, 0.07, 0.86, 0.38])   # Heatmap
+        _figure.add_axes([0.935, 0.07, 0.015, 0.38])  # Colorbar
+    return _figure
+
+
+def draw_report(fig: Figure, distribution: list[list[float]], title: str):
+    """
+    Draw a distribution report into a figure with overview, heatmap and colorbar axes.
+
+    Top: one line per number across positions (as in the simulations' overview).
+    Bottom: heatmap of the whole (number, position) matrix with percentages.
+    """
+    ax_overview, ax_heatmap, ax_colorbar = fig.axes
+    for ax in fig.axes:
+        ax.clear()
+
+    fig.suptitle(title, fontsize=14, fontweight='bold')
+
+    for n, probs in enumerate(distribution):
+        x = list(range(len(probs)))
+        ax_overview.plot(x, probs, marker='o', label=f'Number {n+1}', linewidth=2)
+    ax_overview.set_title("Overview - All Distributions", fontsize=12, fontweight='bold')
+    ax_overview.set_xlabel("Position")
+    ax_overview.set_ylabel("Probability")
+    ax_overview.set_ylim(0, 1)
+    ax_overview.legend(loc='upper right', fontsize=8, ncol=2)
+    ax_overview.grid(True, alpha=0.3)
+
+    max_positions = max((len(probs) for probs in distribution), default=0)
+    matrix = np.zeros((len(distribution), max_positions))
+    for n, probs in enumerate(distribution):
+        matrix[n, :len(probs)] = probs
+    image = ax_heatmap.imshow(matrix, aspect='auto', cmap='Blues', vmin=0, vmax=1)
+    for n in range(matrix.shape[0]):
+        for pos in range(matrix.shape[1]):
+            p = matrix[n, pos]
+            if p > 0.01:  # Only show if > 1%
+                ax_heatmap.text(pos, n, f'{100*p:.0f}%', ha='center', va='center', fontsize=7,
+                                color='white' if p > 0.5 else 'black')
+    ax_heatmap.set_title("Number x Position", fontsize=12, fontweight='bold')
+    ax_heatmap.set_xlabel("Position")
+    ax_heatmap.set_ylabel("Number")
+    ax_heatmap.set_xticks(range(max_positions))
+    ax_heatmap.set_yticks(range(len(distribution)), labels=[f"{n+1}" for n in range(len(distribution))])
+    fig.colorbar(image, cax=ax_colorbar, label="Probability")
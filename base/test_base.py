@@ -0,0 +1,383 @@
+"""
+Tests for the shared base modules.
+
+Run this to verify the shared modules:
+    python base/test_base.py
+"""
+
+import sys
+import os
+import tempfile
+
+import numpy as np
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from base import bombusters as bb_base
+from base.cache import DistributionCache, distribution_key
+from base.corpus import HEADER_SIZE, GameCorpus, write_corpus
+from base.report import render_reports
+
+
+def test_sample_game_histograms():
+    """Test that sampled game histograms deal complete decks with the right hand sizes"""
+    print("=" * 60)
+    print("Testing sample_game_histograms")
+    print("=" * 60)
+
+    all_passed = True
+    for P, N, M in [(3, 4, 4), (4, 12, 4), (5, 7, 3)]:
+        try:
+            games = bb_base.sample_game_histograms(P, N, M, 2000, np.random.default_rng(0))
+            sizes = games.sum(axis=2)
+            expected_sizes = sorted(bb_base._seat_sizes(N * M, P))
+            ok = (games.shape == (2000, P, N) and games.dtype == np.uint8
+                  and (games.sum(axis=1) == M).all()
+                  and (np.sort(sizes, axis=1) == expected_sizes).all())
+            status = "✓" if ok else "✗"
+            if not ok:
+                all_passed = False
+            print(f"{status} P={P}, N={N}, M={M}: complete decks, hand sizes {expected_sizes}")
+
+            # Uneven splits: every seat gets the extra cable equally often
+            if (N * M) % P > 0:
+                share = (sizes == max(expected_sizes)).mean(axis=0)
+                expected_share = ((N * M) % P) / P
+                ok = np.abs(share - expected_share).max() < 0.05
+                status = "✓" if ok else "✗"
+                if not ok:
+                    all_passed = False
+                print(f"{status} Extra cables land on random seats: {np.round(share, 3).tolist()}")
+
+            again = bb_base.sample_game_histograms(P, N, M, 2000, np.random.default_rng(0))
+            ok = np.array_equal(games, again)
+            status = "✓" if ok else "✗"
+            if not ok:
+                all_passed = False
+            print(f"{status} The same generator seed gives the same games")
+        except Exception as e:
+            print(f"✗ P={P}, N={N}, M={M} raised exception: {e}")
+            all_passed = False
+
+    print()
+    return all_passed
+
+
+def test_histograms_to_hands():
+    """Test the conversion of count histograms to sorted, 0-padded hands"""
+    print("=" * 60)
+    print("Testing histograms_to_hands")
+    print("=" * 60)
+
+    test_cases = [
+        ([[2, 0, 1, 1]], [[1, 1, 3, 4]]),
+        ([[0, 0, 0, 3]], [[4, 4, 4]]),
+        ([[1, 1, 0], [0, 1, 0]], [[1, 2], [2, 0]]),
+    ]
+
+    all_passed = True
+    for histograms, expected in test_cases:
+        try:
+            hands = bb_base.histograms_to_hands(np.array(histograms, dtype=np.uint8))
+            ok = hands.tolist() == expected
+            status = "✓" if ok else "✗"
+            if not ok:
+                all_passed = False
+            print(f"{status} {histograms} -> {hands.tolist()} (expected {expected})")
+        except Exception as e:
+            print(f"✗ {histograms} raised exception: {e}")
+            all_passed = False
+
+    print()
+    return all_passed
+
+
+def test_accumulator_histograms():
+    """Test that add_histograms counts the same cells as add on the converted hands"""
+    print("=" * 60)
+    print("Testing DistributionAccumulator.add_histograms")
+    print("=" * 60)
+
+    all_passed = True
+    for P, N, M in [(3, 4, 4), (4, 12, 4), (5, 7, 3)]:
+        try:
+            games = bb_base.sample_game_histograms(P, N, M, 1000, np.random.default_rng(1))
+            for positions in [(N * M) // P, -(-(N * M) // P), 2]:
+                from_histograms = bb_base.DistributionAccumulator(N, positions)
+                from_hands = bb_base.DistributionAccumulator(N, positions)
+                for p in range(P):
+                    from_histograms.add_histograms(games[:, p])
+                    from_hands.add(bb_base.histograms_to_hands(games[:, p]))
+                ok = (np.array_equal(from_histograms.counts, from_hands.counts)
+                      and from_histograms.num_samples == from_hands.num_samples == P * 1000)
+                status = "✓" if ok else "✗"
+                if not ok:
+                    all_passed = False
+                print(f"{status} P={P}, N={N}, M={M}, {positions} positions: "
+                      f"add_histograms == add(histograms_to_hands(...))")
+        except Exception as e:
+            print(f"✗ P={P}, N={N}, M={M} raised exception: {e}")
+            all_passed = False
+
+    print()
+    return all_passed
+
+
+def test_accumulator_streaming():
+    """Test that merged batches give the same counts as one batch and memory stays fixed"""
+    print("=" * 60)
+    print("Testing DistributionAccumulator streaming")
+    print("=" * 60)
+
+    all_passed = True
+    N, positions = 4, 5
+    try:
+        hands = bb_base.sample_hand_histograms([4] * N, [5, 5, 6], 3000, np.random.default_rng(2))
+        whole = bb_base.DistributionAccumulator(N, positions)
+        whole.add_histograms(hands)
+        streamed = bb_base.DistributionAccumulator(N, positions)
+        for start in range(0, len(hands), 700):
+            batch = bb_base.DistributionAccumulator(N, positions)
+            batch.add_histograms(hands[start:start + 700])
+            streamed.merge(batch)
+        ok = (np.array_equal(whole.counts, streamed.counts) and streamed.num_samples == 3000
+              and streamed.counts.shape == (N + 1, positions))
+        status = "✓" if ok else "✗"
+        if not ok:
+            all_passed = False
+        print(f"{status} Five merged batches match one batch of 3000 hands in a fixed {streamed.counts.shape} matrix")
+
+        # Every position holds exactly one number
+        distribution = np.array(streamed.distribution())
+        ok = np.allclose(distribution.sum(axis=0), 1.0)
+        status = "✓" if ok else "✗"
+        if not ok:
+            all_passed = False
+        print(f"{status} Every position's probabilities sum to 1")
+
+        empty = bb_base.DistributionAccumulator(N, positions)
+        ok = (empty.distribution() == [[0.0] * positions for _ in range(N)]
+              and (empty.half_widths() == 1.0).all() and (streamed.half_widths() < 0.05).all())
+        status = "✓" if ok else "✗"
+        if not ok:
+            all_passed = False
+        print(f"{status} Empty accumulator gives zeros and full-width intervals")
+    except Exception as e:
+        print(f"✗ Streaming accumulator raised exception: {e}")
+        all_passed = False
+
+    print()
+    return all_passed
+
+
+def test_distribution_cache():
+    """Test LRU eviction, copies, persistence and keys of the distribution cache"""
+    print("=" * 60)
+    print("Testing DistributionCache")
+    print("=" * 60)
+
+    all_passed = True
+    try:
+        cache = DistributionCache(maxsize=2)
+        cache.get("a", lambda: [[0.1]])
+        cache.get("b", lambda: [[0.2]])
+        cache.get("a", lambda: [[-1.0]])  # "a" is now the most recently used
+        cache.get("c", lambda: [[0.3]])   # Evicts "b"
+        recomputed = cache.get("b", lambda: [[0.4]])
+        ok = (len(cache) == 2 and recomputed == [[0.4]]
+              and cache.stats() == {"hits": 1, "misses": 4, "size": 2, "maxsize": 2})
+        status = "✓" if ok else "✗"
+        if not ok:
+            all_passed = False
+        print(f"{status} Least recently used entry is evicted: {cache.stats()}")
+
+        first = cache.get("c", lambda: [[-1.0]])
+        first[0][0] = -1.0
+        ok = cache.get("c", lambda: [[-1.0]]) == [[0.3]]
+        status = "✓" if ok else "✗"
+        if not ok:
+            all_passed = False
+        print(f"{status} Modifying a returned matrix doesn't change the cached entry")
+
+        with tempfile.TemporaryDirectory() as output_dir:
+            path = os.path.join(output_dir, "distributions.pkl")
+            stored = DistributionCache(path=path)
+            stored.get(("x", 1), lambda: [[0.25, 0.75]])
+            stored.get(("y", 2), lambda: [[1.0]])
+            loaded = DistributionCache()
+            loaded.load(path)
+            ok = (len(loaded) == 2 and loaded.get(("x", 1), lambda: [[-1.0]]) == [[0.25, 0.75]]
+                  and loaded.hits == 1 and loaded.misses == 0)
+            status = "✓" if ok else "✗"
+            if not ok:
+                all_passed = False
+            print(f"{status} Entries survive a pickle round-trip")
+
+            small = DistributionCache(maxsize=1, path=path)
+            ok = len(small) == 1
+            status = "✓" if ok else "✗"
+            if not ok:
+                all_passed = False
+            print(f"{status} Loading more entries than maxsize keeps the most recent one")
+
+        ok = (distribution_key(bb_base.sample_distribution, 3, 4, 4)
+              != distribution_key(bb_base.sample_distribution_given_cables, 3, 4, 4)
+              and distribution_key(bb_base.sample_distribution, 3, 4, 4)
+              == ("base.bombusters", "sample_distribution", 3, 4, 4))
+        status = "✓" if ok else "✗"
+        if not ok:
+            all_passed = False
+        print(f"{status} Keys tell functions apart")
+    except Exception as e:
+        print(f"✗ DistributionCache raised exception: {e}")
+        all_passed = False
+
+    print()
+    return all_passed
+
+
+def uniform_distribution(number_of_players: int, available_numbers: int, number_instances: int,
+                         hand: list[int] | None) -> tuple[list[list[float]], str]:
+    """Report contents for test_render_reports: every number equally likely at every position"""
+    positions = available_numbers * number_instances // number_of_players
+    return [[1 / available_numbers] * positions for _ in range(available_numbers)], f"hand={hand}"
+
+
+def test_render_reports():
+    """Test that the headless batch renderer writes one report per job"""
+    print("=" * 60)
+    print("Testing render_reports")
+    print("=" * 60)
+
+    all_passed = True
+    jobs = [(3, 4, 4, None), (3, 4, 4, [1, 1, 2, 3, 4]), (3, 4, 4, [2, 2, 3, 3, 4, 4]), (4, 5, 3, [1, 5, 5, 2])]
+    try:
+        with tempfile.TemporaryDirectory() as path:
+            for fmt, header in [("png", b"\x89PNG"), ("svg", b"<?xml")]:
+                paths = render_reports(jobs, path, uniform_distribution, fmt=fmt, workers=2)
+                ok = len(set(paths)) == len(jobs)
+                for report in paths:
+                    with open(report, "rb") as f:
+                        ok = ok and report.endswith("." + fmt) and f.read(5).startswith(header)
+                status = "✓" if ok else "✗"
+                if not ok:
+                    all_passed = False
+                print(f"{status} {len(paths)} {fmt.upper()} reports written")
+
+            try:
+                render_reports(jobs, path, uniform_distribution, fmt="jpg")
+                print("✗ Unsupported format should raise ValueError")
+                all_passed = False
+            except ValueError:
+                print("✓ Unsupported format raises ValueError")
+    except Exception as e:
+        print(f"✗ render_reports raised exception: {e}")
+        all_passed = False
+
+    print()
+    return all_passed
+
+
+def test_game_corpus():
+    """Test that a written corpus reads back its header and feeds the estimators"""
+    print("=" * 60)
+    print("Testing game corpus")
+    print("=" * 60)
+
+    all_passed = True
+    P, N, M, games = 3, 4, 4, 50_000
+    try:
+        with tempfile.TemporaryDirectory() as output_dir:
+            path = os.path.join(output_dir, "games.corpus")
+            write_corpus(path, P, N, M, games, seed=1)
+            corpus = GameCorpus(path)
+
+            ok = ((corpus.number_of_players, corpus.available_numbers, corpus.number_instances,
+                   corpus.seed, len(corpus)) == (P, N, M, 1, games)
+                  and os.path.getsize(path) == HEADER_SIZE + games * corpus.record_size)
+            status = "✓" if ok else "✗"
+            if not ok:
+                all_passed = False
+            print(f"{status} Header and size: {len(corpus)} games of {corpus.record_size} bytes")
+
+            chunks = list(corpus.chunks(chunk_size=20_000))
+            ok = ([len(chunk) for chunk in chunks] == [20_000, 20_000, 10_000]
+                  and all((chunk.sum(axis=1) == M).all() and (chunk.sum(axis=2).sum(axis=1) == N * M).all()
+                          for chunk in chunks))
+            status = "✓" if ok else "✗"
+            if not ok:
+                all_passed = False
+            print(f"{status} Chunks hold complete decks")
+
+            # Corpus estimates against freshly sampled ones
+            estimates = [
+                ("sample_distribution", 0.02,
+                 bb_base.sample_distribution(P, N, M, games=corpus.chunks()),
+                 bb_base.sample_distribution(P, N, M, 200_000, seed=0)),
+                ("sample_distribution_given_cables", 0.02,
+                 bb_base.sample_distribution_given_cables(P, N, M, 6, games=corpus.chunks()),
+                 bb_base.sample_distribution_given_cables(P, N, M, 6, 200_000, seed=0)),
+                ("sample_distribution_given_player_cables", 0.05,
+                 bb_base.sample_distribution_given_player_cables(P, N, M, [1, 1, 2, 3, 4], games=corpus.chunks()),
+                 bb_base.sample_distribution_given_player_cables(P, N, M, [1, 1, 2, 3, 4], 200_000, seed=0)),
+            ]
+            for name, tolerance, estimate, expected in estimates:
+                diff = max(abs(estimate[n][pos] - expected[n][pos])
+                           for n in range(N) for pos in range(len(expected[n])))
+                ok = diff < tolerance
+                status = "✓" if ok else "✗"
+                if not ok:
+                    all_passed = False
+                print(f"{status} {name} from the corpus: max diff = {diff:.4f}")
+
+            write_corpus(path + ".again", P, N, M, games, seed=1)
+            with open(path, "rb") as f, open(path + ".again", "rb") as g:
+                ok = f.read() == g.read()
+            status = "✓" if ok else "✗"
+            if not ok:
+                all_passed = False
+            print(f"{status} The same seed writes the same corpus")
+    except Exception as e:
+        print(f"✗ Game corpus raised exception: {e}")
+        all_passed = False
+
+    print()
+    return all_passed
+
+
+def main():
+    """Run all tests"""
+    print("\n" + "=" * 60)
+    print("BASE TESTS: Shared Modules")
+    print("=" * 60 + "\n")
+
+    results = []
+    results.append(("sample_game_histograms", test_sample_game_histograms()))
+    results.append(("histograms_to_hands", test_histograms_to_hands()))
+    results.append(("accumulator_histograms", test_accumulator_histograms()))
+    results.append(("accumulator_streaming", test_accumulator_streaming()))
+    results.append(("distribution_cache", test_distribution_cache()))
+    results.append(("render_reports", test_render_reports()))
+    results.append(("game_corpus", test_game_corpus()))
+
+    print("=" * 60)
+    print("TEST SUMMARY")
+    print("=" * 60)
+    for name, passed in results:
+        status = "PASSED ✓" if passed else "FAILED ✗"
+        print(f"{name:40s} {status}")
+
+    all_passed = all(passed for _, passed in results)
+    print("=" * 60)
+    if all_passed:
+        print("ALL TESTS PASSED! 🎉")
+    else:
+        print("SOME TESTS FAILED. Please fix your implementation.")
+    print("=" * 60)
+
+    return 0 if all_passed else 1
+
+
+if __name__ == "__main__":
+    exit(main())
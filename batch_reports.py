@@ -0,0 +1,59 @@
+"""
+Render distribution reports of the lecture solutions without a display.
+
+A report shows the exact distribution of player 1 given player 0's hand
+(Lecture 6), or the unconditional distribution (Lecture 4) when hand is None.
+The rendering itself lives in base/report.py.
+
+Usage:
+    python batch_reports.py                  # 10 random hands of the default configuration
+    python batch_reports.py 100 --format svg --output reports
+"""
+
+import argparse
+import os
+import sys
+
+# Add paths
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from base import bombusters as bb_base
+from base.report import render_reports
+from lecture_04_exact_distribution.solution import exact_distribution
+from lecture_06_distribution_given_player_cable.solution import exact_distribution_given_player_cables
+from simulation_config import (
+    DEFAULT_NUMBER_OF_PLAYERS,
+    DEFAULT_AVAILABLE_NUMBERS,
+    DEFAULT_NUMBER_INSTANCES
+)
+
+
+def lecture_distribution(number_of_players: int, available_numbers: int, number_instances: int,
+                         hand: list[int] | None) -> tuple[list[list[float]], str]:
+    """Return the distribution and subtitle of one report (Lecture 6 given hand, Lecture 4 without)"""
+    if hand is None:
+        distribution = exact_distribution(number_of_players, available_numbers, number_instances)
+        return distribution, "Unconditional distribution"
+    distribution = exact_distribution_given_player_cables(
+        number_of_players, available_numbers, number_instances, sorted(hand))
+    return distribution, f"Player 1 given Player 0 has {sorted(hand)}"
+
+
+def main():
+    """Render reports for random hands of the default configuration"""
+    parser = argparse.ArgumentParser(description="Render distribution reports without a display")
+    parser.add_argument("count", type=int, nargs="?", default=10, help="Number of random hands")
+    parser.add_argument("--output", default="reports", help="Output directory")
+    parser.add_argument("--format", default="png", choices=["png", "svg"])
+    parser.add_argument("--workers", type=int, default=None)
+    args = parser.parse_args()
+
+    P, N, M = DEFAULT_NUMBER_OF_PLAYERS, DEFAULT_AVAILABLE_NUMBERS, DEFAULT_NUMBER_INSTANCES
+    hands = {tuple(bb_base.sample_game(P, N, M)[0]) for _ in range(args.count)}
+    jobs = [(P, N, M, None)] + [(P, N, M, list(hand)) for hand in sorted(hands)]
+    paths = render_reports(jobs, args.output, lecture_distribution, args.format, args.workers)
+    print(f"Wrote {len(paths)} reports to {args.output}/")
+
+
+if __name__ == "__main__":
+    main()
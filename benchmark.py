@@ -0,0 +1,159 @@
+"""
+Benchmark suite for the exact and Monte Carlo engines.
+
+Times every engine over a grid of game configurations (P, N, M), from the
+small lecture decks through the real 12x4 deck to stress sizes, and reports
+calls/sec, p50/p99 latency and peak memory (tracemalloc). Results are
+printed as a table and written as JSON, so runs can be compared across
+releases.
+
+Usage:
+    python benchmark.py                       # full grid
+    python benchmark.py --quick               # small grid for a fast check
+    python benchmark.py --output results.json --min-time 2.0
+"""
+
+import argparse
+import json
+import os
+import platform
+import random
+import sys
+import time
+import tracemalloc
+
+import numpy as np
+
+# Add paths
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from base import bombusters as bb_base
+from lecture_04_exact_distribution.solution import exact_distribution
+from lecture_05_distribution_given_cable_count.solution import exact_distribution_given_cable_count
+from lecture_06_distribution_given_player_cable.solution import exact_distribution_given_player_cables
+
+# (P, N, M) configurations
+GRID = [
+    (3, 4, 4),    # Lecture examples
+    (3, 8, 4),    # Simulation default
+    (4, 12, 4),   # Real deck
+    (5, 12, 4),
+    (5, 20, 5),   # Stress sizes
+    (6, 40, 6),
+    (8, 60, 8),
+]
+QUICK_GRID = [(3, 4, 4), (4, 12, 4)]
+
+# Games per Monte Carlo estimate
+MONTE_CARLO_SAMPLES = 1000
+
+
+def benchmark_targets(number_of_players: int, available_numbers: int, number_instances: int,
+                      num_samples: int = MONTE_CARLO_SAMPLES) -> dict:
+    """
+    Return name -> zero-argument callable for every engine in one configuration.
+
+    Hands and cable counts come from a fixed seed, so every run measures the same inputs.
+    """
+    P, N, M = number_of_players, available_numbers, number_instances
+    player_cables = bb_base.sample_game(P, N, M, rng=random.Random(0))[0]
+    c = (N * M) // P
+    return {
+        "exact_distribution": lambda: exact_distribution(P, N, M),
+        "exact_distribution_given_cable_count": lambda: exact_distribution_given_cable_count(P, N, M, c),
+        "exact_distribution_given_player_cables": lambda: exact_distribution_given_player_cables(
+            P, N, M, player_cables),
+        "sample_game": lambda: bb_base.sample_game(P, N, M),
+        "sample_game_histograms": lambda: bb_base.sample_game_histograms(P, N, M, num_samples),
+        "sample_distribution": lambda: bb_base.sample_distribution(P, N, M, num_samples, seed=0),
+        "sample_distribution_given_cables": lambda: bb_base.sample_distribution_given_cables(
+            P, N, M, c, num_samples, seed=0),
+        "sample_distribution_given_player_cables": lambda: bb_base.sample_distribution_given_player_cables(
+            P, N, M, player_cables, num_samples, seed=0),
+    }
+
+
+def measure(call, min_time: float = 1.0, min_calls: int = 5, max_calls: int = 100_000) -> dict:
+    """
+    Time call() repeatedly after one warm-up call.
+
+    Calls are repeated until both min_time seconds and min_calls calls are reached.
+    Peak memory is measured in a separate traced call, so tracing doesn't skew the timings.
+    """
+    call()
+
+    latencies = []
+    start = time.perf_counter()
+    while len(latencies) < max_calls:
+        t0 = time.perf_counter()
+        call()
+        latencies.append(time.perf_counter() - t0)
+        if len(latencies) >= min_calls and time.perf_counter() - start >= min_time:
+            break
+    total = time.perf_counter() - start
+
+    tracemalloc.start()
+    call()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    latencies_ms = np.array(latencies) * 1000
+    return {
+        "calls": len(latencies),
+        "calls_per_sec": len(latencies) / total,
+        "p50_ms": float(np.percentile(latencies_ms, 50)),
+        "p99_ms": float(np.percentile(latencies_ms, 99)),
+        "peak_memory_kb": peak / 1024,
+    }
+
+
+def run_benchmarks(grid: list[tuple[int, int, int]], targets: list[str] | None = None,
+                   min_time: float = 1.0, num_samples: int = MONTE_CARLO_SAMPLES) -> list[dict]:
+    """Benchmark the selected targets (all if None) on every configuration of the grid"""
+    results = []
+    for P, N, M in grid:
+        for name, call in benchmark_targets(P, N, M, num_samples).items():
+            if targets is not None and name not in targets:
+                continue
+            result = {"target": name, "P": P, "N": N, "M": M}
+            result.update(measure(call, min_time=min_time))
+            results.append(result)
+            print(f"{name:<42} P={P:<2} N={N:<3} M={M:<2} "
+                  f"{result['calls_per_sec']:>10.1f}/s  "
+                  f"p50 {result['p50_ms']:>9.3f} ms  p99 {result['p99_ms']:>9.3f} ms  "
+                  f"peak {result['peak_memory_kb']:>9.1f} KiB")
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the exact and Monte Carlo engines")
+    parser.add_argument("--quick", action="store_true", help="Only run the small grid")
+    parser.add_argument("--target", action="append", help="Only benchmark this target (repeatable)")
+    parser.add_argument("--min-time", type=float, default=1.0, help="Seconds per measurement")
+    parser.add_argument("--samples", type=int, default=MONTE_CARLO_SAMPLES, help="Games per Monte Carlo call")
+    parser.add_argument("--output", default="benchmark_results.json", help="JSON output file")
+    args = parser.parse_args()
+
+    grid = QUICK_GRID if args.quick else GRID
+    print("=" * 60)
+    print("BOMBBUSTERS: Engine Benchmarks")
+    print("=" * 60)
+    results = run_benchmarks(grid, args.target, args.min_time, args.samples)
+
+    report = {
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "platform": platform.platform(),
+        "min_time": args.min_time,
+        "monte_carlo_samples": args.samples,
+        "results": results,
+    }
+    with open(args.output, "w") as f:
+        json.dump(report, f, indent=2)
+    print("=" * 60)
+    print(f"Wrote {len(results)} results to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
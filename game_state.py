@@ -0,0 +1,336 @@
+"""
+Event-sourced game state tracker.
+
+GameState ingests the public events of a game (our deal, revealed cables,
+successful and failed cuts) and keeps a position distribution for every
+player up to date.
+
+The cables we don't hold are dealt uniformly at random to the other seats,
+so the posteriors are joint and exact: a deal is weighted by the number of
+deck orders that produce it and only kept if it agrees with the revealed
+positions and failed cuts of *every* player. Pinning one player's hand
+therefore also moves the cables of everybody else.
+
+A deal is fixed by how many cables of each number every other player holds,
+so a dynamic program over the numbers 1..N enumerates them. Its state is how
+many cables players 1..P-2 already hold (the last player holds the rest),
+i.e. at most prod(c_p + 1) states: cheap for the usual 3-5 players, but
+exponential in the number of players.
+
+Which blocks of positions a number may occupy in one player's hand comes from
+lecture 3's _revealed_steps, the same windows its single-player DP uses.
+
+An event about number v only changes the transitions of layer v of the DP:
+the windows it narrows for other numbers are implied by sorting, so layers
+built before the event stay exact. The forward messages of the layers before
+v and the backward messages of the layers after v are kept; the rest, and the
+posteriors of all players (they are coupled), are recomputed lazily on the
+next query.
+"""
+
+import itertools
+import math
+
+import numpy as np
+
+from base.combinatorics import get_kernel
+from lecture_03_position_probability.solution import _revealed_steps
+
+
+class GameState:
+    """Public knowledge about one game, built from an event log"""
+
+    def __init__(self, number_of_players: int, available_numbers: int, number_instances: int):
+        self.number_of_players = number_of_players
+        self.available_numbers = available_numbers
+        self.number_instances = number_instances
+        self.events: list[tuple] = []
+
+        self.player_cables: list[int] | None = None      # Our (player 0's) sorted hand
+        self.cable_counts: list[int] | None = None       # Cable count of every seat
+        self.revealed: list[dict[int, int]] = [{} for _ in range(number_of_players)]
+        self.excluded: list[set[tuple[int, int]]] = [set() for _ in range(number_of_players)]
+        self._posteriors: list[list[list[float]]] | None = None
+
+        # Dynamic program over the numbers, see the module docstring
+        self._steps: dict[int, list[tuple]] = {}
+        self._layers: dict[int, list[tuple[tuple[int, ...], np.ndarray]]] = {}
+        self._forward: list[np.ndarray] = []
+        self._backward: list[np.ndarray] = []
+        self._forward_valid = 0                          # forward[0..forward_valid] are up to date
+        self._backward_valid = available_numbers         # backward[backward_valid..N] are up to date
+
+    @classmethod
+    def from_events(cls, number_of_players: int, available_numbers: int, number_instances: int,
+                    events: list[tuple]) -> "GameState":
+        """Replay an event log into a new state"""
+        state = cls(number_of_players, available_numbers, number_instances)
+        for event in events:
+            state.apply(event)
+        return state
+
+    def apply(self, event: tuple):
+        """
+        Apply one event. Supported events:
+
+            ("deal", player_cables, cable_counts)
+            ("reveal", player, position, number)
+            ("successful_cut", cutter, cutter_position, target, target_position, number)
+            ("failed_cut", target, position, number)
+        """
+        kind, *args = event
+        handlers = {
+            "deal": self._apply_deal,
+            "reveal": self._apply_reveal,
+            "successful_cut": self._apply_successful_cut,
+            "failed_cut": self._apply_failed_cut,
+        }
+        if kind not in handlers:
+            raise ValueError(f"Unknown event: {kind}")
+        handlers[kind](*args)
+        self.events.append(event)
+
+    def deal(self, player_cables: list[int], cable_counts: list[int] | None = None):
+        """We (player 0) received player_cables; cable_counts defaults to an even split"""
+        self.apply(("deal", list(player_cables), cable_counts))
+
+    def reveal(self, player: int, position: int, number: int):
+        """The cable at position of player is publicly known to be number"""
+        self.apply(("reveal", player, position, number))
+
+    def successful_cut(self, cutter: int, cutter_position: int, target: int, target_position: int, number: int):
+        """cutter cut number at target's position; both cables are revealed"""
+        self.apply(("successful_cut", cutter, cutter_position, target, target_position, number))
+
+    def failed_cut(self, target: int, position: int, number: int):
+        """A cut of number at target's position failed: that cable is not number"""
+        self.apply(("failed_cut", target, position, number))
+
+    def distribution(self, player: int) -> list[list[float]]:
+        """Return result[i][j] = P(number i+1 at position j of player | all events so far)"""
+        self._require_deal()
+        if not 0 <= player < self.number_of_players:
+            raise ValueError(f"Invalid player: {player}")
+        if self._posteriors is None:
+            self._posteriors = self._compute_posteriors()
+        return [list(probs) for probs in self._posteriors[player]]
+
+    def distributions(self) -> list[list[list[float]]]:
+        """Return the distribution of every player"""
+        return [self.distribution(player) for player in range(self.number_of_players)]
+
+    def _apply_deal(self, player_cables: list[int], cable_counts: list[int] | None):
+        if self.player_cables is not None:
+            raise ValueError("Cables have already been dealt!")
+        T = self.available_numbers * self.number_instances
+        if cable_counts is None:
+            # Split the remaining cables evenly, extra cables go to the first seats
+            P_remaining = self.number_of_players - 1
+            T_remaining = T - len(player_cables)
+            cable_counts = [len(player_cables)]
+            for p in range(P_remaining):
+                cable_counts.append(T_remaining // P_remaining + (1 if p < T_remaining % P_remaining else 0))
+        if len(cable_counts) != self.number_of_players or sum(cable_counts) != T:
+            raise ValueError("Cable counts must cover every cable exactly once!")
+        if cable_counts[0] != len(player_cables):
+            raise ValueError("Our cable count doesn't match our cables!")
+        for number in set(player_cables):
+            if not 1 <= number <= self.available_numbers or player_cables.count(number) > self.number_instances:
+                raise ValueError("Invalid player cables!")
+        self.player_cables = sorted(player_cables)
+        self.cable_counts = list(cable_counts)
+        self._invalidate(None, range(self.available_numbers))
+
+    def _apply_reveal(self, player: int, position: int, number: int):
+        self._check_reveal(player, position, number)
+        self._store_reveal(player, position, number)
+
+    def _apply_successful_cut(self, cutter: int, cutter_position: int, target: int,
+                              target_position: int, number: int):
+        # Validate both cables first so that a rejected cut leaves the state untouched
+        self._check_reveal(cutter, cutter_position, number)
+        self._check_reveal(target, target_position, number)
+        self._store_reveal(cutter, cutter_position, number)
+        self._store_reveal(target, target_position, number)
+
+    def _check_reveal(self, player: int, position: int, number: int):
+        self._require_deal()
+        self._check_position(player, position)
+        if player == 0:
+            if self.player_cables[position] != number:
+                raise ValueError(f"Our cable at position {position} is not {number}!")
+        elif self.revealed[player].get(position, number) != number:
+            raise ValueError(f"Position {position} of player {player} was already revealed!")
+
+    def _store_reveal(self, player: int, position: int, number: int):
+        if position in self.revealed[player]:
+            return
+        self.revealed[player][position] = number
+        if player != 0:
+            self._invalidate(player, [number - 1])
+
+    def _apply_failed_cut(self, target: int, position: int, number: int):
+        self._require_deal()
+        self._check_position(target, position)
+        if target == 0:
+            if self.player_cables[position] == number:
+                raise ValueError(f"Our cable at position {position} is {number}!")
+            return
+        if (position, number) in self.excluded[target]:
+            return
+        self.excluded[target].add((position, number))
+        self._invalidate(target, [number - 1])
+
+    def _invalidate(self, player: int | None, layers):
+        """Forget everything that depends on player's constraints on the given layers"""
+        if player is None:
+            self._steps.clear()
+        else:
+            self._steps.pop(player, None)
+        for n in layers:
+            self._layers.pop(n, None)
+            self._forward_valid = min(self._forward_valid, n)
+            self._backward_valid = max(self._backward_valid, n + 1)
+        self._posteriors = None
+
+    def _compute_posteriors(self) -> list[list[list[float]]]:
+        N = self.available_numbers
+        # We know our own cables
+        posteriors = [[[1.0 if cable == number + 1 else 0.0 for cable in self.player_cables]
+                       for number in range(N)]]
+        others = self.cable_counts[1:]
+        if not others:
+            return posteriors
+
+        forward, backward = self._messages()
+        # Count at every position how often a number's block of cables covers it
+        coverage = [np.zeros((N, c + 1 + self.number_instances)) for c in others]
+        for n in range(N):
+            total = 0.0
+            for x, term in self._layer(n):
+                mass = forward[n] * term * self._shift_down(backward[n + 1], x[:-1])
+                total += mass.sum()
+                for p, c in enumerate(others[:-1]):
+                    axes = tuple(axis for axis in range(mass.ndim) if axis != p)
+                    at_start = mass.sum(axis=axes)
+                    coverage[p][n, :c + 1] += at_start
+                    coverage[p][n, x[p]:x[p] + c + 1] -= at_start
+                # The last player starts after the cables of everybody else
+                last_start = np.clip(self._last_start(n), 0, others[-1])
+                at_start = np.bincount(last_start.ravel(), weights=mass.ravel(),
+                                       minlength=others[-1] + 1)[:others[-1] + 1]
+                coverage[-1][n, :others[-1] + 1] += at_start
+                coverage[-1][n, x[-1]:x[-1] + others[-1] + 1] -= at_start
+            if total == 0:
+                raise ValueError("The events contradict each other!")
+            for p in range(len(others)):
+                coverage[p][n] /= total
+        for p, c in enumerate(others):
+            posteriors.append(np.clip(np.cumsum(coverage[p], axis=1)[:, :c], 0.0, 1.0).tolist())
+        return posteriors
+
+    def _messages(self) -> tuple[list[np.ndarray], list[np.ndarray]]:
+        """Bring the forward and backward messages up to date and return them"""
+        N = self.available_numbers
+        others = self.cable_counts[1:]
+        shape = tuple(c + 1 for c in others[:-1])
+        if not self._forward:
+            self._forward = [np.zeros(shape) for _ in range(N + 1)]
+            self._forward[0][(0,) * len(shape)] = 1.0
+            self._backward = [np.zeros(shape) for _ in range(N + 1)]
+            self._backward[N][tuple(others[:-1])] = 1.0
+
+        for n in range(self._forward_valid, N):
+            message = np.zeros(shape)
+            for x, term in self._layer(n):
+                self._shift_up(message, self._forward[n] * term, x[:-1])
+            if message.sum() == 0:
+                raise ValueError("The events contradict each other!")
+            # Only ratios matter; normalizing keeps the weights in range
+            self._forward[n + 1] = message / message.sum()
+        self._forward_valid = N
+
+        for n in reversed(range(self._backward_valid)):
+            message = np.zeros(shape)
+            for x, term in self._layer(n):
+                message += term * self._shift_down(self._backward[n + 1], x[:-1])
+            self._backward[n] = message / max(message.max(), np.finfo(float).tiny)
+        self._backward_valid = 0
+        return self._forward, self._backward
+
+    def _layer(self, n: int) -> list[tuple[tuple[int, ...], np.ndarray]]:
+        """
+        Transitions of number n+1: one (x, term) pair per way x of splitting its
+        remaining cables among players 1..P-1, term[s] weights it from state s
+        """
+        if n in self._layers:
+            return self._layers[n]
+        others = self.cable_counts[1:]
+        remaining = self.number_instances - self.player_cables.count(n + 1)
+        last_start = self._last_start(n)
+        in_range = (last_start >= 0) & (last_start <= others[-1])
+        log_factorial = get_kernel(self.available_numbers * self.number_instances).log_factorial
+        transitions = []
+        for head in itertools.product(range(remaining + 1), repeat=len(others) - 1):
+            x = head + (remaining - sum(head),)
+            if x[-1] < 0:
+                continue
+            # Deck orders that deal this split, up to a constant
+            weight = math.exp(log_factorial(remaining) - sum(log_factorial(k) for k in x))
+            term = np.full(last_start.shape, weight)
+            for p, c in enumerate(others[:-1]):
+                allowed = self._allowed_starts(p + 1, n, x[p])
+                term = term * allowed.reshape([-1 if axis == p else 1 for axis in range(term.ndim)])
+            allowed = self._allowed_starts(len(others), n, x[-1])
+            term = term * np.where(in_range, allowed[np.clip(last_start, 0, others[-1])], False)
+            if term.any():
+                transitions.append((x, term))
+        self._layers[n] = transitions
+        return transitions
+
+    def _allowed_starts(self, player: int, n: int, k: int) -> np.ndarray:
+        """Which first positions allow player to hold k cables of number n+1"""
+        if player not in self._steps:
+            remaining = [self.number_instances - self.player_cables.count(m + 1)
+                         for m in range(self.available_numbers)]
+            self._steps[player] = _revealed_steps(
+                remaining, self.cable_counts[player], self.revealed[player], self.excluded[player])
+        s_lo, s_hi, e_lo, e_hi, block = self._steps[player][n]
+        starts = np.arange(self.cable_counts[player] + 1)
+        ends = starts + k
+        inside = (s_lo <= starts) & (starts <= s_hi) & (e_lo <= ends) & (ends <= e_hi)
+        allowed = np.zeros(len(starts), dtype=bool)
+        allowed[inside] = block[starts[inside] - s_lo, ends[inside] - e_lo] > 0.0
+        return allowed
+
+    def _last_start(self, n: int) -> np.ndarray:
+        """How many cables below n+1 the last player holds, for every DP state"""
+        others = self.cable_counts[1:]
+        placed = sum(self.number_instances - self.player_cables.count(m + 1) for m in range(n))
+        grid = np.indices(tuple(c + 1 for c in others[:-1]))
+        return placed - grid.sum(axis=0)
+
+    @staticmethod
+    def _shift_up(target: np.ndarray, values: np.ndarray, shift: tuple[int, ...]):
+        """target[s + shift] += values[s], dropping what falls off the grid"""
+        target[tuple(slice(k, None) for k in shift)] += \
+            values[tuple(slice(0, size - k) for size, k in zip(values.shape, shift))]
+
+    @staticmethod
+    def _shift_down(values: np.ndarray, shift: tuple[int, ...]) -> np.ndarray:
+        """Return result[s] = values[s + shift], zero off the grid"""
+        result = np.zeros_like(values)
+        result[tuple(slice(0, size - k) for size, k in zip(values.shape, shift))] = \
+            values[tuple(slice(k, None) for k in shift)]
+        return result
+
+    def _require_deal(self):
+        if self.player_cables is None:
+            raise ValueError("No cables have been dealt yet!")
+
+    def _check_position(self, player: int, position: int):
+        if not 0 <= player < self.number_of_players:
+            raise ValueError(f"Invalid player: {player}")
+        if not 0 <= position < self.cable_counts[player]:
+            raise ValueError(f"Player {player} has no position {position}!")
+
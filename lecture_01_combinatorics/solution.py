@@ -2,7 +2,10 @@
 Solution for Exercise 1: Basic Combinatorics
 """
 
+from base import instrumentation
 
+
+@instrumentation.instrument
 def factorial(n: int) -> int:
     """Calculate n!"""
     if n < 0:
@@ -15,6 +18,7 @@ def factorial(n: int) -> int:
     return result
 
 
+@instrumentation.instrument
 def binomial_coefficient(n: int, k: int) -> int:
     """Calculate C(n, k)"""
     if k > n or k < 0:
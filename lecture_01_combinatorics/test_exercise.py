@@ -5,6 +5,7 @@ Run this to verify your implementation:
     python lecture_01_combinatorics/test_exercise.py
 """
 
+import math
 import sys
 import os
 
@@ -13,6 +14,7 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from lecture_01_combinatorics import exercise
 from lecture_01_combinatorics import solution
+from base import combinatorics
 
 
 def test_factorial():
@@ -125,6 +127,53 @@ def test_binomial_coefficient():
     return all_passed
 
 
+def test_combinatorics_kernel():
+    """Test the shared combinatorics kernel against binomial_coefficient"""
+    print("=" * 60)
+    print("Testing combinatorics kernel")
+    print("=" * 60)
+    
+    all_passed = True
+    kernel = combinatorics.get_kernel(16)
+    
+    # Rows must match the reference solution exactly, including growth past T
+    for n in range(0, 25):
+        mismatches = [k for k in range(-1, n + 2)
+                      if kernel.binomial(n, k) != solution.binomial_coefficient(n, k)]
+        if mismatches:
+            all_passed = False
+            print(f"✗ Row {n} differs at k={mismatches}")
+    print(f"{'✓' if all_passed else '✗'} Binomial rows 0..24 match binomial_coefficient")
+    
+    # Log-factorials of a large deck must not build its Pascal triangle
+    large = combinatorics.CombinatoricsKernel(5000)
+    lazy = (abs(large.log_factorial(5000) - math.lgamma(5001)) < 1e-6
+            and len(large.log_factorial_table()) == 5001 and len(large._rows) == 1)
+    status = "✓" if lazy else "✗"
+    if not lazy:
+        all_passed = False
+    print(f"{status} Log-factorials of a 5000-cable deck skip the Pascal rows")
+    
+    # The same deck size must reuse the same kernel
+    same = combinatorics.get_kernel(16) is kernel
+    status = "✓" if same else "✗"
+    if not same:
+        all_passed = False
+    print(f"{status} get_kernel(16) returns the cached kernel")
+    
+    # Least recently used deck sizes are evicted
+    for T in range(100, 100 + combinatorics.KERNEL_CACHE_SIZE + 1):
+        combinatorics.get_kernel(T)
+    evicted = combinatorics.get_kernel(16) is not kernel
+    status = "✓" if evicted else "✗"
+    if not evicted:
+        all_passed = False
+    print(f"{status} Least recently used kernel is evicted")
+    
+    print()
+    return all_passed
+
+
 def main():
     """Run all tests"""
     print("\n" + "=" * 60)
@@ -134,6 +183,7 @@ def main():
     results = []
     results.append(("factorial", test_factorial()))
     results.append(("binomial_coefficient", test_binomial_coefficient()))
+    results.append(("combinatorics kernel", test_combinatorics_kernel()))
     
     print("=" * 60)
     print("TEST SUMMARY")
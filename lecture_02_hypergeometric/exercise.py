@@ -4,10 +4,14 @@ Exercise 2: Hypergeometric Distribution
 Implement hypergeometric_probability function.
 """
 
+from base import instrumentation
+
 # Import binomial_coefficient from Lecture 1
 # Try importing from exercise first (your implementation), fall back to solution
 try:
     from lecture_01_combinatorics.exercise import binomial_coefficient
+    # Count the exercise's calls like the instrumented solution's
+    binomial_coefficient = instrumentation.instrument(binomial_coefficient)
 except (ImportError, NotImplementedError):
     from lecture_01_combinatorics.solution import binomial_coefficient
 
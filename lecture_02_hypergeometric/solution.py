@@ -2,19 +2,77 @@
 Solution for Exercise 2: Hypergeometric Distribution
 """
 
-from lecture_01_combinatorics.solution import binomial_coefficient
+import math
 
+import numpy as np
 
+from base import instrumentation
+from base.combinatorics import CombinatoricsKernel, get_kernel
+
+
+@instrumentation.instrument
 def hypergeometric_probability(N: int, K: int, n: int, k: int) -> float:
     """Calculate hypergeometric probability"""
     # Check for invalid inputs
     if k < 0 or k > n or k > K or (n - k) > (N - K):
         return 0.0
     
-    numerator = binomial_coefficient(K, k) * binomial_coefficient(N - K, n - k)
-    denominator = binomial_coefficient(N, n)
+    # Log-factorials come from the shared kernel for a deck of N cables
+    return math.exp(_log_hypergeometric(get_kernel(N), N, K, n, k))
+
+
+@instrumentation.instrument
+def hypergeometric_pmf(N: int, K: int, n: int | np.ndarray) -> np.ndarray:
+    """
+    Calculate the whole hypergeometric PMF for (N, K, n) at once.
+    
+    Returns an array pmf of length n+1 where pmf[k] = hypergeometric_probability(N, K, n, k).
+    If n is an array of sample sizes, returns one PMF per row, padded with zeros to
+    length max(n)+1. No big-int binomials are built: a single n walks the support with
+    the ratio recurrence, an array of n is evaluated in log space from the kernel's
+    log-factorials.
+    """
+    if np.ndim(n) == 0:
+        return _hypergeometric_pmf_recurrence(N, K, int(n))
     
-    if denominator == 0:
-        return 0.0
+    sizes = np.asarray(n, dtype=np.int64)
+    width = max(int(sizes.max(initial=-1)) + 1, 0)
+    if width == 0 or K < 0 or K > N:
+        return np.zeros((len(sizes), width))
     
-    return numerator / denominator
+    rows = sizes[:, None]
+    k = np.arange(width)[None, :]
+    # Support: k successes and n-k failures must both exist
+    valid = (rows >= 0) & (rows <= N) & (k <= rows) & (k <= K) & (rows - k <= N - K)
+    rows = np.where(valid, rows, 0)
+    k = np.where(valid, k, 0)
+    
+    log_factorial = get_kernel(N).log_factorial_table(N)
+    log_pmf = (log_factorial[K] - log_factorial[k] - log_factorial[K - k]
+               + log_factorial[N - K] - log_factorial[rows - k] - log_factorial[N - K - rows + k]
+               - log_factorial[N] + log_factorial[rows] + log_factorial[N - rows])
+    return np.where(valid, np.exp(log_pmf), 0.0)
+
+
+def _hypergeometric_pmf_recurrence(N: int, K: int, n: int) -> np.ndarray:
+    """Single-row PMF using P(k+1) / P(k) = (K-k)(n-k) / ((k+1)(N-K-n+k+1))"""
+    pmf = [0.0] * max(n + 1, 0)
+    if n < 0 or n > N or K < 0 or K > N:
+        return np.array(pmf)
+    
+    k_min = max(0, n - (N - K))
+    k_max = min(n, K)
+    # Start the walk from the first term of the support
+    p = math.exp(_log_hypergeometric(get_kernel(N), N, K, n, k_min))
+    for k in range(k_min, k_max + 1):
+        pmf[k] = p
+        p *= (K - k) * (n - k) / ((k + 1) * (N - K - n + k + 1))
+    return np.array(pmf)
+
+
+def _log_hypergeometric(kernel: CombinatoricsKernel, N: int, K: int, n: int, k: int) -> float:
+    """log P(k successes in n draws) from the kernel's log-factorials, k inside the support"""
+    log_factorial = kernel.log_factorial
+    return (log_factorial(K) - log_factorial(k) - log_factorial(K - k)
+            + log_factorial(N - K) - log_factorial(n - k) - log_factorial(N - K - n + k)
+            - log_factorial(N) + log_factorial(n) + log_factorial(N - n))
@@ -83,6 +83,45 @@ def test_hypergeometric_probability():
     return all_passed
 
 
+def test_hypergeometric_pmf():
+    """Test the batched hypergeometric_pmf against hypergeometric_probability"""
+    print("=" * 60)
+    print("Testing hypergeometric_pmf")
+    print("=" * 60)
+    
+    test_cases = [
+        (10, 5, 3),
+        (20, 10, 5),
+        (16, 4, 4),
+        (48, 12, 12),
+        (100, 50, 25),
+        (10, 0, 3),   # No successes in population
+        (10, 10, 3),  # Only successes in population
+        (5, 2, 7),    # Sample larger than population
+    ]
+    
+    all_passed = True
+    tolerance = 1e-9
+    for N, K, n in test_cases:
+        try:
+            pmf = solution.hypergeometric_pmf(N, K, n)
+            batched = solution.hypergeometric_pmf(N, K, [n, 0])[0]
+            expected = [solution.hypergeometric_probability(N, K, n, k) for k in range(n + 1)]
+            diff = max(abs(p - e) for p, e in zip(pmf, expected))
+            diff_batched = max(abs(p - e) for p, e in zip(batched, expected))
+            ok = len(pmf) == n + 1 and diff < tolerance and diff_batched < tolerance
+            status = "✓" if ok else "✗"
+            if not ok:
+                all_passed = False
+            print(f"{status} PMF for N={N}, K={K}, n={n}: max diff = {max(diff, diff_batched):.2e}")
+        except Exception as e:
+            print(f"✗ PMF for N={N}, K={K}, n={n} raised exception: {e}")
+            all_passed = False
+    
+    print()
+    return all_passed
+
+
 def main():
     """Run all tests"""
     print("\n" + "=" * 60)
@@ -91,6 +130,7 @@ def main():
     
     results = []
     results.append(("hypergeometric_probability", test_hypergeometric_probability()))
+    results.append(("hypergeometric_pmf", test_hypergeometric_pmf()))
     
     print("=" * 60)
     print("TEST SUMMARY")
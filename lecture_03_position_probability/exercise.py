@@ -4,10 +4,14 @@ Exercise 3: Position Probability
 Implement position_probability_given_cables function.
 """
 
+from base import instrumentation
+
 # Import hypergeometric_probability from Lecture 2
 # Try importing from exercise first (your implementation), fall back to solution
 try:
     from lecture_02_hypergeometric.exercise import hypergeometric_probability
+    # Count the exercise's calls like the instrumented solution's
+    hypergeometric_probability = instrumentation.instrument(hypergeometric_probability)
 except (ImportError, NotImplementedError):
     from lecture_02_hypergeometric.solution import hypergeometric_probability
 
@@ -2,9 +2,14 @@
 Solution for Exercise 3: Position Probability
 """
 
-from lecture_02_hypergeometric.solution import hypergeometric_probability
+import numpy as np
 
+from base import instrumentation
+from base.combinatorics import get_kernel
+from lecture_02_hypergeometric.solution import hypergeometric_pmf
 
+
+@instrumentation.instrument
 def position_probability_given_cables(M: int, T: int, c: int, j: int, 
                                       smaller_numbers_count: int) -> float:
     """Calculate P(number i at position j | player has c cables)"""
@@ -12,6 +17,8 @@ def position_probability_given_cables(M: int, T: int, c: int, j: int,
         return 0.0
     
     probability = 0.0
+    # Every term below uses the same deck size, so fetch its kernel once
+    kernel = get_kernel(T)
     
     # Sum over all possible values of k (number of cables of number i)
     for k in range(1, min(M, c) + 1):
@@ -22,7 +29,7 @@ def position_probability_given_cables(M: int, T: int, c: int, j: int,
         
         for s in range(s_min, s_max + 1):
             # P(player has exactly s cables of smaller numbers)
-            prob_s_smaller = hypergeometric_probability(T, smaller_numbers_count, c, s)
+            prob_s_smaller = kernel.hypergeometric(T, smaller_numbers_count, c, s)
             
             # Given s cables of smaller numbers, remaining = c - s
             # Remaining population = T - smaller_numbers_count
@@ -35,10 +42,183 @@ def position_probability_given_cables(M: int, T: int, c: int, j: int,
                 continue
             
             # P(exactly k cables of number i | s smaller cables)
-            prob_k_i = hypergeometric_probability(remaining_total, M, remaining_cables, k)
+            prob_k_i = kernel.hypergeometric(remaining_total, M, remaining_cables, k)
             
             # Given s smaller and k of number i, number i occupies positions s..s+k-1
             # So position j contains number i with probability 1 (since s ≤ j < s+k)
             probability += prob_s_smaller * prob_k_i
+            if instrumentation.ENABLED:
+                instrumentation.count("position_probability_given_cables.terms")
+                if prob_s_smaller * prob_k_i == 0.0:
+                    instrumentation.count("position_probability_given_cables.zero_terms")
     
     return probability
+
+
+@instrumentation.instrument
+def position_probabilities_given_cables(M: int, T: int, c: int,
+                                        smaller_numbers_count: int) -> np.ndarray:
+    """
+    Calculate P(number i at position j | player has c cables) for every position j at once.
+    
+    Only the counts of smaller and larger cables matter, so this is the middle row of
+    position_distribution_given_cables for a deck of three "numbers": the smaller cables,
+    the M cables of number i and the larger cables. Returns an array of length c.
+    """
+    if c <= 0:
+        return np.zeros(0)
+    larger_numbers_count = T - smaller_numbers_count - M
+    return position_distribution_given_cables([smaller_numbers_count, M, larger_numbers_count], c)[1]
+
+
+@instrumentation.instrument
+def position_distribution_given_cables(instances: list[int], c: int) -> np.ndarray:
+    """
+    Calculate P(number i+1 at position j | player has c cables) for every number and position.
+    
+    instances[i] is how many cables of number i+1 are in the deck, so T = sum(instances).
+    Returns an array of shape (len(instances), c).
+    
+    Instead of summing over (k, s) per cell, count the cables that are at most number i+1:
+    X_i ~ Hypergeometric(T, instances[0] + ... + instances[i], c). Position j holds a number
+    <= i+1 exactly when X_i >= j+1, so
+        P(number i+1 at position j) = P(X_i >= j+1) - P(X_{i-1} >= j+1)
+    and one PMF per number is enough for the whole matrix.
+    """
+    T = sum(instances)
+    distribution = np.zeros((len(instances), max(c, 0)))
+    if c <= 0 or c > T:
+        return distribution
+    
+    # Row i: PMF of X_i, the number of cables <= i+1 in the hand
+    pmf = np.empty((len(instances), c + 1))
+    cumulative = 0
+    for i, count in enumerate(instances):
+        cumulative += count
+        pmf[i] = hypergeometric_pmf(T, cumulative, c)
+    
+    return position_distribution_from_pmfs(pmf)
+
+
+@instrumentation.instrument
+def position_distribution_from_pmfs(pmf: np.ndarray) -> np.ndarray:
+    """
+    Turn the PMFs of X_i (cables <= i+1 in a hand of c cables), one row per number,
+    into the (number, position) distribution of that hand.
+    """
+    # at_most[i][j] = P(position j holds a number <= i+1) = P(X_i >= j+1)
+    at_most = np.cumsum(pmf[:, ::-1], axis=1)[:, ::-1][:, 1:]
+    
+    distribution = np.empty_like(at_most)
+    distribution[:1] = at_most[:1]
+    distribution[1:] = np.diff(at_most, axis=0)
+    # Differences of equal tails can come out as -1e-17
+    return np.clip(distribution, 0.0, 1.0)
+
+
+@instrumentation.instrument
+def position_distribution_given_revealed(instances: list[int], c: int, revealed: dict[int, int],
+                                         excluded=None) -> np.ndarray:
+    """
+    Calculate P(number i+1 at position j | player has c cables, revealed) for every number and position.
+    
+    revealed maps positions of the sorted hand to their publicly known number. excluded is an
+    optional collection of (position, number) pairs that are known NOT to hold, e.g. from failed
+    cuts. Returns an array of shape (len(instances), c); revealed positions come out as certainties.
+    
+    The numbers are processed in order with a dynamic program over s, the number of cables
+    placed so far. Number i+1 with k cables occupies positions s..s+k-1, and a hand with k_i
+    cables of number i+1 has weight prod_i C(instances[i], k_i). The revealed positions cut the
+    hand into segments: number i+1 has to start after every revealed smaller number, cover every
+    revealed i+1 and end before every revealed larger number. So each step only works on a
+    window of start and end positions, and every revealed position shrinks the windows.
+    An exclusion of number i+1 at position j removes the placements with s <= j < s+k from that
+    number's block, which keeps the cost at O(N * c^2) for any number of exclusions.
+    """
+    N = len(instances)
+    distribution = np.zeros((N, max(c, 0)))
+    if c <= 0 or c > sum(instances):
+        return distribution
+    for position, number in revealed.items():
+        if not 0 <= position < c or not 1 <= number <= N:
+            raise ValueError(f"Invalid revealed cable {number} at position {position}!")
+    excluded = set(excluded or ())
+    for position, number in excluded:
+        if not 0 <= position < c or not 1 <= number <= N:
+            raise ValueError(f"Invalid excluded cable {number} at position {position}!")
+    
+    steps = _revealed_steps(instances, c, revealed, excluded)
+    
+    # forward[i][s]: weight of placing the first s cables with numbers 1..i
+    forward = np.zeros((N + 1, c + 1))
+    forward[0, 0] = 1.0
+    for i, (s_lo, s_hi, e_lo, e_hi, block) in enumerate(steps):
+        forward[i + 1, e_lo:e_hi + 1] = forward[i, s_lo:s_hi + 1] @ block
+        _rescale(forward[i + 1])
+    
+    # backward[i][s]: weight of filling positions s..c-1 with numbers i+1..N
+    backward = np.zeros((N + 1, c + 1))
+    backward[N, c] = 1.0
+    for i in reversed(range(N)):
+        s_lo, s_hi, e_lo, e_hi, block = steps[i]
+        backward[i, s_lo:s_hi + 1] = block @ backward[i + 1, e_lo:e_hi + 1]
+        _rescale(backward[i])
+    
+    positions = np.arange(c)
+    for i, (s_lo, s_hi, e_lo, e_hi, block) in enumerate(steps):
+        # joint[s, e]: weight of number i+1 occupying positions s..e-1
+        joint = np.zeros((c + 1, c + 1))
+        joint[s_lo:s_hi + 1, e_lo:e_hi + 1] = (
+            forward[i, s_lo:s_hi + 1, None] * block * backward[i + 1, None, e_lo:e_hi + 1])
+        total = joint.sum()
+        if total == 0.0:
+            raise ValueError("No hand is consistent with the revealed and excluded cables!")
+        # Position j is covered when s <= j < e
+        started = np.cumsum(joint, axis=0)
+        not_ended = np.cumsum(started[:, ::-1], axis=1)[:, ::-1]
+        distribution[i] = not_ended[positions, positions + 1] / total
+    
+    return np.clip(distribution, 0.0, 1.0)
+
+
+def _revealed_steps(instances: list[int], c: int, revealed: dict[int, int],
+                    excluded: set[tuple[int, int]]) -> list[tuple]:
+    """
+    Per number: the window [s_lo, s_hi] of start positions, [e_lo, e_hi] of end positions
+    and the block of transition weights C(instances[i], e - s) inside those windows, with
+    the placements covering an excluded position set to 0.
+    """
+    kernel = get_kernel(sum(instances))
+    steps = []
+    for i, count in enumerate(instances):
+        number = i + 1
+        smaller = [j for j, value in revealed.items() if value < number]
+        equal = [j for j, value in revealed.items() if value == number]
+        larger = [j for j, value in revealed.items() if value > number]
+        
+        e_hi = min(larger, default=c)
+        s_lo = max(smaller, default=-1) + 1
+        s_hi = min(min(equal, default=c), e_hi)
+        e_lo = max(max(equal, default=-1) + 1, s_lo)
+        
+        if s_lo > s_hi or e_lo > e_hi:
+            # Contradicting reveals: keep an empty window so every weight becomes 0
+            steps.append((0, 0, 0, 0, np.zeros((1, 1))))
+            continue
+        
+        weights = np.array([float(kernel.binomial(count, k)) for k in range(count + 1)])
+        k = np.arange(e_lo, e_hi + 1)[None, :] - np.arange(s_lo, s_hi + 1)[:, None]
+        block = np.where((k >= 0) & (k <= count), weights[np.clip(k, 0, count)], 0.0)
+        for position, value in excluded:
+            if value == number:
+                # Placements with s <= position < e
+                block[:max(0, position - s_lo + 1), max(0, position + 1 - e_lo):] = 0.0
+        steps.append((s_lo, s_hi, e_lo, e_hi, block))
+    return steps
+
+
+def _rescale(weights: np.ndarray):
+    """Keep the DP weights in floating-point range; only their ratios matter"""
+    largest = weights.max()
+    if largest > 0.0:
+        weights /= largest
@@ -7,6 +7,9 @@ Run this to verify your implementation:
 
 import sys
 import os
+import json
+import subprocess
+from itertools import combinations
 
 # Add parent directory to path
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -91,6 +94,195 @@ def test_position_probability_given_cables():
     return all_passed
 
 
+def test_position_probabilities_given_cables():
+    """Test the all-positions variant against position_probability_given_cables"""
+    print("=" * 60)
+    print("Testing position_probabilities_given_cables")
+    print("=" * 60)
+    
+    test_cases = [
+        # (M, T, c, smaller_count)
+        (4, 16, 4, 0),
+        (4, 16, 4, 8),
+        (4, 16, 5, 12),
+        (4, 48, 12, 20),
+        (3, 31, 8, 9),
+        (5, 100, 25, 45),
+        (5, 10, 3, 0),  # More instances than cables
+    ]
+    
+    all_passed = True
+    tolerance = 1e-9
+    for M, T, c, smaller_count in test_cases:
+        try:
+            result = solution.position_probabilities_given_cables(M, T, c, smaller_count)
+            expected = [solution.position_probability_given_cables(M, T, c, j, smaller_count)
+                        for j in range(c)]
+            diff = max(abs(r - e) for r, e in zip(result, expected))
+            ok = len(result) == c and diff < tolerance
+            status = "✓" if ok else "✗"
+            if not ok:
+                all_passed = False
+            print(f"{status} M={M}, T={T}, c={c}, smaller={smaller_count}: max diff = {diff:.2e}")
+        except Exception as e:
+            print(f"✗ M={M}, T={T}, c={c}, smaller={smaller_count} raised exception: {e}")
+            all_passed = False
+    
+    print()
+    return all_passed
+
+
+def test_position_distribution_given_cables():
+    """Test the whole-matrix engine against position_probability_given_cables"""
+    print("=" * 60)
+    print("Testing position_distribution_given_cables")
+    print("=" * 60)
+    
+    test_cases = [
+        # (instances, c)
+        ([4, 4, 4, 4], 4),
+        ([4, 4, 4, 4], 5),
+        ([4] * 12, 12),
+        ([2, 0, 3, 4, 1, 0, 4], 5),  # Uneven counts after removing known cables
+        ([5] * 20, 25),
+    ]
+    
+    all_passed = True
+    tolerance = 1e-9
+    for instances, c in test_cases:
+        try:
+            result = solution.position_distribution_given_cables(instances, c)
+            T = sum(instances)
+            diff = 0.0
+            for i, M in enumerate(instances):
+                for j in range(c):
+                    expected = solution.position_probability_given_cables(M, T, c, j, sum(instances[:i]))
+                    diff = max(diff, abs(result[i][j] - expected))
+            ok = result.shape == (len(instances), c) and diff < tolerance
+            status = "✓" if ok else "✗"
+            if not ok:
+                all_passed = False
+            print(f"{status} instances={instances}, c={c}: max diff = {diff:.2e}")
+        except Exception as e:
+            print(f"✗ instances={instances}, c={c} raised exception: {e}")
+            all_passed = False
+    
+    print()
+    return all_passed
+
+
+def test_position_distribution_given_revealed():
+    """Test the revealed/excluded-position DP against enumerating every hand"""
+    print("=" * 60)
+    print("Testing position_distribution_given_revealed")
+    print("=" * 60)
+    
+    test_cases = [
+        # (instances, c, revealed, excluded)
+        ([4, 4, 4, 4], 5, {}, set()),
+        ([4, 4, 4, 4], 5, {2: 3}, set()),
+        ([2, 3, 1, 3, 2], 5, {1: 2, 3: 4}, set()),
+        ([2, 0, 3, 4, 1, 0, 4], 6, {0: 1, 5: 7}, set()),
+        ([3, 3, 3], 4, {1: 2, 2: 2}, set()),
+        ([4, 4, 4, 4], 5, {}, {(2, 3)}),  # Failed cuts only
+        ([4, 4, 4, 4], 5, {}, {(0, 1), (2, 2), (4, 4)}),
+        ([2, 3, 1, 3, 2], 5, {3: 4}, {(1, 2), (0, 1)}),
+    ]
+    
+    all_passed = True
+    tolerance = 1e-9
+    for instances, c, revealed, excluded in test_cases:
+        try:
+            result = solution.position_distribution_given_revealed(instances, c, revealed, excluded)
+            deck = [number + 1 for number, count in enumerate(instances) for _ in range(count)]
+            expected = [[0.0] * c for _ in instances]
+            hands = 0
+            for indices in combinations(range(len(deck)), c):
+                hand = sorted(deck[index] for index in indices)
+                if (all(hand[j] == number for j, number in revealed.items())
+                        and all(hand[j] != number for j, number in excluded)):
+                    hands += 1
+                    for j, number in enumerate(hand):
+                        expected[number - 1][j] += 1
+            diff = max(abs(result[i][j] - expected[i][j] / hands)
+                       for i in range(len(instances)) for j in range(c))
+            ok = result.shape == (len(instances), c) and diff < tolerance
+            status = "✓" if ok else "✗"
+            if not ok:
+                all_passed = False
+            print(f"{status} instances={instances}, c={c}, revealed={revealed}, excluded={excluded}: "
+                  f"max diff = {diff:.2e}")
+        except Exception as e:
+            print(f"✗ instances={instances}, c={c}, revealed={revealed}, excluded={excluded} "
+                  f"raised exception: {e}")
+            all_passed = False
+    
+    try:
+        solution.position_distribution_given_revealed([4, 4, 4, 4], 5, {1: 3, 3: 2})
+        print("✗ Out-of-order reveals did not raise")
+        all_passed = False
+    except ValueError:
+        print("✓ Out-of-order reveals raise ValueError")
+    
+    print()
+    return all_passed
+
+
+def test_instrumentation():
+    """Test the opt-in counters: nothing wrapped by default, calls and terms counted when enabled"""
+    print("=" * 60)
+    print("Testing instrumentation")
+    print("=" * 60)
+    
+    all_passed = True
+    from base import instrumentation
+    wrapped = hasattr(solution.position_probability_given_cables, "__wrapped__")
+    ok = wrapped == instrumentation.ENABLED
+    status = "✓" if ok else "✗"
+    if not ok:
+        all_passed = False
+    print(f"{status} Functions are wrapped only when instrumentation is enabled (wrapped={wrapped})")
+    
+    # The switch is read at import time, so record in a fresh interpreter
+    script = (
+        "import json\n"
+        "from base import instrumentation\n"
+        "from lecture_03_position_probability import solution\n"
+        "with instrumentation.recording() as recording:\n"
+        "    for i in range(4):\n"
+        "        for j in range(6):\n"
+        "            solution.position_probability_given_cables(4, 16, 6, j, 4 * i)\n"
+        "print(json.dumps(recording.stats))\n"
+    )
+    env = dict(os.environ, **{instrumentation.ENV_VARIABLE: "1"})
+    try:
+        output = subprocess.run([sys.executable, "-c", script], env=env, capture_output=True, text=True,
+                                cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__))), check=True)
+        stats = json.loads(output.stdout)
+        name = "lecture_03_position_probability.solution.position_probability_given_cables"
+        checks = [
+            ("24 calls of position_probability_given_cables", stats["functions"][name]["calls"] == 24),
+            ("Kernel hypergeometric calls counted",
+             stats["functions"]["base.combinatorics.CombinatoricsKernel.hypergeometric"]["calls"]
+             == 2 * stats["counters"]["position_probability_given_cables.terms"]),
+            ("Zero terms counted",
+             0 < stats["counters"]["position_probability_given_cables.zero_terms"]
+             < stats["counters"]["position_probability_given_cables.terms"]),
+            ("Kernel cache lookups counted", stats["caches"]["combinatorics.kernels"]["hits"] > 0),
+        ]
+        for label, ok in checks:
+            status = "✓" if ok else "✗"
+            if not ok:
+                all_passed = False
+            print(f"{status} {label}")
+    except Exception as e:
+        print(f"✗ Instrumented run raised exception: {e}")
+        all_passed = False
+    
+    print()
+    return all_passed
+
+
 def main():
     """Run all tests"""
     print("\n" + "=" * 60)
@@ -99,6 +291,10 @@ def main():
     
     results = []
     results.append(("position_probability_given_cables", test_position_probability_given_cables()))
+    results.append(("position_probabilities_given_cables", test_position_probabilities_given_cables()))
+    results.append(("position_distribution_given_cables", test_position_distribution_given_cables()))
+    results.append(("position_distribution_given_revealed", test_position_distribution_given_revealed()))
+    results.append(("instrumentation", test_instrumentation()))
     
     print("=" * 60)
     print("TEST SUMMARY")
@@ -4,10 +4,14 @@ Exercise 4: Exact Distribution
 Implement exact_distribution function.
 """
 
+from base import instrumentation
+
 # Import position_probability_given_cables from Lecture 3
 # Try importing from exercise first (your implementation), fall back to solution
 try:
     from lecture_03_position_probability.exercise import position_probability_given_cables
+    # Count the exercise's calls like the instrumented solution's
+    position_probability_given_cables = instrumentation.instrument(position_probability_given_cables)
 except (ImportError, NotImplementedError):
     from lecture_03_position_probability.solution import position_probability_given_cables
 
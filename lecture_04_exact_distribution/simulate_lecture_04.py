@@ -12,11 +12,15 @@ import os
 parent_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 sys.path.insert(0, parent_dir)
 
+from base import instrumentation
 from simulate_base import GameSimulationBase
+from lecture_04_exact_distribution.solution import cached_exact_distribution
 
 # Try importing from exercise first, fall back to solution
 try:
     from lecture_04_exact_distribution.exercise import exact_distribution
+    # Count the exercise's calls like the instrumented solution's
+    exact_distribution = instrumentation.instrument(exact_distribution)
 except (ImportError, NotImplementedError):
     from lecture_04_exact_distribution.solution import exact_distribution
 
@@ -26,22 +30,17 @@ class GameSimulationLecture04(GameSimulationBase):
     
     def __init__(self):
         super().__init__()
-        self.distribution = None
         
     def sample_new_game(self, P=None, N=None, M=None):
-        """Sample a new game and calculate unconditional distribution"""
+        """Sample a new game"""
         super().sample_new_game(P, N, M)
-        # Calculate unconditional distribution (same for all players)
-        self.distribution = exact_distribution(
-            self.number_of_players, 
-            self.available_numbers, 
-            self.number_instances
-        )
         self.update_display()
         
-    def get_distribution(self):
-        """Get the unconditional distribution (same for all players)"""
-        return self.distribution
+    def get_distribution(self, player_idx=None):
+        """Get the unconditional distribution (same for all players), reused across games"""
+        # Read the configuration once: a new game may be dealt while the worker computes
+        P, N, M = self.number_of_players, self.available_numbers, self.number_instances
+        return cached_exact_distribution(P, N, M, compute=exact_distribution)
         
     def get_info_text(self):
         """Get information text for the info panel"""
@@ -76,6 +75,7 @@ def main():
     
     sim = GameSimulationLecture04()
     sim.create_ui()
+    instrumentation.print_report()
 
 
 if __name__ == "__main__":
@@ -13,6 +13,8 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from lecture_04_exact_distribution import exercise
 from lecture_04_exact_distribution import solution
+from base import bombusters as bb_base
+from base.cache import distribution_cache
 
 
 def test_exact_distribution():
@@ -102,6 +104,105 @@ def test_exact_distribution():
     return all_passed
 
 
+def test_sample_distribution():
+    """Test that the seeded Monte Carlo estimate matches the exact distribution"""
+    print("=" * 60)
+    print("Testing sample_distribution")
+    print("=" * 60)
+    
+    all_passed = True
+    for P, N, M in [(4, 4, 4), (3, 4, 4), (4, 12, 4)]:
+        try:
+            estimate = bb_base.sample_distribution(P, N, M, num_samples=40_000, seed=0)
+            expected = solution.exact_distribution(P, N, M)
+            diff = max(abs(estimate[n][pos] - expected[n][pos])
+                       for n in range(N) for pos in range(len(estimate[n])))
+            ok = len(estimate) == N and diff < 0.02
+            status = "✓" if ok else "✗"
+            if not ok:
+                all_passed = False
+            print(f"{status} P={P}, N={N}, M={M}: max diff to exact = {diff:.4f}")
+        except Exception as e:
+            print(f"✗ P={P}, N={N}, M={M} raised exception: {e}")
+            all_passed = False
+    
+    print()
+    return all_passed
+
+
+def test_sample_distribution_workers():
+    """Test that a seeded estimate doesn't depend on the number of worker processes"""
+    print("=" * 60)
+    print("Testing sample_distribution workers")
+    print("=" * 60)
+    
+    all_passed = True
+    P, N, M = 3, 4, 4
+    num_samples = 3 * bb_base.DEFAULT_BATCH_SIZE + 500
+    try:
+        estimators = [
+            ("sample_distribution", lambda workers: bb_base.sample_distribution(
+                P, N, M, num_samples, seed=7, workers=workers)),
+            ("sample_distribution_given_cables", lambda workers: bb_base.sample_distribution_given_cables(
+                P, N, M, 6, num_samples, seed=7, workers=workers)),
+            ("sample_distribution_given_player_cables", lambda workers: bb_base.sample_distribution_given_player_cables(
+                P, N, M, [1, 2, 2, 4, 4], num_samples, seed=7, workers=workers)),
+        ]
+        for name, estimate in estimators:
+            single = estimate(1)
+            ok = all(estimate(workers) == single for workers in (2, 3))
+            status = "✓" if ok else "✗"
+            if not ok:
+                all_passed = False
+            print(f"{status} {name}: 1, 2 and 3 workers give the same estimate")
+        
+        ok = bb_base.sample_distribution(P, N, M, num_samples, seed=8) != estimators[0][1](1)
+        status = "✓" if ok else "✗"
+        if not ok:
+            all_passed = False
+        print(f"{status} Another seed gives another estimate")
+    except Exception as e:
+        print(f"✗ Worker pool raised exception: {e}")
+        all_passed = False
+    
+    print()
+    return all_passed
+
+
+def test_cached_exact_distribution():
+    """Test that cached_exact_distribution matches exact_distribution and counts hits"""
+    print("=" * 60)
+    print("Testing cached_exact_distribution")
+    print("=" * 60)
+    
+    all_passed = True
+    cache = distribution_cache
+    cache.clear()
+    try:
+        expected = solution.exact_distribution(4, 4, 4)
+        first = solution.cached_exact_distribution(4, 4, 4)
+        first[0][0] = -1.0  # Modifying a result must not change the cached entry
+        second = solution.cached_exact_distribution(4, 4, 4)
+        
+        ok = second == expected
+        status = "✓" if ok else "✗"
+        if not ok:
+            all_passed = False
+        print(f"{status} Cached result matches exact_distribution(4, 4, 4)")
+        
+        ok = cache.hits == 1 and cache.misses == 1
+        status = "✓" if ok else "✗"
+        if not ok:
+            all_passed = False
+        print(f"{status} Counters after two calls: hits={cache.hits}, misses={cache.misses}")
+    except Exception as e:
+        print(f"✗ Cached distribution raised exception: {e}")
+        all_passed = False
+    
+    print()
+    return all_passed
+
+
 def main():
     """Run all tests"""
     print("\n" + "=" * 60)
@@ -110,6 +211,9 @@ def main():
     
     results = []
     results.append(("exact_distribution", test_exact_distribution()))
+    results.append(("sample_distribution", test_sample_distribution()))
+    results.append(("sample_distribution_workers", test_sample_distribution_workers()))
+    results.append(("cached_exact_distribution", test_cached_exact_distribution()))
     
     print("=" * 60)
     print("TEST SUMMARY")
@@ -12,11 +12,15 @@ import os
 parent_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 sys.path.insert(0, parent_dir)
 
+from base import instrumentation
 from simulate_base import GameSimulationBase
+from lecture_05_distribution_given_cable_count.solution import cached_exact_distribution_given_cable_count
 
 # Try importing from exercise first, fall back to solution
 try:
     from lecture_05_distribution_given_cable_count.exercise import exact_distribution_given_cable_count
+    # Count the exercise's calls like the instrumented solution's
+    exact_distribution_given_cable_count = instrumentation.instrument(exact_distribution_given_cable_count)
 except (ImportError, NotImplementedError):
     from lecture_05_distribution_given_cable_count.solution import exact_distribution_given_cable_count
 
@@ -26,31 +30,27 @@ class GameSimulationLecture05(GameSimulationBase):
     
     def __init__(self):
         super().__init__()
-        self.distributions = {}  # Cache distributions by cable count
         
     def sample_new_game(self, P=None, N=None, M=None):
-        """Sample a new game and clear distribution cache"""
+        """Sample a new game"""
         super().sample_new_game(P, N, M)
-        self.distributions = {}
         self.update_display()
         
-    def get_distribution(self):
-        """Get distribution for selected player given their cable count"""
-        if self.game is None or self.selected_player < 0 or self.selected_player >= self.number_of_players:
+    def get_distribution(self, player_idx=None):
+        """Get distribution for a player (selected player if None) given their cable count"""
+        if player_idx is None:
+            player_idx = self.selected_player
+        # Read the game once: a new game may be dealt while the worker computes
+        game = self.game
+        P, N, M = self.number_of_players, self.available_numbers, self.number_instances
+        if game is None or player_idx < 0 or player_idx >= len(game):
             return None
             
-        cable_count = len(self.game[self.selected_player])
+        cable_count = len(game[player_idx])
         
-        # Cache distributions by cable count
-        if cable_count not in self.distributions:
-            self.distributions[cable_count] = exact_distribution_given_cable_count(
-                self.number_of_players, 
-                self.available_numbers, 
-                self.number_instances, 
-                cable_count
-            )
-        
-        return self.distributions[cable_count]
+        # Cached by (N, M, cable count), shared across games
+        return cached_exact_distribution_given_cable_count(
+            P, N, M, cable_count, compute=exact_distribution_given_cable_count)
         
     def get_info_text(self):
         """Get information text for the info panel"""
@@ -88,6 +88,7 @@ def main():
     
     sim = GameSimulationLecture05()
     sim.create_ui()
+    instrumentation.print_report()
 
 
 if __name__ == "__main__":
@@ -2,34 +2,47 @@
 Solution for Exercise 5: Distribution Given Cable Count
 """
 
-from lecture_03_position_probability.solution import position_probability_given_cables
+from base import instrumentation
+from base.cache import distribution_cache, distribution_key
+from lecture_03_position_probability.solution import (
+    position_distribution_given_cables,
+    position_distribution_given_revealed
+)
 
 
+@instrumentation.instrument
 def exact_distribution_given_cable_count(number_of_players: int, available_numbers: int, 
-                                    number_instances: int, cables: int) -> list[list[float]]:
+                                    number_instances: int, cables: int,
+                                    revealed: dict[int, int] | None = None,
+                                    excluded=None) -> list[list[float]]:
     """
     Calculate exact probability distribution given that a player has exactly c cables.
+    
+    revealed optionally maps positions of the player's hand to publicly known numbers,
+    excluded holds (position, number) pairs known not to hold (e.g. failed cuts).
     """
-    T = available_numbers * number_instances  # Total cables
     c = cables  # Number of cables the player has
     
-    # Maximum position index (player has exactly c cables, so positions 0 to c-1)
-    max_position = c
-    
-    # Initialize result: one list per number, one probability per position
-    distribution = []
+    # Every number has the same number of instances; the player has exactly c cables,
+    # so the matrix covers positions 0 to c-1
+    instances = [number_instances] * available_numbers
+    if revealed or excluded:
+        distribution = position_distribution_given_revealed(instances, c, revealed or {}, excluded)
+    else:
+        distribution = position_distribution_given_cables(instances, c)
     
-    for number in range(available_numbers):
-        probs = []
-        M = number_instances  # Number of instances of this number
-        # Numbers are 1-indexed (1, 2, 3, 4), so number i (0-indexed) has i numbers before it
-        smaller_numbers_count = number * number_instances
-        
-        for position in range(max_position):
-            # Calculate probability directly using position_probability_given_cables
-            prob = position_probability_given_cables(M, T, c, position, smaller_numbers_count)
-            probs.append(prob)
-        
-        distribution.append(probs)
+    return distribution.tolist()
+
+
+def cached_exact_distribution_given_cable_count(number_of_players: int, available_numbers: int,
+                                                number_instances: int, cables: int,
+                                                compute=exact_distribution_given_cable_count) -> list[list[float]]:
+    """
+    Same as exact_distribution_given_cable_count, memoized in the shared distribution_cache.
     
-    return distribution
+    The result does not depend on the number of players, so the key is (N, M, c).
+    compute can be another implementation with the same signature (e.g. the exercise).
+    """
+    key = distribution_key(compute, available_numbers, number_instances, cables)
+    return distribution_cache.get(key, lambda: compute(
+        number_of_players, available_numbers, number_instances, cables))
@@ -13,6 +13,7 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from lecture_05_distribution_given_cable_count import exercise
 from lecture_05_distribution_given_cable_count import solution
+from base import bombusters as bb_base
 
 
 def test_exact_distribution_given_cable_count():
@@ -101,6 +102,49 @@ def test_exact_distribution_given_cable_count():
     return all_passed
 
 
+def test_sample_distribution_given_cables():
+    """Test that the seat-conditioned Monte Carlo estimate matches the exact distribution"""
+    print("=" * 60)
+    print("Testing sample_distribution_given_cables")
+    print("=" * 60)
+    
+    test_cases = [
+        (4, 4, 4, 4),   # Even split
+        (3, 4, 4, 5),   # Uneven split, short hand
+        (3, 4, 4, 6),   # Uneven split, long hand
+    ]
+    
+    all_passed = True
+    for P, N, M, c in test_cases:
+        try:
+            estimate = bb_base.sample_distribution_given_cables(P, N, M, c, num_samples=40_000, seed=0)
+            expected = solution.exact_distribution_given_cable_count(P, N, M, c)
+            diff = max(abs(estimate[n][pos] - expected[n][pos]) for n in range(N) for pos in range(c))
+            ok = len(estimate) == N and all(len(row) == c for row in estimate) and diff < 0.02
+            status = "✓" if ok else "✗"
+            if not ok:
+                all_passed = False
+            print(f"{status} P={P}, N={N}, M={M}, c={c}: max diff to exact = {diff:.4f}")
+        except Exception as e:
+            print(f"✗ P={P}, N={N}, M={M}, c={c} raised exception: {e}")
+            all_passed = False
+    
+    # No seat holds 7 cables of a 3-player 4x4 deck
+    try:
+        estimate = bb_base.sample_distribution_given_cables(3, 4, 4, 7, num_samples=100, seed=0)
+        ok = estimate == [[0.0] * 7 for _ in range(4)]
+        status = "✓" if ok else "✗"
+        if not ok:
+            all_passed = False
+        print(f"{status} Impossible cable count gives an all-zero estimate")
+    except Exception as e:
+        print(f"✗ Impossible cable count raised exception: {e}")
+        all_passed = False
+    
+    print()
+    return all_passed
+
+
 def main():
     """Run all tests"""
     print("\n" + "=" * 60)
@@ -109,6 +153,7 @@ def main():
     
     results = []
     results.append(("exact_distribution_given_cables", test_exact_distribution_given_cable_count()))
+    results.append(("sample_distribution_given_cables", test_sample_distribution_given_cables()))
     
     print("=" * 60)
     print("TEST SUMMARY")
@@ -0,0 +1,231 @@
+"""
+Precomputed lookup table of Lecture 6 distributions.
+
+For a fixed game configuration (P, N, M) player 0 can only hold finitely many
+hands. build_lookup_table enumerates all of them, computes the distribution of
+player 1 for every cable count a player can have (one if the cables split
+evenly, two otherwise) in parallel, and stores the results in a directory of
+.npy files:
+
+    meta.json   configuration and table layout
+    keys.npy    hand code of every row
+    index.npy   open-addressing hash index: slot -> row + 1 (0 = empty)
+    table.npy   float32 distributions, shape (hands, cable counts, N, positions)
+
+LookupTable opens the files memory-mapped, so lookups are O(1) without any
+combinatorics and the table pages are shared between processes.
+"""
+
+import json
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+
+import numpy as np
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from lecture_06_distribution_given_player_cable.solution import exact_distribution_given_player_cables
+
+# Hands computed per worker task
+CHUNK_SIZE = 256
+
+_HASH_MULTIPLIER = 0x9E3779B97F4A7C15
+_MASK_64 = (1 << 64) - 1
+
+
+def enumerate_hands(available_numbers: int, number_instances: int, cables: int) -> list[tuple[int, ...]]:
+    """
+    Enumerate every hand of `cables` cables as a count vector.
+
+    counts[i] is how many cables of number i+1 the hand holds (at most number_instances).
+    """
+    hands: list[tuple[int, ...]] = []
+    counts = [0] * available_numbers
+
+    def fill(number: int, left: int):
+        if number == available_numbers - 1:
+            if left <= number_instances:
+                counts[number] = left
+                hands.append(tuple(counts))
+            return
+        # Remaining numbers must be able to hold what is left
+        capacity = (available_numbers - number - 1) * number_instances
+        for count in range(max(0, left - capacity), min(number_instances, left) + 1):
+            counts[number] = count
+            fill(number + 1, left - count)
+
+    if available_numbers > 0:
+        fill(0, cables)
+    return hands
+
+
+def hand_code(counts, number_instances: int) -> int:
+    """Encode a count vector as a mixed-radix integer with base number_instances + 1"""
+    code = 0
+    for count in reversed(counts):
+        code = code * (number_instances + 1) + int(count)
+    return code
+
+
+def _slot(code: int, bits: int) -> int:
+    """Home slot of a hand code in an index with 2**bits slots (Fibonacci hashing)"""
+    return ((code * _HASH_MULTIPLIER) & _MASK_64) >> (64 - bits)
+
+
+def _cable_counts(number_of_players: int, available_numbers: int, number_instances: int) -> list[int]:
+    """Return the possible hand sizes in this configuration: [c2], or [c2, c1] if the split is uneven"""
+    T = available_numbers * number_instances
+    c2 = T // number_of_players
+    return [c2] if T % number_of_players == 0 else [c2, c2 + 1]
+
+
+def _compute_rows(number_of_players: int, available_numbers: int, number_instances: int,
+                  positions: int, hands: list[tuple[int, ...]]) -> np.ndarray:
+    """Compute the table rows of a chunk of hands (runs in a worker process)"""
+    counts = _cable_counts(number_of_players, available_numbers, number_instances)
+    rows = np.zeros((len(hands), len(counts), available_numbers, positions), dtype=np.float32)
+    for h, hand in enumerate(hands):
+        player_cables = [number + 1 for number, count in enumerate(hand) for _ in range(count)]
+        for slot, c in enumerate(counts):
+            distribution = exact_distribution_given_player_cables(
+                number_of_players, available_numbers, number_instances, player_cables, c=c)
+            rows[h, slot, :, :c] = distribution
+    return rows
+
+
+def build_lookup_table(number_of_players: int, available_numbers: int, number_instances: int,
+                       path: str, workers: int | None = None) -> "LookupTable":
+    """
+    Enumerate every possible hand of player 0 and store player 1's distributions.
+
+    Args:
+        number_of_players: Number of players (P)
+        available_numbers: Number of different numbers (N)
+        number_instances: Number of instances of each number (M)
+        path: Directory the table files are written to
+        workers: Number of worker processes (defaults to the number of CPUs)
+
+    Returns:
+        The freshly built table, opened memory-mapped
+    """
+    if number_of_players < 2:
+        raise ValueError("The table stores player 1's distributions: it needs at least 2 players!")
+    if (number_instances + 1) ** available_numbers >= 2 ** 63:
+        raise ValueError("Hand codes don't fit in 64 bits for this configuration!")
+
+    cable_counts = _cable_counts(number_of_players, available_numbers, number_instances)
+    hands = [hand for size in cable_counts for hand in enumerate_hands(available_numbers, number_instances, size)]
+    positions = max(cable_counts)
+
+    os.makedirs(path, exist_ok=True)
+    keys = np.array([hand_code(hand, number_instances) for hand in hands], dtype=np.int64)
+    np.save(os.path.join(path, "keys.npy"), keys)
+
+    # Open addressing with linear probing, load factor <= 0.5
+    bits = max(1, (2 * len(hands) - 1).bit_length())
+    index = np.zeros(1 << bits, dtype=np.int64)
+    for row, code in enumerate(keys.tolist()):
+        slot = _slot(code, bits)
+        while index[slot] != 0:
+            slot = (slot + 1) & ((1 << bits) - 1)
+        index[slot] = row + 1
+    np.save(os.path.join(path, "index.npy"), index)
+
+    table = np.lib.format.open_memmap(os.path.join(path, "table.npy"), mode="w+", dtype=np.float32,
+                                      shape=(len(hands), len(cable_counts), available_numbers, positions))
+    chunks = [hands[start:start + CHUNK_SIZE] for start in range(0, len(hands), CHUNK_SIZE)]
+    compute = partial(_compute_rows, number_of_players, available_numbers, number_instances, positions)
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        for chunk_index, rows in enumerate(pool.map(compute, chunks)):
+            start = chunk_index * CHUNK_SIZE
+            table[start:start + len(rows)] = rows
+    table.flush()
+    del table
+
+    meta = {
+        "number_of_players": number_of_players,
+        "available_numbers": available_numbers,
+        "number_instances": number_instances,
+        "cable_counts": cable_counts,
+        "positions": positions,
+        "hands": len(hands),
+        "index_bits": bits,
+    }
+    with open(os.path.join(path, "meta.json"), "w") as f:
+        json.dump(meta, f, indent=2)
+    return LookupTable(path)
+
+
+class LookupTable:
+    """Memory-mapped table of Lecture 6 distributions built by build_lookup_table"""
+
+    def __init__(self, path: str):
+        with open(os.path.join(path, "meta.json")) as f:
+            meta = json.load(f)
+        self.number_of_players = meta["number_of_players"]
+        self.available_numbers = meta["available_numbers"]
+        self.number_instances = meta["number_instances"]
+        self.cable_counts = meta["cable_counts"]
+        self.positions = meta["positions"]
+        self._bits = meta["index_bits"]
+        self._keys = np.load(os.path.join(path, "keys.npy"), mmap_mode="r")
+        self._index = np.load(os.path.join(path, "index.npy"), mmap_mode="r")
+        self._table = np.load(os.path.join(path, "table.npy"), mmap_mode="r")
+
+    def row(self, player_cables: list[int]) -> int:
+        """Return the table row of player 0's hand, or raise KeyError if it isn't in the table"""
+        counts = [0] * self.available_numbers
+        for cable in player_cables:
+            if not 1 <= cable <= self.available_numbers:
+                raise KeyError(tuple(sorted(player_cables)))
+            counts[cable - 1] += 1
+        code = hand_code(counts, self.number_instances)
+
+        slot = _slot(code, self._bits)
+        while True:
+            entry = int(self._index[slot])
+            if entry == 0:
+                raise KeyError(tuple(sorted(player_cables)))
+            if int(self._keys[entry - 1]) == code:
+                return entry - 1
+            slot = (slot + 1) & ((1 << self._bits) - 1)
+
+    def lookup(self, player_cables: list[int], c: int) -> np.ndarray:
+        """
+        Return player 1's distribution given player 0's cables and player 1's cable count c.
+
+        The result is a read-only (N, c) view into the memory-mapped table. Raises KeyError
+        if player 1 can't hold c cables while player 0 holds player_cables.
+        """
+        if c not in self.cable_counts:
+            raise KeyError(c)
+        # The other players split the cables player 0 doesn't hold as evenly as possible
+        remaining = self.available_numbers * self.number_instances - len(player_cables)
+        others = self.number_of_players - 1
+        if c not in (remaining // others, -(-remaining // others)):
+            raise KeyError(c)
+        return self._table[self.row(player_cables), self.cable_counts.index(c), :, :c]
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+
+def main():
+    """Build the table for the default configuration"""
+    from simulation_config import (
+        DEFAULT_NUMBER_OF_PLAYERS,
+        DEFAULT_AVAILABLE_NUMBERS,
+        DEFAULT_NUMBER_INSTANCES
+    )
+    P, N, M = DEFAULT_NUMBER_OF_PLAYERS, DEFAULT_AVAILABLE_NUMBERS, DEFAULT_NUMBER_INSTANCES
+    path = f"lookup_table_P{P}_N{N}_M{M}"
+    print(f"Building lookup table for P={P}, N={N}, M={M} in {path}/ ...")
+    table = build_lookup_table(P, N, M, path)
+    print(f"Stored distributions for {len(table)} hands.")
+
+
+if __name__ == "__main__":
+    main()
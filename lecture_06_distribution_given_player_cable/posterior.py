@@ -0,0 +1,80 @@
+"""
+Incrementally updated Lecture 6 distribution.
+
+ConditionalPosterior holds the distribution of one player with c cables given
+the cables that are known to be elsewhere (player 0's hand plus any cable
+revealed later). Removing one more cable from the pool updates the state in
+O(N * c) with closed-form ratios instead of rebuilding it from scratch.
+"""
+
+import numpy as np
+
+from lecture_02_hypergeometric.solution import hypergeometric_pmf
+from lecture_03_position_probability.solution import position_distribution_from_pmfs
+from lecture_06_distribution_given_player_cable.solution import remaining_instances_after
+
+
+class ConditionalPosterior:
+    """
+    Distribution of a player with c cables, updated one removed cable at a time.
+
+    As in position_distribution_given_cables, row i tracks the PMF of
+    X_i = number of the player's cables that are <= i+1, which is
+    Hypergeometric(T, C_i, c) with C_i the remaining cables <= i+1.
+    Removing a cable of number v shrinks T by one for every row and C_i by
+    one for the rows i+1 >= v. Both changes multiply the PMF by a ratio of
+    binomials that only depends on k:
+
+        rows below v:      P'(k) = P(k) * (T - C_i - c + k) / (T - C_i) * T / (T - c)
+        rows from v on:    P'(k) = P(k) * (C_i - k) / C_i * T / (T - c)
+
+    so no PMF needs to be recomputed.
+    """
+
+    def __init__(self, available_numbers: int, number_instances: int,
+                 player_cables: list[int], c: int):
+        """
+        Args:
+            available_numbers: Number of different numbers (N)
+            number_instances: Number of instances of each number (M)
+            player_cables: Cables known to be outside the tracked hand (e.g. player 0's hand)
+            c: Number of cables of the tracked player
+        """
+        self.available_numbers = available_numbers
+        self.c = c
+        self._remaining = remaining_instances_after(available_numbers, number_instances, player_cables)
+        self._T = sum(self._remaining)
+        if c > self._T:
+            raise ValueError("The player can't hold more cables than remain!")
+        self._cumulative = np.cumsum(self._remaining)
+        self._pmf = np.array([hypergeometric_pmf(self._T, int(C), c) for C in self._cumulative])
+        self._k = np.arange(c + 1)
+
+    @property
+    def remaining_instances(self) -> list[int]:
+        """How many cables of each number are still unaccounted for"""
+        return list(self._remaining)
+
+    def remove_cable(self, number: int):
+        """Account for one more cable of `number` that is known not to be in the tracked hand"""
+        if not 1 <= number <= self.available_numbers or self._remaining[number - 1] == 0:
+            raise ValueError(f"No cable {number} left to remove!")
+        if self._T - 1 < self.c:
+            raise ValueError("The player can't hold more cables than remain!")
+
+        T, c, k = self._T, self.c, self._k
+        v = number - 1
+        scale = T / (T - c)
+
+        below = self._cumulative[:v, None]
+        self._pmf[:v] *= (T - below - c + k) / (T - below) * scale
+        from_v = self._cumulative[v:, None]
+        self._pmf[v:] *= (from_v - k) / from_v * scale
+
+        self._remaining[v] -= 1
+        self._cumulative[v:] -= 1
+        self._T -= 1
+
+    def distribution(self) -> list[list[float]]:
+        """Return result[i][j] = P(number i+1 at position j) for the tracked player"""
+        return position_distribution_from_pmfs(self._pmf).tolist()
@@ -12,18 +12,30 @@ import os
 parent_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 sys.path.insert(0, parent_dir)
 
+from base import instrumentation
 from simulate_base import GameSimulationBase
-import matplotlib.pyplot as plt
+from lecture_05_distribution_given_cable_count.solution import cached_exact_distribution_given_cable_count
 
 # Try importing from exercise first, fall back to solution
 try:
     from lecture_06_distribution_given_player_cable.exercise import exact_distribution_given_player_cables
+    # Count the exercise's calls like the instrumented solution's
+    exact_distribution_given_player_cables = instrumentation.instrument(exact_distribution_given_player_cables)
 except (ImportError, NotImplementedError):
     from lecture_06_distribution_given_player_cable.solution import exact_distribution_given_player_cables
+from lecture_06_distribution_given_player_cable.solution import cached_exact_distribution_given_player_cables
+
+# Distributions of all other players at once, if the exercise implements it
+try:
+    from lecture_06_distribution_given_player_cable.exercise import exact_distributions_for_all_players
+    exact_distributions_for_all_players = instrumentation.instrument(exact_distributions_for_all_players)
+except (ImportError, NotImplementedError):
+    exact_distributions_for_all_players = None
 
 # Import exercise 5 for Player 0 distribution
 try:
     from lecture_05_distribution_given_cable_count.exercise import exact_distribution_given_cable_count
+    exact_distribution_given_cable_count = instrumentation.instrument(exact_distribution_given_cable_count)
 except (ImportError, NotImplementedError):
     from lecture_05_distribution_given_cable_count.solution import exact_distribution_given_cable_count
 
@@ -39,39 +51,47 @@ class GameSimulationLecture06(GameSimulationBase):
         super().sample_new_game(P, N, M)
         self.update_display()
         
-    def get_distribution(self):
-        """Get distribution for selected player given Player 0's cables"""
-        if self.game is None:
-            return None
+    def get_distribution(self, player_idx=None):
+        """Get distribution for a player (selected player if None) given Player 0's cables"""
+        if player_idx is None:
+            player_idx = self.selected_player
+        return self.get_distributions([player_idx]).get(player_idx)
+        
+    def get_distributions(self, players):
+        """Get the distributions of several players, all other players from one computation"""
+        # Read the game once: a new game may be dealt while the worker computes
+        game = self.game
+        N, M = self.available_numbers, self.number_instances
+        if game is None:
+            return {}
             
-        player_0_cables = sorted(self.game[0])  # Ensure sorted
+        P = len(game)
+        player_0_cables = sorted(game[0])  # Ensure sorted
+        distributions = {}
         
         # For Player 0, show distribution from exercise 5 (distribution given cable count)
         # This shows how random/possible their draw was
-        if self.selected_player == 0:
-            cable_count = len(player_0_cables)
-            
-            # Use exercise 5: distribution given cable count
-            distribution = exact_distribution_given_cable_count(
-                self.number_of_players,
-                self.available_numbers,
-                self.number_instances,
-                cable_count
-            )
-            return distribution
+        if 0 in players:
+            distributions[0] = cached_exact_distribution_given_cable_count(
+                P, N, M, len(player_0_cables), compute=exact_distribution_given_cable_count)
         
-        # For other players, calculate distribution using their actual cable count
-        selected_player_cables = self.game[self.selected_player]
-        cable_count = len(selected_player_cables)
+        # For other players, compute every seat at once
+        others = [player for player in players if 0 < player < P]
+        if others:
+            cable_counts = [len(cables) for cables in game]  # Each player's actual cable count
+            all_players = self.get_other_player_distributions(P, N, M, player_0_cables, cable_counts)
+            distributions.update({player: all_players[player] for player in others})
+        return distributions
         
-        distribution = exact_distribution_given_player_cables(
-            self.number_of_players, 
-            self.available_numbers, 
-            self.number_instances, 
-            player_0_cables,
-            c=cable_count  # Pass the selected player's cable count
-        )
-        return distribution
+    def get_other_player_distributions(self, P, N, M, player_0_cables, cable_counts):
+        """Distributions of players 1..P-1 given Player 0's cables and their cable counts"""
+        if exact_distributions_for_all_players is not None:
+            return exact_distributions_for_all_players(P, N, M, player_0_cables, cable_counts)
+        # One cached call per player: players with the same cable count share one entry
+        return {player: cached_exact_distribution_given_player_cables(
+                    P, N, M, player_0_cables, c=cable_counts[player],
+                    compute=exact_distribution_given_player_cables)
+                for player in range(1, P)}
         
     def get_info_text(self):
         """Get information text for the info panel"""
@@ -109,17 +129,23 @@ class GameSimulationLecture06(GameSimulationBase):
         # Add Player 0 band at the top (below title)
         if self.game is not None and self.fig is not None:
             player_0_cables = sorted(self.game[0])
-            # Create a text annotation at the top of the figure (below suptitle)
             player_0_text = f"Player 0 (YOU): {player_0_cables}"
-            self.fig.text(0.5, 0.96, player_0_text, 
-                         ha='center', va='top',
-                         fontsize=11, fontweight='bold',
-                         bbox=dict(boxstyle='round,pad=0.4', 
-                                  facecolor='lightblue', 
-                                  alpha=0.85,
-                                  edgecolor='darkblue',
-                                  linewidth=2))
-            plt.draw()
+            band = getattr(self, '_player_0_band', None)
+            if band is None or band.figure is not self.fig:
+                # Create a text annotation at the top of the figure (below suptitle)
+                band = self.fig.text(0.5, 0.96, '', 
+                                     ha='center', va='top',
+                                     fontsize=11, fontweight='bold',
+                                     bbox=dict(boxstyle='round,pad=0.4', 
+                                              facecolor='lightblue', 
+                                              alpha=0.85,
+                                              edgecolor='darkblue',
+                                              linewidth=2))
+                self._player_0_band = band
+            # The band only changes with a new game; it is part of the static background
+            if band.get_text() != player_0_text:
+                band.set_text(player_0_text)
+                self.fig.canvas.draw_idle()
 
 
 def main():
@@ -135,6 +161,7 @@ def main():
     
     sim = GameSimulationLecture06()
     sim.create_ui()
+    instrumentation.print_report()
 
 
 if __name__ == "__main__":
@@ -2,27 +2,36 @@
 Solution for Exercise 6: Distribution Given Player Cable
 """
 
-from lecture_03_position_probability.solution import position_probability_given_cables
+import numpy as np
 
+from base import instrumentation
+from base.cache import distribution_cache, distribution_key
+from lecture_03_position_probability.solution import (
+    position_distribution_given_cables,
+    position_distribution_given_revealed
+)
 
+
+@instrumentation.instrument
 def exact_distribution_given_player_cables(number_of_players: int, available_numbers: int,
                                            number_instances: int, player_cables: list[int], 
-                                           c: int = None) -> list[list[float]]:
+                                           c: int = None,
+                                           revealed: dict[int, int] | None = None,
+                                           excluded=None) -> list[list[float]]:
     """
     Calculate exact probability distribution for player 1 given that player 0 has specific cables.
     
     If c is provided, calculates distribution assuming player 1 has exactly c cables.
     If c is None, averages over all possible cable counts for player 1.
+    revealed optionally maps positions of player 1's hand to publicly known numbers and
+    excluded holds (position, number) pairs known not to hold (e.g. failed cuts);
+    both need a known cable count c.
     """
     T = available_numbers * number_instances  # Total cables
     P = number_of_players
     
     # Count how many of each number remain after removing player 0's cables
-    # Numbers are 1-indexed (1, 2, 3, ...), so number i (0-indexed) corresponds to number (i+1)
-    remaining_instances = [number_instances] * available_numbers
-    for cable in player_cables:
-        if 1 <= cable <= available_numbers:
-            remaining_instances[cable - 1] -= 1
+    remaining_instances = remaining_instances_after(available_numbers, number_instances, player_cables)
     
     # Calculate remaining totals
     T_remaining = T - len(player_cables)
@@ -32,36 +41,13 @@ def exact_distribution_given_player_cables(number_of_players: int, available_num
         # No remaining players, return empty distribution
         return [[0.0] * 0 for _ in range(available_numbers)]
     
-    # Initialize result
-    distribution = []
-    
     # If cable count c is provided, use it directly (like exercise 5)
-    if c is not None:
-        max_position = c
-        
-        for number in range(available_numbers):
-            probs = []
-            M_remaining = remaining_instances[number]  # Remaining instances of this number
-            
-            # Calculate remaining smaller numbers count
-            # Numbers smaller than (number+1) are 1, 2, ..., number
-            smaller_numbers_count_remaining = 0
-            for n in range(number):
-                smaller_numbers_count_remaining += remaining_instances[n]
-            
-            for position in range(max_position):
-                # If no remaining instances of this number, probability is 0
-                if M_remaining == 0:
-                    probs.append(0.0)
-                    continue
-                
-                # Calculate probability directly using position_probability_given_cables
-                prob = position_probability_given_cables(
-                    M_remaining, T_remaining, c, position, smaller_numbers_count_remaining
-                )
-                probs.append(prob)
-            
-            distribution.append(probs)
+    if (revealed or excluded) and c is None:
+        raise ValueError("Revealed and excluded positions need a known cable count c!")
+    if c is not None and (revealed or excluded):
+        distribution = position_distribution_given_revealed(remaining_instances, c, revealed or {}, excluded)
+    elif c is not None:
+        distribution = position_distribution_given_cables(remaining_instances, c)
     else:
         # Original behavior: average over all possible cable counts
         # Calculate cables per remaining player
@@ -74,46 +60,70 @@ def exact_distribution_given_player_cables(number_of_players: int, available_num
         # Maximum position index
         max_position = max(c1, c2) if extra_cables > 0 else c2
         
-        for number in range(available_numbers):
-            probs = []
-            M_remaining = remaining_instances[number]  # Remaining instances of this number
-            
-            # Calculate remaining smaller numbers count
-            # Numbers smaller than (number+1) are 1, 2, ..., number
-            smaller_numbers_count_remaining = 0
-            for n in range(number):
-                smaller_numbers_count_remaining += remaining_instances[n]
-            
-            for position in range(max_position):
-                # If no remaining instances of this number, probability is 0
-                if M_remaining == 0:
-                    probs.append(0.0)
-                    continue
-                
-                # Calculate probability for c1 case (players with extra cable)
-                prob_c1 = 0.0
-                if position < c1:
-                    prob_c1 = position_probability_given_cables(
-                        M_remaining, T_remaining, c1, position, smaller_numbers_count_remaining
-                    )
-                
-                # Calculate probability for c2 case (players without extra cable)
-                prob_c2 = 0.0
-                if position < c2:
-                    prob_c2 = position_probability_given_cables(
-                        M_remaining, T_remaining, c2, position, smaller_numbers_count_remaining
-                    )
-                
-                # Weight by probability of being each type of player
-                # P(player 1 has c1 cables) = E_remaining / P_remaining
-                # P(player 1 has c2 cables) = (P_remaining - E_remaining) / P_remaining
-                if E_remaining > 0:
-                    total_prob = (E_remaining / P_remaining) * prob_c1 + ((P_remaining - E_remaining) / P_remaining) * prob_c2
-                else:
-                    total_prob = prob_c2
-                
-                probs.append(total_prob)
-            
-            distribution.append(probs)
+        prob_c2 = np.zeros((available_numbers, max_position))
+        prob_c2[:, :c2] = position_distribution_given_cables(remaining_instances, c2)
+        
+        # Weight by probability of being each type of player
+        # P(player 1 has c1 cables) = E_remaining / P_remaining
+        # P(player 1 has c2 cables) = (P_remaining - E_remaining) / P_remaining
+        if E_remaining > 0:
+            prob_c1 = position_distribution_given_cables(remaining_instances, c1)
+            distribution = (E_remaining / P_remaining) * prob_c1 + ((P_remaining - E_remaining) / P_remaining) * prob_c2
+        else:
+            distribution = prob_c2
+    
+    return distribution.tolist()
+
+
+@instrumentation.instrument
+def exact_distributions_for_all_players(number_of_players: int, available_numbers: int,
+                                        number_instances: int, player_cables: list[int],
+                                        cable_counts: list[int] | None = None) -> dict[int, list[list[float]]]:
+    """
+    Calculate the distribution of every other player given that player 0 has specific cables.
+    
+    cable_counts[p] is the cable count of player p (entry 0 is ignored). If cable_counts is None,
+    every player gets the distribution averaged over the possible cable counts.
+    The distribution only depends on the cable count, so it is computed once per distinct count
+    (at most two) and shared between the players that have it.
     
-    return distribution
+    Returns a dict mapping each player 1..P-1 to its distribution.
+    """
+    by_count: dict[int | None, list[list[float]]] = {}
+    distributions = {}
+    for player in range(1, number_of_players):
+        c = cable_counts[player] if cable_counts is not None else None
+        if c not in by_count:
+            by_count[c] = exact_distribution_given_player_cables(
+                number_of_players, available_numbers, number_instances, player_cables, c=c)
+        # Every player gets its own copy so callers can modify it safely
+        distributions[player] = [list(probs) for probs in by_count[c]]
+    return distributions
+
+
+def remaining_instances_after(available_numbers: int, number_instances: int,
+                              player_cables: list[int]) -> list[int]:
+    """Count how many cables of each number remain after removing player 0's cables"""
+    # Numbers are 1-indexed (1, 2, 3, ...), so number i (0-indexed) corresponds to number (i+1)
+    remaining_instances = [number_instances] * available_numbers
+    for cable in player_cables:
+        if 1 <= cable <= available_numbers:
+            remaining_instances[cable - 1] -= 1
+    return remaining_instances
+
+
+def cached_exact_distribution_given_player_cables(number_of_players: int, available_numbers: int,
+                                                  number_instances: int, player_cables: list[int],
+                                                  c: int = None,
+                                                  compute=exact_distribution_given_player_cables) -> list[list[float]]:
+    """
+    Same as exact_distribution_given_player_cables, memoized in the shared distribution_cache.
+    
+    With a fixed cable count c the result only depends on the remaining-instance vector,
+    so different hands that leave the same cables share one entry.
+    compute can be another implementation with the same signature (e.g. the exercise).
+    """
+    remaining_instances = remaining_instances_after(available_numbers, number_instances, player_cables)
+    key = distribution_key(compute, tuple(remaining_instances), c, number_of_players if c is None else None)
+    return distribution_cache.get(key, lambda: compute(
+        number_of_players, available_numbers, number_instances, player_cables, c))
@@ -7,12 +7,17 @@ Run this to verify your implementation:
 
 import sys
 import os
+from itertools import combinations
 
 # Add parent directory to path
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from lecture_06_distribution_given_player_cable import exercise
 from lecture_06_distribution_given_player_cable import solution
+from lecture_06_distribution_given_player_cable import lookup_table
+from lecture_06_distribution_given_player_cable.posterior import ConditionalPosterior
+from game_state import GameState
+from base import bombusters as bb_base
 
 
 def test_exact_distribution_given_player_cables():
@@ -188,6 +193,375 @@ def test_exact_distribution_given_player_cables_with_cable_count():
     return all_passed
 
 
+def test_exact_distributions_for_all_players():
+    """Test that the all-players API matches per-player calls"""
+    print("=" * 60)
+    print("Testing exact_distributions_for_all_players")
+    print("=" * 60)
+    
+    all_passed = True
+    P, N, M = 5, 12, 4
+    player_cables = [1, 2, 4, 4, 6, 7, 9, 11, 12, 12]
+    cable_counts = [10, 10, 10, 9, 9]
+    try:
+        for counts in [cable_counts, None]:
+            result = solution.exact_distributions_for_all_players(P, N, M, player_cables, counts)
+            ok = sorted(result) == list(range(1, P))
+            for player in range(1, P):
+                c = counts[player] if counts is not None else None
+                expected = solution.exact_distribution_given_player_cables(P, N, M, player_cables, c=c)
+                ok = ok and result[player] == expected
+            status = "✓" if ok else "✗"
+            if not ok:
+                all_passed = False
+            print(f"{status} cable_counts={counts}: every player matches its own call")
+        
+        result[1][0][0] = -1.0
+        ok = result[2][0][0] != -1.0
+        status = "✓" if ok else "✗"
+        if not ok:
+            all_passed = False
+        print(f"{status} Players with the same cable count get independent copies")
+    except Exception as e:
+        print(f"✗ exact_distributions_for_all_players raised exception: {e}")
+        all_passed = False
+    
+    print()
+    return all_passed
+
+
+def test_sample_distribution_given_player_cables():
+    """Test that the conditional Monte Carlo estimate matches the exact distribution"""
+    print("=" * 60)
+    print("Testing sample_distribution_given_player_cables")
+    print("=" * 60)
+    
+    all_passed = True
+    test_cases = [
+        (4, 4, 4, [1, 1, 2, 3]),
+        (3, 3, 3, [1, 1, 1]),
+        (4, 12, 4, [1, 2, 2, 5, 7, 7, 8, 9, 10, 12, 12, 12]),  # Real deck
+    ]
+    for P, N, M, player_cables in test_cases:
+        try:
+            estimate = bb_base.sample_distribution_given_player_cables(P, N, M, player_cables,
+                                                                       num_samples=40_000, seed=0)
+            expected = solution.exact_distribution_given_player_cables(P, N, M, player_cables)
+            diff = max(abs(estimate[n][pos] - expected[n][pos])
+                       for n in range(N) for pos in range(len(expected[n])))
+            ok = len(estimate) == N and diff < 0.02
+            status = "✓" if ok else "✗"
+            if not ok:
+                all_passed = False
+            print(f"{status} P={P}, N={N}, M={M}, player_cables={player_cables}: max diff to exact = {diff:.4f}")
+        except Exception as e:
+            print(f"✗ P={P}, N={N}, M={M}, player_cables={player_cables} raised exception: {e}")
+            all_passed = False
+    
+    for player_cables in [[1, 1, 1, 1, 1], [0, 1], [5]]:
+        try:
+            bb_base.sample_distribution_given_player_cables(4, 4, 4, player_cables, num_samples=10)
+            print(f"✗ player_cables={player_cables} should raise ValueError")
+            all_passed = False
+        except ValueError:
+            print(f"✓ player_cables={player_cables} raises ValueError")
+    
+    print()
+    return all_passed
+
+
+def test_sample_distribution_anytime():
+    """Test that the anytime estimator stops at the requested interval width"""
+    print("=" * 60)
+    print("Testing sample_distribution_anytime")
+    print("=" * 60)
+    
+    all_passed = True
+    P, N, M = 4, 4, 4
+    player_cables = [1, 1, 2, 3]
+    tolerance = 0.02
+    try:
+        expected = solution.exact_distribution_given_player_cables(P, N, M, player_cables)
+        estimate, half_widths, num_samples = bb_base.sample_distribution_anytime(
+            P, N, M, tolerance=tolerance, player_cables=player_cables, seed=0, batch_size=1000)
+        widest = max(max(row) for row in half_widths)
+        ok = widest <= tolerance and num_samples % 1000 == 0 and num_samples > 0
+        status = "✓" if ok else "✗"
+        if not ok:
+            all_passed = False
+        print(f"{status} Stopped after {num_samples} games with widest half-width {widest:.4f} <= {tolerance}")
+        
+        diff = max(abs(estimate[n][pos] - expected[n][pos]) for n in range(N) for pos in range(len(expected[n])))
+        ok = diff <= 2 * tolerance
+        status = "✓" if ok else "✗"
+        if not ok:
+            all_passed = False
+        print(f"{status} Estimate vs exact distribution: max diff = {diff:.4f}")
+        
+        _, _, capped = bb_base.sample_distribution_anytime(
+            P, N, M, tolerance=0.0, max_samples=2500, player_cables=player_cables, seed=0, batch_size=1000)
+        ok = capped == 2500
+        status = "✓" if ok else "✗"
+        if not ok:
+            all_passed = False
+        print(f"{status} max_samples=2500 stops after {capped} games")
+        
+        again = bb_base.sample_distribution_anytime(
+            P, N, M, tolerance=tolerance, player_cables=player_cables, seed=0, batch_size=1000)
+        ok = again == (estimate, half_widths, num_samples)
+        status = "✓" if ok else "✗"
+        if not ok:
+            all_passed = False
+        print(f"{status} The same seed gives the same estimate")
+        
+        # A single player leaves nobody to estimate
+        alone = bb_base.sample_distribution_anytime(1, N, M, player_cables=player_cables, seed=0)
+        ok = alone == ([[] for _ in range(N)], [[] for _ in range(N)], 0)
+        ok = ok and alone[0] == bb_base.sample_distribution_given_player_cables(1, N, M, player_cables)
+        status = "✓" if ok else "✗"
+        if not ok:
+            all_passed = False
+        print(f"{status} One player: empty estimate after {alone[2]} games")
+        
+        for name, kwargs in [("cables and player_cables", dict(cables=4, player_cables=player_cables)),
+                             ("tolerance=0 without a bound", dict(tolerance=0.0))]:
+            try:
+                bb_base.sample_distribution_anytime(P, N, M, seed=0, **kwargs)
+                print(f"✗ {name} did not raise")
+                all_passed = False
+            except ValueError:
+                print(f"✓ {name} raises ValueError")
+    except Exception as e:
+        print(f"✗ sample_distribution_anytime raised exception: {e}")
+        all_passed = False
+    
+    print()
+    return all_passed
+
+
+def test_lookup_table():
+    """Test that the precomputed lookup table matches the solution"""
+    print("=" * 60)
+    print("Testing lookup_table")
+    print("=" * 60)
+    
+    import tempfile
+    
+    all_passed = True
+    P, N, M = 3, 4, 4
+    try:
+        with tempfile.TemporaryDirectory() as path:
+            table = lookup_table.build_lookup_table(P, N, M, path, workers=1)
+            expected_hands = len(lookup_table.enumerate_hands(N, M, 5)) + len(lookup_table.enumerate_hands(N, M, 6))
+            status = "✓" if len(table) == expected_hands else "✗"
+            if len(table) != expected_hands:
+                all_passed = False
+            print(f"{status} Table holds {len(table)} hands (expected {expected_hands})")
+            
+            for player_cables, c in [([1, 1, 2, 3, 4], 5), ([1, 1, 2, 3, 4], 6), ([2, 2, 2, 2, 3, 4], 5)]:
+                result = table.lookup(player_cables, c)
+                solution_result = solution.exact_distribution_given_player_cables(P, N, M, player_cables, c=c)
+                diff = max(abs(float(result[i][j]) - solution_result[i][j]) for i in range(N) for j in range(c))
+                tolerance = 1e-6  # Table is stored as float32
+                status = "✓" if diff < tolerance else "✗"
+                if diff >= tolerance:
+                    all_passed = False
+                print(f"{status} Lookup for cables={player_cables}, c={c}: max diff = {diff:.2e}")
+            
+            try:
+                table.lookup([1, 1, 1, 1, 1], 5)
+                print("✗ Impossible hand was found in the table")
+                all_passed = False
+            except KeyError:
+                print("✓ Impossible hand raises KeyError")
+            
+            # 16 cables over 3 players: if player 0 holds 6, the others hold 5 each
+            try:
+                table.lookup([1, 1, 2, 2, 3, 4], 6)
+                print("✗ Impossible cable count for this hand was found in the table")
+                all_passed = False
+            except KeyError:
+                print("✓ Impossible cable count for this hand raises KeyError")
+            del table
+        
+        # 16 cables over 4 players split evenly, so only c=4 is stored
+        with tempfile.TemporaryDirectory() as path:
+            table = lookup_table.build_lookup_table(4, N, M, path, workers=1)
+            hands = len(lookup_table.enumerate_hands(N, M, 4))
+            ok = table.cable_counts == [4] and table._table.shape == (hands, 1, N, 4)
+            status = "✓" if ok else "✗"
+            if not ok:
+                all_passed = False
+            print(f"{status} Even split stores only cable count {table.cable_counts}")
+            
+            result = table.lookup([1, 2, 3, 4], 4)
+            solution_result = solution.exact_distribution_given_player_cables(4, N, M, [1, 2, 3, 4], c=4)
+            diff = max(abs(float(result[i][j]) - solution_result[i][j]) for i in range(N) for j in range(4))
+            status = "✓" if diff < 1e-6 else "✗"
+            if diff >= 1e-6:
+                all_passed = False
+            print(f"{status} Lookup for cables=[1, 2, 3, 4], c=4: max diff = {diff:.2e}")
+            
+            try:
+                table.lookup([1, 2, 3, 4], 5)
+                print("✗ Cable count 5 was found in an evenly split table")
+                all_passed = False
+            except KeyError:
+                print("✓ Cable count 5 raises KeyError")
+            del table
+        
+        with tempfile.TemporaryDirectory() as path:
+            try:
+                lookup_table.build_lookup_table(1, N, M, path, workers=1)
+                print("✗ A single-player table was built")
+                all_passed = False
+            except ValueError:
+                print("✓ A single-player table raises ValueError")
+    except Exception as e:
+        print(f"✗ Lookup table raised exception: {e}")
+        all_passed = False
+    
+    print()
+    return all_passed
+
+
+def test_conditional_posterior():
+    """Test that incremental removals match recomputing from scratch"""
+    print("=" * 60)
+    print("Testing ConditionalPosterior")
+    print("=" * 60)
+    
+    all_passed = True
+    P, N, M, c = 4, 12, 4, 12
+    known_cables = [1, 1, 2, 3, 4, 4, 5, 7, 9, 10, 12, 12]
+    try:
+        posterior = ConditionalPosterior(N, M, known_cables, c)
+        for number in [5, 1, 12, 6, 6, 3]:
+            posterior.remove_cable(number)
+            known_cables = known_cables + [number]
+            result = posterior.distribution()
+            solution_result = solution.exact_distribution_given_player_cables(P, N, M, known_cables, c=c)
+            diff = max(abs(result[i][j] - solution_result[i][j]) for i in range(N) for j in range(c))
+            tolerance = 1e-9
+            status = "✓" if diff < tolerance else "✗"
+            if diff >= tolerance:
+                all_passed = False
+            print(f"{status} After removing {number}: max diff = {diff:.2e}")
+        
+        # All four 12s are accounted for after this
+        posterior.remove_cable(12)
+        try:
+            posterior.remove_cable(12)
+            print("✗ Removing a cable that is no longer in the pool did not raise")
+            all_passed = False
+        except ValueError:
+            print("✓ Removing a cable that is no longer in the pool raises ValueError")
+    except Exception as e:
+        print(f"✗ ConditionalPosterior raised exception: {e}")
+        all_passed = False
+    
+    print()
+    return all_passed
+
+
+def test_game_state():
+    """Test GameState against the exact solution and a joint brute-force enumeration"""
+    print("=" * 60)
+    print("Testing GameState")
+    print("=" * 60)
+    
+    all_passed = True
+    tolerance = 1e-9
+    P, N, M = 3, 4, 3
+    player_cables = [1, 2, 2, 4]
+    try:
+        state = GameState(P, N, M)
+        state.deal(player_cables)
+        result = state.distribution(1)
+        solution_result = solution.exact_distribution_given_player_cables(P, N, M, player_cables, c=4)
+        diff = max(abs(result[i][j] - solution_result[i][j]) for i in range(N) for j in range(4))
+        status = "✓" if diff < tolerance else "✗"
+        if diff >= tolerance:
+            all_passed = False
+        print(f"{status} After the deal: max diff = {diff:.2e}")
+        
+        state.successful_cut(0, 3, 2, 3, 4)
+        state.reveal(1, 1, 2)
+        state.failed_cut(1, 3, 4)
+        
+        # Deal the cables we don't hold to players 1 and 2 in every possible way
+        pool = [number for number in range(1, N + 1) for _ in range(M)]
+        for cable in player_cables:
+            pool.remove(cable)
+        expected = [[[0.0] * 4 for _ in range(N)] for _ in range(2)]
+        total = 0
+        for chosen in combinations(range(len(pool)), 4):
+            hand_1 = sorted(pool[i] for i in chosen)
+            hand_2 = sorted(pool[i] for i in range(len(pool)) if i not in chosen)
+            if hand_1[1] != 2 or hand_1[3] == 4 or hand_2[3] != 4:
+                continue
+            total += 1
+            for player, hand in enumerate([hand_1, hand_2]):
+                for j, cable in enumerate(hand):
+                    expected[player][cable - 1][j] += 1
+        for player in (1, 2):
+            result = state.distribution(player)
+            diff = max(abs(result[i][j] - expected[player - 1][i][j] / total) for i in range(N) for j in range(4))
+            status = "✓" if diff < tolerance else "✗"
+            if diff >= tolerance:
+                all_passed = False
+            print(f"{status} Player {player} after reveals and a failed cut: max diff = {diff:.2e}")
+        
+        # Pinning player 2 to [4, 4] leaves only [1, 2, 3] for player 1
+        pinned = GameState(3, 4, 2)
+        pinned.deal([1, 2, 3], [3, 3, 2])
+        pinned.reveal(2, 0, 4)
+        expected_pinned = [[1.0 if number == j else 0.0 for j in range(3)] for number in range(4)]
+        diff = max(abs(pinned.distribution(1)[i][j] - expected_pinned[i][j]) for i in range(4) for j in range(3))
+        status = "✓" if diff < tolerance else "✗"
+        if diff >= tolerance:
+            all_passed = False
+        print(f"{status} Another player's reveal propagates: max diff = {diff:.2e}")
+        
+        replayed = GameState.from_events(P, N, M, state.events).distributions()
+        status = "✓" if replayed == state.distributions() else "✗"
+        if status == "✗":
+            all_passed = False
+        print(f"{status} Replaying the event log gives the same distribution")
+        
+        try:
+            state.reveal(1, 1, 3)
+            print("✗ Revealing a different number at a revealed position did not raise")
+            all_passed = False
+        except ValueError:
+            print("✓ Revealing a different number at a revealed position raises ValueError")
+        
+        # A rejected cut must not leave half of its reveals behind
+        try:
+            state.successful_cut(2, 0, 1, 1, 3)
+            print("✗ A cut at a position revealed as another number did not raise")
+            all_passed = False
+        except ValueError:
+            replayed = GameState.from_events(P, N, M, state.events)
+            status = "✓" if replayed.revealed == state.revealed else "✗"
+            if status == "✗":
+                all_passed = False
+            print(f"{status} A rejected cut leaves the state replayable")
+
+        alone = GameState(1, 3, 2)
+        alone.deal([1, 1, 2, 2, 3, 3])
+        status = "✓" if alone.cable_counts == [6] and alone.distribution(0)[0][:2] == [1.0, 1.0] else "✗"
+        if status == "✗":
+            all_passed = False
+        print(f"{status} A single player gets every cable by default")
+    except Exception as e:
+        print(f"✗ GameState raised exception: {e}")
+        all_passed = False
+    
+    print()
+    return all_passed
+
+
 def main():
     """Run all tests"""
     print("\n" + "=" * 60)
@@ -197,6 +571,12 @@ def main():
     results = []
     results.append(("exact_distribution_given_player_cables (without c)", test_exact_distribution_given_player_cables()))
     results.append(("exact_distribution_given_player_cables (with c)", test_exact_distribution_given_player_cables_with_cable_count()))
+    results.append(("exact_distributions_for_all_players", test_exact_distributions_for_all_players()))
+    results.append(("sample_distribution_given_player_cables", test_sample_distribution_given_player_cables()))
+    results.append(("sample_distribution_anytime", test_sample_distribution_anytime()))
+    results.append(("lookup_table", test_lookup_table()))
+    results.append(("ConditionalPosterior", test_conditional_posterior()))
+    results.append(("GameState", test_game_state()))
     
     print("=" * 60)
     print("TEST SUMMARY")
@@ -12,19 +12,25 @@ import os
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 from base import bombusters as bb_base
+from base import instrumentation
 from base import utils
+from base.cache import distribution_cache
 # Import configuration
 from simulation_config import (
     DEFAULT_NUMBER_OF_PLAYERS,
     DEFAULT_AVAILABLE_NUMBERS,
     DEFAULT_NUMBER_INSTANCES,
-    DEFAULT_NUMBER_OF_SAMPLES
+    DEFAULT_NUMBER_OF_SAMPLES,
+    DISTRIBUTION_CACHE_PATH
 )
 # Try importing from exercise first (your implementation), fall back to solution
 try:
     from lecture_04_exact_distribution.exercise import exact_distribution
+    # Count the exercise's calls like the instrumented solution's
+    exact_distribution = instrumentation.instrument(exact_distribution)
 except (ImportError, NotImplementedError):
     from lecture_04_exact_distribution.solution import exact_distribution
+from lecture_04_exact_distribution.solution import cached_exact_distribution
 
 # Use defaults from config file
 NUMBER_OF_PLAYERS = DEFAULT_NUMBER_OF_PLAYERS
@@ -32,6 +38,10 @@ AVAILABLE_NUMBERS = DEFAULT_AVAILABLE_NUMBERS
 NUMBER_INSTANCES = DEFAULT_NUMBER_INSTANCES
 NUMBER_OF_SAMPLES = DEFAULT_NUMBER_OF_SAMPLES
 
+# Exact distributions are deterministic, so keep them between runs if a cache file is configured
+if DISTRIBUTION_CACHE_PATH is not None:
+    distribution_cache.load(DISTRIBUTION_CACHE_PATH)
+
 def main():
     print("=" * 60)
     print("BOMBBUSTERS: Monte Carlo vs Exact Distribution Comparison")
@@ -56,7 +66,9 @@ def main():
     print("\n" + "=" * 60)
     print("EXACT DISTRIBUTION")
     print("=" * 60)
-    exact_distrib = exact_distribution(NUMBER_OF_PLAYERS, AVAILABLE_NUMBERS, NUMBER_INSTANCES)
+    exact_distrib = cached_exact_distribution(
+        NUMBER_OF_PLAYERS, AVAILABLE_NUMBERS, NUMBER_INSTANCES, compute=exact_distribution
+    )
     utils.print_distribution(exact_distrib)
 
     # Compare results
@@ -88,5 +100,8 @@ def main():
     print("The exact distribution should match Monte Carlo within sampling error.")
     print("Differences are due to Monte Carlo sampling randomness.")
 
+    # Call counts and timings, if BOMBBUSTERS_INSTRUMENT is set
+    instrumentation.print_report()
+
 if __name__ == "__main__":
     main()
@@ -1,65 +1,167 @@
 """
-Run all lecture tests in sequence.
+Run all lecture tests.
 
-This script will run tests for each lecture and stop at the first failure.
-You must complete each lecture before proceeding to the next.
+Every lecture_*/test_exercise.py is discovered and run in its own Python
+process, after the tests of the shared base/ modules.
+
+By default the lectures run in sequence and the script stops at the first
+failure: you must complete each lecture before proceeding to the next.
+
+With --parallel all lectures run concurrently in a worker pool, each with a
+timeout, and the results are aggregated into one report with the wall time
+of every lecture. A full validation pass then takes about as long as the
+slowest lecture.
+
+Usage:
+    python run_all_tests.py                          # in sequence, stop at first failure
+    python run_all_tests.py --parallel               # all lectures at once
+    python run_all_tests.py --parallel --jobs 4 --timeout 120
 """
 
-import sys
+import argparse
+import glob
 import os
 import subprocess
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
 
-def run_test(lecture_name, test_file):
-    """Run a test file and return success status"""
-    print(f"\n{'=' * 60}")
-    print(f"Running tests for {lecture_name}")
-    print('=' * 60)
-    
-    result = subprocess.run(
-        [sys.executable, test_file],
-        cwd=os.path.dirname(os.path.abspath(__file__)),
-        capture_output=False
-    )
-    
-    return result.returncode == 0
+ROOT = os.path.dirname(os.path.abspath(__file__))
 
-def main():
-    """Run all tests in sequence"""
-    print("=" * 60)
-    print("BOMBBUSTERS: Running All Lecture Tests")
-    print("=" * 60)
+# Seconds a lecture's tests may take before they are stopped
+DEFAULT_TIMEOUT = 600
+
+
+def discover_lectures(root: str = ROOT) -> list[tuple[str, str]]:
+    """Return (lecture name, test file) for base/test_*.py and every lecture_*/test_exercise.py, in lecture order"""
+    lectures = []
+    for test_file in sorted(glob.glob(os.path.join(root, "base", "test_*.py"))):
+        lectures.append(("Base Modules", test_file))
+    for test_file in sorted(glob.glob(os.path.join(root, "lecture_*", "test_exercise.py"))):
+        folder = os.path.basename(os.path.dirname(test_file))
+        _, number, *words = folder.split("_")
+        lectures.append((f"Lecture {int(number)}: {' '.join(words).title()}", test_file))
+    return lectures
+
+
+def run_test(lecture_name, test_file, timeout: float | None = None, capture: bool = False) -> dict:
+    """
+    Run a test file in its own process.
+
+    Returns a result dict with the lecture name, status ("PASSED", "FAILED" or
+    "TIMEOUT"), wall time in seconds and, if capture is set, the output.
+    """
+    start = time.perf_counter()
+    try:
+        process = subprocess.run(
+            [sys.executable, test_file],
+            cwd=ROOT,
+            capture_output=capture,
+            text=True,
+            timeout=timeout
+        )
+        status = "PASSED" if process.returncode == 0 else "FAILED"
+        output = (process.stdout or "") + (process.stderr or "")
+    except subprocess.TimeoutExpired as e:
+        status = "TIMEOUT"
+        output = _decode(e.stdout) + _decode(e.stderr) + f"\nStopped after {timeout} seconds.\n"
+    return {"lecture": lecture_name, "status": status,
+            "seconds": time.perf_counter() - start, "output": output}
+
+
+def run_sequential(lectures: list[tuple[str, str]], timeout: float | None) -> int:
+    """Run the lectures one after another, stop at the first failure"""
     print("\nThis will run tests for each lecture in order.")
     print("You must pass all tests in a lecture before proceeding to the next.\n")
-    
-    lectures = [
-        ("Lecture 1: Basic Combinatorics", "lecture_01_combinatorics/test_exercise.py"),
-        ("Lecture 2: Hypergeometric Distribution", "lecture_02_hypergeometric/test_exercise.py"),
-        ("Lecture 3: Position Probability", "lecture_03_position_probability/test_exercise.py"),
-        ("Lecture 4: Exact Distribution", "lecture_04_exact_distribution/test_exercise.py"),
-    ]
-    
+
     for lecture_name, test_file in lectures:
-        if not os.path.exists(test_file):
-            print(f"ERROR: Test file not found: {test_file}")
-            return 1
-        
-        success = run_test(lecture_name, test_file)
-        
-        if not success:
+        print(f"\n{'=' * 60}")
+        print(f"Running tests for {lecture_name}")
+        print('=' * 60)
+        result = run_test(lecture_name, test_file, timeout)
+
+        if result["status"] != "PASSED":
             print(f"\n{'=' * 60}")
-            print(f"FAILED: {lecture_name}")
+            print(f"{result['status']}: {lecture_name}")
             print("=" * 60)
             print("Please fix the failing tests before proceeding to the next lecture.")
             return 1
-    
+
     print("\n" + "=" * 60)
     print("ALL LECTURES PASSED! 🎉")
     print("=" * 60)
     print("Congratulations! You've completed the full learning path!")
     print("Run 'python main.py' to compare with Monte Carlo results.")
     print("=" * 60)
-    
     return 0
 
+
+def run_parallel(lectures: list[tuple[str, str]], jobs: int, timeout: float | None) -> int:
+    """Run all lectures concurrently and print one aggregated report"""
+    print(f"\nRunning {len(lectures)} lectures in parallel...\n")
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=jobs) as pool:
+        # Each worker thread waits on one test process
+        results = list(pool.map(lambda lecture: run_test(*lecture, timeout, capture=True), lectures))
+    wall_time = time.perf_counter() - start
+
+    # Output of the lectures that didn't pass
+    for result in results:
+        if result["status"] != "PASSED":
+            print(f"{'=' * 60}")
+            print(f"{result['status']}: {result['lecture']}")
+            print('=' * 60)
+            print(result["output"])
+
+    print("=" * 60)
+    print("TEST SUMMARY")
+    print("=" * 60)
+    for result in results:
+        mark = "✓" if result["status"] == "PASSED" else "✗"
+        print(f"{result['lecture']:45s} {result['status']:8s} {mark} {result['seconds']:7.2f}s")
+    print("-" * 60)
+    print(f"Wall time: {wall_time:.2f}s (sum of lectures: {sum(r['seconds'] for r in results):.2f}s)")
+
+    failed = [result for result in results if result["status"] != "PASSED"]
+    print("=" * 60)
+    if failed:
+        print(f"{len(failed)} of {len(results)} LECTURES FAILED.")
+    else:
+        print("ALL LECTURES PASSED! 🎉")
+    print("=" * 60)
+    return 1 if failed else 0
+
+
+def _decode(output) -> str:
+    if output is None:
+        return ""
+    return output.decode(errors="replace") if isinstance(output, bytes) else output
+
+
+def main():
+    """Run all tests"""
+    parser = argparse.ArgumentParser(description="Run all lecture tests")
+    parser.add_argument("--parallel", action="store_true",
+                        help="Run all lectures concurrently instead of stopping at the first failure")
+    parser.add_argument("--jobs", type=int, default=os.cpu_count() or 1,
+                        help="Number of lectures run at the same time (default: number of CPUs)")
+    parser.add_argument("--timeout", type=float, default=DEFAULT_TIMEOUT,
+                        help="Seconds per lecture before its tests are stopped")
+    args = parser.parse_args()
+
+    print("=" * 60)
+    print("BOMBBUSTERS: Running All Lecture Tests")
+    print("=" * 60)
+
+    lectures = discover_lectures()
+    if not lectures:
+        print(f"ERROR: No lecture_*/test_exercise.py found in {ROOT}")
+        return 1
+
+    if args.parallel:
+        return run_parallel(lectures, args.jobs, args.timeout)
+    return run_sequential(lectures, args.timeout)
+
+
 if __name__ == "__main__":
     exit(main())
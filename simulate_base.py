@@ -7,15 +7,17 @@ Subclasses should override abstract methods to provide lecture-specific behavior
 
 import sys
 import os
+from concurrent.futures import ThreadPoolExecutor
 import matplotlib.pyplot as plt
-from matplotlib.widgets import Button, TextBox
-import numpy as np
+from matplotlib.widgets import Button
 from abc import ABC, abstractmethod
 
 # Add paths
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 from base import bombusters as bb_base
+from base.cache import distribution_cache
+from simulate_render import DistributionRenderer
 
 # Import default configuration
 try:
@@ -30,6 +32,60 @@ except ImportError:
     DEFAULT_AVAILABLE_NUMBERS = 4
     DEFAULT_NUMBER_INSTANCES = 4
 
+try:
+    from simulation_config import DISTRIBUTION_CACHE_PATH
+except ImportError:
+    DISTRIBUTION_CACHE_PATH = None
+
+# Exact distributions are deterministic, so keep them between runs if a cache file is configured
+if DISTRIBUTION_CACHE_PATH is not None:
+    distribution_cache.load(DISTRIBUTION_CACHE_PATH)
+
+
+class ButtonPool:
+    """
+    Row of selection buttons that is allocated once and then only relabelled.
+    
+    Buttons are created the first time that many are needed; afterwards show()
+    relabels them and hides the ones that aren't used, so switching views or
+    games never tears down matplotlib axes.
+    """
+    
+    def __init__(self, fig, bottom, left=0.1, step=0.08, width=0.07, height=0.03):
+        self.fig = fig
+        self.bottom = bottom
+        self.left = left
+        self.step = step
+        self.width = width
+        self.height = height
+        self.buttons = []
+        self._callback = None
+        
+    def show(self, labels, callback):
+        """Show one button per label; clicking button i calls callback(i)"""
+        self._callback = callback
+        while len(self.buttons) < len(labels):
+            i = len(self.buttons)
+            btn_ax = self.fig.add_axes([self.left + i*self.step, self.bottom, self.width, self.height])
+            btn = Button(btn_ax, '')
+            
+            def make_callback(idx):
+                def callback(event):
+                    if self._callback is not None:
+                        self._callback(idx)
+                return callback
+            
+            btn.on_clicked(make_callback(i))
+            self.buttons.append(btn)
+            
+        for i, btn in enumerate(self.buttons):
+            used = i < len(labels)
+            if used:
+                btn.label.set_text(labels[i])
+            # Hidden buttons don't react to clicks
+            btn.ax.set_visible(used)
+            btn.set_active(used)
+
 
 class GameSimulationBase(ABC):
     """Base class for game simulations"""
@@ -55,16 +111,37 @@ class GameSimulationBase(ABC):
         self.view_mode = 'position'  # 'number' shows number across positions, 'position' shows numbers at position
         self.view_mode_button = None
         
+        # Distributions are computed in the background right after dealing
+        self._executor = ThreadPoolExecutor(max_workers=1)
+        self._futures = {}  # player index -> Future of a {player index: distribution} dict
+        self._distributions = {}  # player index -> finished distribution of the current game
+        self._poll_timer = None
+        
     @abstractmethod
-    def get_distribution(self):
+    def get_distribution(self, player_idx=None):
         """
-        Get the distribution for the currently selected player.
+        Get the distribution for a player.
+        
+        Called from the background worker, so it should only read the game state and
+        return the result; the main thread stores it.
+        
+        Args:
+            player_idx: Player to compute the distribution for (selected player if None)
         
         Returns:
             list[list[float]]: Distribution matrix, or None if not available
         """
         pass
         
+    def get_distributions(self, players):
+        """
+        Get the distributions of several players as a {player index: distribution} dict.
+        
+        Called from the background worker like get_distribution. Subclasses can override it
+        to share work between the players.
+        """
+        return {player: self.get_distribution(player) for player in players}
+        
     @abstractmethod
     def get_info_text(self):
         """
@@ -107,8 +184,63 @@ class GameSimulationBase(ABC):
             self.number_instances
         )
         self.selected_player = 0  # Start with Player 0 (you)
+        self._start_precompute()
+        self.update_display()
+        
+    def _start_precompute(self):
+        """Queue every player's distribution on the background worker, selected player first"""
+        for future in self._futures.values():
+            future.cancel()
+        self._distributions = {}
+        selected = self.selected_player
+        others = [p for p in range(self.number_of_players) if p != selected]
+        # The selected player first, then all other players in one job
+        self._futures = {selected: self._executor.submit(self.get_distributions, [selected])}
+        if others:
+            rest = self._executor.submit(self.get_distributions, others)
+            self._futures.update({p: rest for p in others})
+        
+    def _selected_distribution(self):
+        """
+        Return the selected player's distribution if it is ready.
+        
+        Returns None while it is still being computed (and starts polling for it).
+        Finished worker results are stored here, on the main thread.
+        """
+        player = self.selected_player
+        if player not in self._distributions:
+            future = self._futures.get(player)
+            if future is None:
+                # Not queued (e.g. the game was set without sample_new_game)
+                future = self._executor.submit(self.get_distributions, [player])
+                self._futures[player] = future
+            if not future.done():
+                self._start_polling()
+                return None
+            self._distributions.update(future.result())
+        return self._distributions.get(player)
+        
+    def _start_polling(self):
+        """Check for the pending distribution on a canvas timer, so clicks never block"""
+        if self._poll_timer is not None or self.fig is None:
+            return
+        self._poll_timer = self.fig.canvas.new_timer(interval=50)
+        self._poll_timer.add_callback(self._poll_distribution)
+        self._poll_timer.start()
+        
+    def _poll_distribution(self):
+        """Timer callback: redraw once the selected player's distribution has arrived"""
+        future = self._futures.get(self.selected_player)
+        if future is not None and not future.done():
+            return
+        self._poll_timer.stop()
+        self._poll_timer = None
         self.update_display()
         
+    def _show_pending(self):
+        """Show a placeholder while the selected player's distribution is computed"""
+        self.renderer.show_message(f"Computing distribution for Player {self.selected_player}...")
+        
     def update_display(self):
         """Update the display with current game state and selected player's distribution"""
         if self.game is None:
@@ -118,220 +250,58 @@ class GameSimulationBase(ABC):
         if self.ax_overview is None or self.ax_detail is None:
             return
             
-        distribution = self.get_distribution()
+        distribution = self._selected_distribution()
         if distribution is None:
+            self._show_pending()
             return
             
-        # Clear axes
-        self.ax_overview.clear()
-        self.ax_detail.clear()
-        
-        # Store distribution early for admin info display
         self._current_distribution = distribution
+        self._selected_number = 0
+        self._selected_position = 0
         
-        # Overview plot (top) - line plot with all distributions
-        for n, probs in enumerate(distribution):
-            x = list(range(len(probs)))
-            self.ax_overview.plot(x, probs, marker='o', label=f'Number {n+1}', linewidth=2)
-        
-        # Title with "(you)" for Player 0
-        player_label = f"Player {self.selected_player} (you)" if self.selected_player == 0 else f"Player {self.selected_player}"
-        title = f"Overview - All Distributions for {player_label}"
-        if self.admin_view and self.selected_player != 0:
-            title += " [ADMIN VIEW]"
-        self.ax_overview.set_title(title, fontsize=14, fontweight='bold')
-        self.ax_overview.set_xlabel("Position")
-        self.ax_overview.set_ylabel("Probability")
-        self.ax_overview.set_ylim(0, 1)
-        self.ax_overview.legend()
-        self.ax_overview.grid(True, alpha=0.3)
+        # Artists are only created when the shape changes; otherwise their data is updated
+        max_positions = max(len(probs) for probs in distribution) if distribution else 0
+        self.renderer.configure(len(distribution), max_positions)
+        self._render()
         
-        # Show actual cables: always for Player 0, or when admin view is ON for other players
-        if self.selected_player == 0:
-            # Always show admin markers for Player 0 (you)
-            if self.game is not None:
-                self._show_admin_info()
-        elif self.admin_view:
-            # Show admin markers for other players only when admin view is ON
-            if self.game is not None:
-                self._show_admin_info()
-                self._show_all_players_info()
-        
-        # Detail plot (bottom) - depends on view mode
+        # Relabel/show/hide the pooled selection buttons when their layout changes
         if self.view_mode == 'number':
-            # Number view: show selected number across positions
-            selected_num = 0
-            probs = distribution[selected_num] if distribution else []
-            x = list(range(len(probs)))
-            bars = self.ax_detail.bar(x, probs, color='steelblue', edgecolor='black')
-            
-            # Add percentage labels
-            for i, p in enumerate(probs):
-                if p > 0.01:  # Only show if > 1%
-                    self.ax_detail.text(i, p, f'{100*p:.1f}%', 
-                                  ha='center', va='bottom', fontweight='bold')
-            
-            # Title with "(you)" for Player 0
-            player_label = f"Player {self.selected_player} (you)" if self.selected_player == 0 else f"Player {self.selected_player}"
-            detail_title = f"Number {selected_num+1} - Detailed View ({player_label})"
-            if self.admin_view and self.selected_player != 0:
-                detail_title += " [ADMIN VIEW]"
-            self.ax_detail.set_title(detail_title, fontsize=14, fontweight='bold')
-            self.ax_detail.set_xlabel("Position")
-            self.ax_detail.set_ylabel("Probability")
-            if probs:
-                self.ax_detail.set_ylim(0, max(probs) * 1.15)
-            self.ax_detail.set_xticks(x)
-            self.ax_detail.grid(True, alpha=0.3, axis='y')
-            
-            # Show actual cables in detail view: always for Player 0, or when admin view is ON
-            if self.selected_player == 0:
-                # Always show for Player 0
-                if self.game is not None:
-                    self._show_admin_detail(selected_num)
-            elif self.admin_view:
-                # Show for other players only when admin view is ON
-                if self.game is not None:
-                    self._show_admin_detail(selected_num)
-            
-            self._selected_number = selected_num
-            self._selected_position = 0  # Reset position selection
+            labels = [f'N{i+1}' for i in range(len(distribution))]
+            layout = (self.view_mode, labels, self.select_number)
         else:
-            # Position view: show all numbers at selected position
-            selected_pos = 0
-            max_positions = max(len(probs) for probs in distribution) if distribution else 0
-            if selected_pos < max_positions:
-                # Get probabilities for all numbers at this position
-                pos_probs = [dist[selected_pos] if selected_pos < len(dist) else 0.0 
-                            for dist in distribution]
-                x = np.arange(len(pos_probs))
-                bars = self.ax_detail.bar(x, pos_probs, color='steelblue', edgecolor='black')
-                
-                # Add percentage labels
-                for i, p in enumerate(pos_probs):
-                    if p > 0.01:  # Only show if > 1%
-                        self.ax_detail.text(i, p, f'{100*p:.1f}%', 
-                                      ha='center', va='bottom', fontweight='bold')
-                
-                # Title with "(you)" for Player 0
-                player_label = f"Player {self.selected_player} (you)" if self.selected_player == 0 else f"Player {self.selected_player}"
-                detail_title = f"Position {selected_pos} - Detailed View ({player_label})"
-                if self.admin_view and self.selected_player != 0:
-                    detail_title += " [ADMIN VIEW]"
-                self.ax_detail.set_title(detail_title, fontsize=14, fontweight='bold')
-                self.ax_detail.set_xlabel("Number")
-                self.ax_detail.set_ylabel("Probability")
-                if pos_probs:
-                    self.ax_detail.set_ylim(0, max(pos_probs) * 1.15)
-                self.ax_detail.set_xticks(x)
-                self.ax_detail.set_xticklabels([f"{i+1}" for i in range(len(pos_probs))])
-                self.ax_detail.grid(True, alpha=0.3, axis='y')
-                
-                # Show actual cable in detail view: always for Player 0, or when admin view is ON
-                if self.selected_player == 0:
-                    # Always show for Player 0
-                    if self.game is not None:
-                        self._show_admin_position_detail(selected_pos)
-                elif self.admin_view:
-                    # Show for other players only when admin view is ON
-                    if self.game is not None:
-                        self._show_admin_position_detail(selected_pos)
+            labels = [f'P{i}' for i in range(max_positions)]
+            layout = (self.view_mode, labels, self.select_position)
+        if layout[:2] != self._button_layout:
+            self._selection_buttons.show(labels, layout[2])
+            self._button_layout = layout[:2]
+            self.fig.canvas.draw_idle()
             
-            self._selected_position = selected_pos
-            self._selected_number = 0  # Reset number selection
-        
-        # Distribution already stored earlier for admin info
-        
-        # Create/update selection buttons based on view mode
-        # Clean up first to prevent conflicts
-        self._cleanup_all_buttons()
+    def _render(self):
+        """Draw the current distribution with the selected number/position"""
+        player = self.selected_player
+        # Title with "(you)" for Player 0
+        player_label = f"Player {player} (you)" if player == 0 else f"Player {player}"
+        suffix = " [ADMIN VIEW]" if self.admin_view and player != 0 else ""
         
         if self.view_mode == 'number':
-            self._create_number_buttons()
+            selected = self._selected_number
+            detail_title = f"Number {selected+1} - Detailed View ({player_label}){suffix}"
         else:
-            self._create_position_buttons()
-        
-        plt.draw()
-        
-    def _cleanup_all_buttons(self):
-        """Clean up all selection buttons to prevent conflicts"""
-        # Clean up number buttons
-        for btn in self._num_buttons:
-            try:
-                if hasattr(btn, 'disconnect_events'):
-                    btn.disconnect_events()
-                if hasattr(btn, 'ax') and btn.ax is not None:
-                    try:
-                        btn.ax.remove()
-                    except:
-                        pass
-            except:
-                pass
-        self._num_buttons = []
-        
-        # Clean up position buttons
-        for btn in self._pos_buttons:
-            try:
-                if hasattr(btn, 'disconnect_events'):
-                    btn.disconnect_events()
-                if hasattr(btn, 'ax') and btn.ax is not None:
-                    try:
-                        btn.ax.remove()
-                    except:
-                        pass
-            except:
-                pass
-        self._pos_buttons = []
-        
-        # Force a small pause to let matplotlib clean up
-        plt.pause(0.01)
-    
-    def _create_number_buttons(self):
-        """Create or update number selection buttons"""
-        # First clean up all buttons to prevent conflicts
-        self._cleanup_all_buttons()
+            selected = self._selected_position
+            detail_title = f"Position {selected} - Detailed View ({player_label}){suffix}"
         
-        if not hasattr(self, '_current_distribution') or not self._current_distribution:
-            return
-            
-        num_distributions = len(self._current_distribution)
-        
-        # Create buttons for each number
-        for i in range(num_distributions):
-            btn_ax = plt.axes([0.1 + i*0.08, 0.08, 0.07, 0.03])
-            num_btn = Button(btn_ax, f'N{i+1}')
-            self._num_buttons.append(num_btn)
-            
-            def make_num_callback(idx):
-                def callback(event):
-                    self.select_number(idx)
-                return callback
-            
-            num_btn.on_clicked(make_num_callback(i))
-    
-    def _create_position_buttons(self):
-        """Create or update position selection buttons"""
-        # First clean up all buttons to prevent conflicts
-        self._cleanup_all_buttons()
-        
-        if not hasattr(self, '_current_distribution') or not self._current_distribution:
-            return
-            
-        # Find max positions
-        max_positions = max(len(probs) for probs in self._current_distribution) if self._current_distribution else 0
-        
-        # Create buttons for each position
-        for i in range(max_positions):
-            btn_ax = plt.axes([0.1 + i*0.08, 0.08, 0.07, 0.03])
-            pos_btn = Button(btn_ax, f'P{i}')
-            self._pos_buttons.append(pos_btn)
-            
-            def make_pos_callback(idx):
-                def callback(event):
-                    self.select_position(idx)
-                return callback
-            
-            pos_btn.on_clicked(make_pos_callback(i))
+        # Show actual cables: always for Player 0, or when admin view is ON for other players
+        show_cables = player == 0 or self.admin_view
+        self.renderer.update(
+            self._current_distribution,
+            self.view_mode,
+            selected,
+            f"Overview - All Distributions for {player_label}{suffix}",
+            detail_title,
+            player=player,
+            cables=self.game[player] if show_cables and player < len(self.game) else None,
+            all_players_text=self._all_players_text() if self.admin_view and player != 0 else None
+        )
         
     def select_player(self, player_idx):
         """Select a player to view"""
@@ -351,41 +321,7 @@ class GameSimulationBase(ABC):
             return
             
         self._selected_number = num_idx
-        probs = self._current_distribution[num_idx]
-        x = list(range(len(probs)))
-        
-        self.ax_detail.clear()
-        self.ax_detail.bar(x, probs, color='steelblue', edgecolor='black')
-        
-        for i, p in enumerate(probs):
-            if p > 0.01:
-                self.ax_detail.text(i, p, f'{100*p:.1f}%', 
-                              ha='center', va='bottom', fontweight='bold')
-        
-        # Title with "(you)" for Player 0
-        player_label = f"Player {self.selected_player} (you)" if self.selected_player == 0 else f"Player {self.selected_player}"
-        detail_title = f"Number {num_idx+1} - Detailed View ({player_label})"
-        if self.admin_view and self.selected_player != 0:
-            detail_title += " [ADMIN VIEW]"
-        self.ax_detail.set_title(detail_title, fontsize=14, fontweight='bold')
-        self.ax_detail.set_xlabel("Position")
-        self.ax_detail.set_ylabel("Probability")
-        if probs:
-            self.ax_detail.set_ylim(0, max(probs) * 1.15)
-        self.ax_detail.set_xticks(x)
-        self.ax_detail.grid(True, alpha=0.3, axis='y')
-        
-        # Show actual cables in detail view: always for Player 0, or when admin view is ON
-        if self.selected_player == 0:
-            # Always show for Player 0
-            if self.game is not None:
-                self._show_admin_detail(num_idx)
-        elif self.admin_view:
-            # Show for other players only when admin view is ON
-            if self.game is not None:
-                self._show_admin_detail(num_idx)
-            
-        plt.draw()
+        self._render()
     
     def select_position(self, pos_idx):
         """Select a position to view in detail (position view mode)"""
@@ -400,211 +336,37 @@ class GameSimulationBase(ABC):
             return
             
         self._selected_position = pos_idx
+        self._render()
         
-        # Get probabilities for all numbers at this position
-        pos_probs = [dist[pos_idx] if pos_idx < len(dist) else 0.0 
-                    for dist in self._current_distribution]
-        x = np.arange(len(pos_probs))
-        
-        self.ax_detail.clear()
-        self.ax_detail.bar(x, pos_probs, color='steelblue', edgecolor='black')
-        
-        for i, p in enumerate(pos_probs):
-            if p > 0.01:
-                self.ax_detail.text(i, p, f'{100*p:.1f}%', 
-                              ha='center', va='bottom', fontweight='bold')
-        
-        # Title with "(you)" for Player 0
-        player_label = f"Player {self.selected_player} (you)" if self.selected_player == 0 else f"Player {self.selected_player}"
-        detail_title = f"Position {pos_idx} - Detailed View ({player_label})"
-        if self.admin_view and self.selected_player != 0:
-            detail_title += " [ADMIN VIEW]"
-        self.ax_detail.set_title(detail_title, fontsize=14, fontweight='bold')
-        self.ax_detail.set_xlabel("Number")
-        self.ax_detail.set_ylabel("Probability")
-        if pos_probs:
-            self.ax_detail.set_ylim(0, max(pos_probs) * 1.15)
-        self.ax_detail.set_xticks(x)
-        self.ax_detail.set_xticklabels([f"{i+1}" for i in range(len(pos_probs))])
-        self.ax_detail.grid(True, alpha=0.3, axis='y')
-        
-        # Show actual cable in detail view: always for Player 0, or when admin view is ON
-        if self.selected_player == 0:
-            # Always show for Player 0
-            if self.game is not None:
-                self._show_admin_position_detail(pos_idx)
-        elif self.admin_view:
-            # Show for other players only when admin view is ON
-            if self.game is not None:
-                self._show_admin_position_detail(pos_idx)
-            
-        plt.draw()
-        
-    def _show_admin_info(self):
-        """Show admin information in the overview plot"""
-        if self.game is None or self.selected_player >= len(self.game):
-            return
-            
-        player_cables = self.game[self.selected_player]
-        # Count occurrences of each number at each position
-        cable_counts = {}
-        for pos, cable in enumerate(player_cables):
-            if cable not in cable_counts:
-                cable_counts[cable] = []
-            cable_counts[cable].append(pos)
-        
-        # Add markers/annotations for actual cables
-        for num, positions in cable_counts.items():
-            num_idx = num - 1  # Convert to 0-indexed
-            if num_idx < len(self._current_distribution):
-                for pos in positions:
-                    # Find the probability at this position for this number
-                    if pos < len(self._current_distribution[num_idx]):
-                        prob = self._current_distribution[num_idx][pos]
-                        # Mark with a red star
-                        self.ax_overview.plot(pos, prob, 'r*', markersize=15, 
-                                            markeredgewidth=2, markeredgecolor='darkred',
-                                            zorder=10)
-                        # Add annotation - use "you" for Player 0
-                        if self.selected_player == 0:
-                            annotation_text = f'You\nhave {num}'
-                        else:
-                            annotation_text = f'P{self.selected_player}\nhas {num}'
-                        self.ax_overview.annotate(annotation_text,
-                                                xy=(pos, prob), xytext=(5, 5),
-                                                textcoords='offset points',
-                                                fontsize=9, color='darkred',
-                                                fontweight='bold',
-                                                bbox=dict(boxstyle='round,pad=0.3', 
-                                                         facecolor='yellow', alpha=0.7))
-        
-        # Add legend entry for admin markers
-        if self.selected_player == 0:
-            label_text = 'Your Actual Cables'
-        else:
-            label_text = 'Actual Cable (Admin)'
-        self.ax_overview.plot([], [], 'r*', markersize=15, markeredgewidth=2, 
-                            markeredgecolor='darkred', label=label_text)
-        self.ax_overview.legend()
-        
-    def _show_all_players_info(self):
-        """Show all players' cables as text in admin view"""
-        if self.game is None:
-            return
-            
-        # Create a text box showing all players' cables
+    def _all_players_text(self):
+        """Text box content listing all players' cables (admin view)"""
         info_text = "ADMIN VIEW - All Players' Cables:\n"
         info_text += "=" * 40 + "\n"
         for i, player_cables in enumerate(self.game):
             marker = ">>>" if i == self.selected_player else "   "
             info_text += f"{marker} Player {i}: {player_cables}\n"
         info_text += "=" * 40
-        
-        # Add text annotation in the top right corner
-        self.ax_overview.text(0.98, 0.98, info_text, 
-                             transform=self.ax_overview.transAxes,
-                             fontsize=9, family='monospace',
-                             verticalalignment='top',
-                             horizontalalignment='right',
-                             bbox=dict(boxstyle='round,pad=0.5', 
-                                     facecolor='lightyellow', 
-                                     alpha=0.9,
-                                     edgecolor='black',
-                                     linewidth=1.5))
-        
-    def _show_admin_detail(self, num_idx):
-        """Show admin information in the detail plot (number view)"""
-        if self.game is None or self.selected_player >= len(self.game):
-            return
-            
-        player_cables = self.game[self.selected_player]
-        target_num = num_idx + 1  # Convert to 1-indexed
-        
-        # Find positions where this number actually appears
-        actual_positions = [pos for pos, cable in enumerate(player_cables) if cable == target_num]
-        
-        if actual_positions:
-            probs = self._current_distribution[num_idx]
-            for pos in actual_positions:
-                if pos < len(probs):
-                    prob = probs[pos]
-                    # Mark with a red star
-                    self.ax_detail.plot(pos, prob, 'r*', markersize=20, 
-                                      markeredgewidth=2, markeredgecolor='darkred',
-                                      zorder=10)
-                    # Add annotation - use "YOU" for Player 0
-                    if self.selected_player == 0:
-                        annotation_text = f'YOU\nHAVE {target_num}'
-                    else:
-                        annotation_text = f'ACTUAL\n{target_num}'
-                    self.ax_detail.annotate(annotation_text,
-                                          xy=(pos, prob), xytext=(0, 10),
-                                          textcoords='offset points',
-                                          fontsize=10, color='darkred',
-                                          fontweight='bold',
-                                          ha='center',
-                                          bbox=dict(boxstyle='round,pad=0.3', 
-                                                   facecolor='yellow', alpha=0.8))
-    
-    def _show_admin_position_detail(self, pos_idx):
-        """Show admin information in the detail plot (position view)"""
-        if self.game is None or self.selected_player >= len(self.game):
-            return
-            
-        player_cables = self.game[self.selected_player]
-        if pos_idx >= len(player_cables):
-            return
-        
-        actual_number = player_cables[pos_idx]
-        num_idx = actual_number - 1  # Convert to 0-indexed
-        
-        if num_idx < len(self._current_distribution):
-            prob = self._current_distribution[num_idx][pos_idx] if pos_idx < len(self._current_distribution[num_idx]) else 0.0
-            
-            # Mark with a red star
-            self.ax_detail.plot(num_idx, prob, 'r*', markersize=20, 
-                              markeredgewidth=2, markeredgecolor='darkred',
-                              zorder=10)
-            # Add annotation - use "YOU" for Player 0
-            if self.selected_player == 0:
-                annotation_text = f'YOU\nHAVE {actual_number}'
-            else:
-                annotation_text = f'ACTUAL\n{actual_number}'
-            self.ax_detail.annotate(annotation_text,
-                                  xy=(num_idx, prob), xytext=(0, 10),
-                                  textcoords='offset points',
-                                  fontsize=10, color='darkred',
-                                  fontweight='bold',
-                                  ha='center',
-                                  bbox=dict(boxstyle='round,pad=0.3', 
-                                           facecolor='yellow', alpha=0.8))
+        return info_text
         
     def toggle_admin_view(self, event):
         """Toggle admin view on/off"""
-        # Clean up buttons first to prevent conflicts
-        self._cleanup_all_buttons()
-        
         self.admin_view = not self.admin_view
         if self.admin_button:
             self.admin_button.label.set_text('Admin: ON' if self.admin_view else 'Admin: OFF')
             self.admin_button.color = 'lightgreen' if self.admin_view else 'lightgray'
+            self.fig.canvas.draw_idle()
         
-        # Small delay to ensure cleanup is complete
-        plt.pause(0.05)
         self.update_display()
     
     def toggle_view_mode(self, event):
         """Toggle between number view and position view"""
-        # Clean up buttons first to prevent conflicts
-        self._cleanup_all_buttons()
-        
         self.view_mode = 'position' if self.view_mode == 'number' else 'number'
         if self.view_mode_button:
             mode_text = 'View: Position' if self.view_mode == 'position' else 'View: Number'
             self.view_mode_button.label.set_text(mode_text)
+            self.fig.canvas.draw_idle()
         
-        # Small delay to ensure cleanup is complete
-        plt.pause(0.05)
+        # The selection buttons are relabelled for the new view
         self.update_display()
         
     def show_parameter_dialog(self):
@@ -651,12 +413,17 @@ class GameSimulationBase(ABC):
         
     def create_ui(self):
         """Create the interactive UI"""
+        # A timer of a previous figure would never fire again
+        if self._poll_timer is not None:
+            self._poll_timer.stop()
+            self._poll_timer = None
         self.fig = plt.figure(figsize=(14, 8))
         self.fig.suptitle(self.get_window_title(), fontsize=14, fontweight='bold')
         
         # Create axes (matching the old visualization style)
         self.ax_overview = plt.subplot(2, 1, 1)
         self.ax_detail = plt.subplot(2, 1, 2)
+        self.renderer = DistributionRenderer(self.fig, self.ax_overview, self.ax_detail)
         
         # Create player selection buttons (including Player 0)
         button_axes = []
@@ -676,9 +443,9 @@ class GameSimulationBase(ABC):
             
             btn.on_clicked(make_callback(i))
         
-        # Number/position buttons will be created after first distribution is calculated
-        self._num_buttons = []
-        self._pos_buttons = []
+        # Number/position buttons are allocated once and relabelled after each distribution
+        self._selection_buttons = ButtonPool(self.fig, bottom=0.08)
+        self._button_layout = None  # (view mode, labels) of the shown selection buttons
         
         # Create view mode toggle button
         view_mode_ax = plt.axes([0.55, 0.02, 0.12, 0.04])
@@ -0,0 +1,257 @@
+"""
+Incremental renderer for the game simulations.
+
+DistributionRenderer creates every artist of the overview and detail plots
+once per configuration (number of numbers and positions). Later updates only
+change their data with set_data / set_height / set_text.
+
+All changing artists are animated. After a full draw the static part of the
+figure (axes, ticks, grid, legend) is cached, and an update that keeps it
+unchanged restores that background and blits only the animated artists.
+The detail plot's y-axis is animated as well, so rescaling it to the selected
+bars doesn't need a full draw. Switching players, numbers or positions only
+blits; a full redraw happens when the static part changes (the view mode or
+the legend).
+"""
+
+import numpy as np
+
+
+class DistributionRenderer:
+    """Overview and detail plots of one distribution, updated in place"""
+
+    def __init__(self, fig, ax_overview, ax_detail):
+        self.fig = fig
+        self.ax_overview = ax_overview
+        self.ax_detail = ax_detail
+        self.canvas = fig.canvas
+
+        self._shape = None        # (numbers, positions) the artists were created for
+        self._static = None       # State of the non-animated artists of the last full draw
+        self._background = None
+        self._animated = []
+        self.message = self._create_message()
+        self.canvas.mpl_connect('draw_event', self._on_draw)
+
+    def configure(self, numbers: int, positions: int):
+        """Create the artists for distributions with `numbers` rows and `positions` columns"""
+        if self._shape == (numbers, positions):
+            return
+        self._shape = (numbers, positions)
+        self._static = None
+
+        ov = self.ax_overview
+        ov.clear()
+        x = np.arange(positions)
+        self.lines = [ov.plot(x, np.zeros(positions), marker='o', label=f'Number {n+1}',
+                              linewidth=2, animated=True)[0]
+                      for n in range(numbers)]
+        self.overview_stars = ov.plot([], [], 'r*', markersize=15, markeredgewidth=2,
+                                      markeredgecolor='darkred', zorder=10, animated=True)[0]
+        self.overview_notes = [ov.annotate('', xy=(0, 0), xytext=(5, 5),
+                                           textcoords='offset points',
+                                           fontsize=9, color='darkred',
+                                           fontweight='bold',
+                                           bbox=dict(boxstyle='round,pad=0.3',
+                                                     facecolor='yellow', alpha=0.7),
+                                           animated=True, visible=False)
+                               for _ in range(positions)]
+        self.all_players_text = ov.text(0.98, 0.98, '',
+                                        transform=ov.transAxes,
+                                        fontsize=9, family='monospace',
+                                        verticalalignment='top',
+                                        horizontalalignment='right',
+                                        bbox=dict(boxstyle='round,pad=0.5',
+                                                  facecolor='lightyellow',
+                                                  alpha=0.9,
+                                                  edgecolor='black',
+                                                  linewidth=1.5),
+                                        animated=True, visible=False)
+        ov.set_title('', fontsize=14, fontweight='bold')
+        ov.title.set_animated(True)
+        ov.set_xlabel("Position")
+        ov.set_ylabel("Probability")
+        ov.set_xlim(-0.5, positions - 0.5)
+        ov.set_ylim(0, 1)
+        ov.grid(True, alpha=0.3)
+
+        dt = self.ax_detail
+        dt.clear()
+        self.number_bars = dt.bar(np.arange(positions), np.zeros(positions),
+                                  color='steelblue', edgecolor='black', animated=True)
+        self.position_bars = dt.bar(np.arange(numbers), np.zeros(numbers),
+                                    color='steelblue', edgecolor='black', animated=True)
+        self.bar_labels = [dt.text(0, 0, '', ha='center', va='bottom', fontweight='bold',
+                                   animated=True, visible=False)
+                           for _ in range(max(numbers, positions))]
+        self.detail_stars = dt.plot([], [], 'r*', markersize=20, markeredgewidth=2,
+                                    markeredgecolor='darkred', zorder=10, animated=True)[0]
+        self.detail_notes = [dt.annotate('', xy=(0, 0), xytext=(0, 10),
+                                         textcoords='offset points',
+                                         fontsize=10, color='darkred',
+                                         fontweight='bold',
+                                         ha='center',
+                                         bbox=dict(boxstyle='round,pad=0.3',
+                                                   facecolor='yellow', alpha=0.8),
+                                         animated=True, visible=False)
+                             for _ in range(positions)]
+        dt.set_title('', fontsize=14, fontweight='bold')
+        dt.title.set_animated(True)
+        dt.yaxis.set_animated(True)  # Rescaled with every update, grid lines included
+        dt.set_ylabel("Probability")
+        dt.grid(True, alpha=0.3, axis='y')
+
+        # clear() removed the message of the previous configuration
+        self.message = self._create_message()
+        self._animated = [dt.yaxis, ov.title, dt.title, *self.lines, self.overview_stars, *self.overview_notes,
+                          self.all_players_text, *self.number_bars, *self.position_bars,
+                          *self.bar_labels, self.detail_stars, *self.detail_notes, self.message]
+
+    def update(self, distribution, view_mode: str, selected: int, overview_title: str, detail_title: str,
+               player: int = 0, cables=None, all_players_text: str | None = None):
+        """
+        Show a distribution.
+
+        Args:
+            distribution: Matrix with distribution[n][pos] = P(number n+1 at position pos)
+            view_mode: 'number' (one number across positions) or 'position' (all numbers at one position)
+            selected: Selected number index or position for the detail plot
+            overview_title, detail_title: Plot titles
+            player: Shown player; player 0 is annotated as "you"
+            cables: The player's actual cables to mark, or None to hide the markers
+            all_players_text: Text box with every player's cables, or None to hide it
+        """
+        numbers, positions = self._shape
+        self.message.set_visible(False)
+
+        for line, probs in zip(self.lines, distribution):
+            line.set_data(np.arange(len(probs)), probs)
+            line.set_visible(True)
+        self.ax_overview.title.set_text(overview_title)
+        self.ax_overview.title.set_visible(True)
+
+        # Detail plot: bars for the selected number or position
+        if view_mode == 'number':
+            values = list(distribution[selected])
+            bars, hidden = self.number_bars, self.position_bars
+        else:
+            values = [probs[selected] if selected < len(probs) else 0.0 for probs in distribution]
+            bars, hidden = self.position_bars, self.number_bars
+        for i, bar in enumerate(bars):
+            bar.set_height(values[i] if i < len(values) else 0.0)
+            bar.set_visible(True)
+        for bar in hidden:
+            bar.set_visible(False)
+        for i, label in enumerate(self.bar_labels):
+            if i < len(values) and values[i] > 0.01:  # Only show if > 1%
+                label.set_position((i, values[i]))
+                label.set_text(f'{100*values[i]:.1f}%')
+                label.set_visible(True)
+            else:
+                label.set_visible(False)
+        self.ax_detail.title.set_text(detail_title)
+        self.ax_detail.title.set_visible(True)
+
+        # Markers for the actual cables
+        overview_points = []
+        detail_points = []
+        if cables is not None:
+            for pos, cable in enumerate(cables):
+                if cable - 1 < numbers and pos < len(distribution[cable - 1]):
+                    overview_points.append((pos, distribution[cable - 1][pos], cable))
+            if view_mode == 'number':
+                detail_points = [(pos, values[pos], cable) for pos, cable in enumerate(cables)
+                                 if cable == selected + 1 and pos < len(values)]
+            elif selected < len(cables) and cables[selected] - 1 < numbers:
+                cable = cables[selected]
+                detail_points = [(cable - 1, values[cable - 1], cable)]
+        if player == 0:
+            self._place_markers(self.overview_stars, self.overview_notes, overview_points, 'You\nhave {}')
+            self._place_markers(self.detail_stars, self.detail_notes, detail_points, 'YOU\nHAVE {}')
+        else:
+            self._place_markers(self.overview_stars, self.overview_notes, overview_points,
+                                f'P{player}\nhas {{}}')
+            self._place_markers(self.detail_stars, self.detail_notes, detail_points, 'ACTUAL\n{}')
+
+        self.all_players_text.set_text(all_players_text or '')
+        self.all_players_text.set_visible(all_players_text is not None)
+
+        self.ax_detail.set_ylim(0, max(max(values, default=0.0), 0.01) * 1.15)
+        self.ax_detail.yaxis.set_visible(True)
+
+        legend = None if cables is None else ('Your Actual Cables' if player == 0 else 'Actual Cable (Admin)')
+        static = (view_mode, legend)
+        if static != self._static:
+            self._static = static
+            self._apply_static(view_mode, legend)
+            self.canvas.draw_idle()
+        else:
+            self.blit()
+
+    def show_message(self, text: str):
+        """Hide the distribution and show a message (e.g. while it is being computed)"""
+        for artist in self._animated:
+            artist.set_visible(False)
+        self.message.set_text(text)
+        self.message.set_visible(True)
+        self.blit()
+
+    def blit(self):
+        """Redraw the animated artists on top of the cached background"""
+        if self._background is None or not self.canvas.supports_blit:
+            self.canvas.draw_idle()
+            return
+        self.canvas.restore_region(self._background)
+        self._draw_animated()
+        self.canvas.blit(self.fig.bbox)
+        self.canvas.flush_events()
+
+    def _apply_static(self, view_mode: str, legend: str | None):
+        """Update the non-animated parts: detail axes layout and the overview legend"""
+        numbers, positions = self._shape
+        dt = self.ax_detail
+        if view_mode == 'number':
+            dt.set_xlabel("Position")
+            dt.set_xticks(np.arange(positions), labels=[f"{i}" for i in range(positions)])
+            dt.set_xlim(-0.6, positions - 0.4)
+        else:
+            dt.set_xlabel("Number")
+            dt.set_xticks(np.arange(numbers), labels=[f"{i+1}" for i in range(numbers)])
+            dt.set_xlim(-0.6, numbers - 0.4)
+
+        handles = list(self.lines)
+        if legend is not None:
+            self.overview_stars.set_label(legend)
+            handles.append(self.overview_stars)
+        self.ax_overview.legend(handles=handles)
+
+    def _place_markers(self, stars, notes, points, label: str):
+        """Put star markers and annotations on (x, y, cable) points, hide unused annotations"""
+        stars.set_data([x for x, _, _ in points], [y for _, y, _ in points])
+        stars.set_visible(True)
+        for i, note in enumerate(notes):
+            if i < len(points):
+                x, y, cable = points[i]
+                note.xy = (x, y)
+                note.set_text(label.format(cable))
+                note.set_visible(True)
+            else:
+                note.set_visible(False)
+
+    def _create_message(self):
+        return self.ax_overview.text(0.5, 0.5, '', transform=self.ax_overview.transAxes,
+                                     ha='center', va='center', fontsize=14, color='gray',
+                                     animated=True, visible=False)
+
+    def _draw_animated(self):
+        for artist in self._animated:
+            self.fig.draw_artist(artist)
+        if self.message not in self._animated:
+            self.fig.draw_artist(self.message)
+
+    def _on_draw(self, event):
+        """After a full draw: cache the static background and draw the animated artists on it"""
+        if event is not None and event.canvas is not self.canvas:
+            return
+        self._background = self.canvas.copy_from_bbox(self.fig.bbox)
+        self._draw_animated()
@@ -12,3 +12,7 @@ DEFAULT_NUMBER_INSTANCES = 4
 
 # Monte Carlo sampling configuration
 DEFAULT_NUMBER_OF_SAMPLES = 100
+
+# Exact distribution cache configuration
+# Set to a file path (e.g. "distribution_cache.pkl") to keep exact distributions between runs
+DISTRIBUTION_CACHE_PATH = None